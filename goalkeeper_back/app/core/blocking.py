@@ -0,0 +1,18 @@
+# 핸들러 안의 무거운 non-DB 작업 (파일 쓰기/해시, 파일 삭제, 전체 정렬 등)
+# - 동기 스택: 핸들러가 이미 스레드풀에서 돌고 있으므로 그냥 호출
+# - 비동기 스택 (app/routers/aio.py): 핸들러가 AsyncSession.run_sync 안, 즉 이벤트 루프 스레드에서 돌고 있으므로
+#   스레드풀로 넘기고 끝날 때까지 기다림 (그동안 루프는 다른 요청 처리)
+# fn 안에서는 DB 세션을 쓰면 안 됨 (DB 작업은 호출하는 쪽에서)
+from typing import Callable, TypeVar
+
+from sqlalchemy.util import await_only
+from sqlalchemy.util.concurrency import in_greenlet
+from starlette.concurrency import run_in_threadpool
+
+T = TypeVar("T")
+
+
+def run_blocking(fn: Callable[..., T], *args, **kwargs) -> T:
+    if in_greenlet():
+        return await_only(run_in_threadpool(fn, *args, **kwargs))
+    return fn(*args, **kwargs)
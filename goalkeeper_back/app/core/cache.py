@@ -0,0 +1,51 @@
+# 메모리 캐시 (최대 개수 + 만료 시간이 있는 LRU)
+# 여러 스레드(동기 라우터 스레드풀)에서 같이 써도 되도록 lock 사용
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Optional
+
+
+class TTLCache:
+    def __init__(self, maxsize: int, ttl: Optional[float] = None):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[Hashable, tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    # 없거나 만료됐으면 None
+    def get(self, key: Hashable) -> Any:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+
+            expires_at, value = entry
+            if expires_at <= time.time():
+                del self._data[key]
+                return None
+
+            self._data.move_to_end(key)
+            return value
+
+    # expires_at(유닉스 시간)을 주면 그 시각에, 아니면 ttl 뒤에 만료
+    def set(self, key: Hashable, value: Any, expires_at: Optional[float] = None):
+        if expires_at is None:
+            expires_at = time.time() + self.ttl if self.ttl is not None else float("inf")
+
+        with self._lock:
+            self._data[key] = (expires_at, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def pop(self, key: Hashable):
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self):
+        return len(self._data)
@@ -7,12 +7,81 @@ load_dotenv()
 class Settings:
     # DB 접속 정보
     DB_URL = os.getenv("DB_URL")
+
+    # DB 커넥션 풀 (동시에 몰리는 요청 수에 맞춰 조절)
+    DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", 5))           # 항상 유지하는 커넥션 수
+    DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", 10))    # 몰릴 때 추가로 여는 커넥션 수
+    DB_POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", 30))  # 빈 커넥션을 기다리는 최대 시간(초)
+    DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", 3600))
+    DB_POOL_PRE_PING = os.getenv("DB_POOL_PRE_PING", "false").lower() in ("1", "true", "yes")
+    DB_ISOLATION_LEVEL = os.getenv("DB_ISOLATION_LEVEL")       # 예: READ COMMITTED (없으면 DB 기본값)
+
+    # 비동기 DB 스택 사용 여부 (true 면 라우터가 AsyncSession + 비동기 드라이버로 동작)
+    DB_ASYNC = os.getenv("DB_ASYNC", "false").lower() in ("1", "true", "yes")
+    # 비동기 접속 주소 (없으면 DB_URL 에서 드라이버만 바꿔서 사용: pymysql -> aiomysql)
+    DB_ASYNC_URL = os.getenv("DB_ASYNC_URL")
     
     # 보안 키
     SECRET_KEY = os.getenv("SECRET_KEY")
     ALGORITHM = os.getenv("ALGORITHM", "HS256")
     
     ACCESS_TOKEN_EXPIRE_MINUTES = 1440
+    AUTH_CACHE_SIZE = int(os.getenv("AUTH_CACHE_SIZE", 10000))  # 해석해 둔 토큰 최대 개수
+
+    # Idempotency-Key (구매/인증 재시도 시 처음 응답 재사용)
+    IDEMPOTENCY_CACHE_SIZE = int(os.getenv("IDEMPOTENCY_CACHE_SIZE", 10000))  # 메모리에 둘 최근 응답 수
+    IDEMPOTENCY_CACHE_TTL = int(os.getenv("IDEMPOTENCY_CACHE_TTL", 600))       # 메모리 보관 시간(초), 이후엔 DB 에서 조회
+    IDEMPOTENCY_KEY_TTL = int(os.getenv("IDEMPOTENCY_KEY_TTL", 24 * 3600))     # 키 유효 기간(초), 지나면 같은 키로 새 요청 처리
+    IDEMPOTENCY_PURGE_INTERVAL = int(os.getenv("IDEMPOTENCY_PURGE_INTERVAL", 3600))  # 지난 키 삭제 주기(초)
+
+    # 알림
+    NOTIFICATION_BLOCK_CACHE_SIZE = int(os.getenv("NOTIFICATION_BLOCK_CACHE_SIZE", 50000))  # 차단 설정을 메모리에 둘 유저 수
+    NOTIFICATION_BLOCK_CACHE_TTL = int(os.getenv("NOTIFICATION_BLOCK_CACHE_TTL", 300))      # 다른 서버에서 바꾼 차단 설정이 반영되는 최대 시간(초)
+    NOTIFICATION_MAX_RECEIVERS = int(os.getenv("NOTIFICATION_MAX_RECEIVERS", 100))          # 깨우기 한 번에 보낼 수 있는 최대 인원
+
+    # 실시간 이벤트 (SSE /events/stream)
+    PUBSUB_REDIS_URL = os.getenv("PUBSUB_REDIS_URL")                            # 있으면 Redis 로 워커끼리 이벤트 공유 (예: redis://localhost:6379/0)
+    PUBSUB_QUEUE_SIZE = int(os.getenv("PUBSUB_QUEUE_SIZE", 100))                # 연결마다 쌓아둘 최대 이벤트 수 (넘치면 resync)
+    PUBSUB_MAX_CONNECTIONS = int(os.getenv("PUBSUB_MAX_CONNECTIONS", 5000))     # 워커 하나가 받을 최대 연결 수
+    PUBSUB_HEARTBEAT = float(os.getenv("PUBSUB_HEARTBEAT", 15))                 # 이벤트가 없을 때 연결 유지용 ping 간격(초)
+
+    # 인기글 점수 (app/services/trending.py)
+    TRENDING_HALF_LIFE_HOURS = float(os.getenv("TRENDING_HALF_LIFE_HOURS", 12))   # 반응의 무게가 절반이 되는 시간
+    TRENDING_DECAY_INTERVAL = int(os.getenv("TRENDING_DECAY_INTERVAL", 600))      # 점수를 줄이는 주기(초)
+    TRENDING_EPSILON = float(os.getenv("TRENDING_EPSILON", 0.01))                 # 이보다 작아지면 0 으로
+
+    # 랭킹 (app/services/leaderboard.py)
+    LEADERBOARD_REBUILD_INTERVAL = int(os.getenv("LEADERBOARD_REBUILD_INTERVAL", 300))  # DB 기준 전체 재계산 주기(초)
+
+    # 외부 API 호출 (카카오 등)
+    HTTP_TIMEOUT = float(os.getenv("HTTP_TIMEOUT", 5))
+    HTTP_CONNECT_TIMEOUT = float(os.getenv("HTTP_CONNECT_TIMEOUT", 3))
+    HTTP_MAX_CONNECTIONS = int(os.getenv("HTTP_MAX_CONNECTIONS", 20))
+    HTTP_MAX_CONCURRENCY = int(os.getenv("HTTP_MAX_CONCURRENCY", 50))
+
+    # 카카오 로그인
+    KAKAO_API_BASE = os.getenv("KAKAO_API_BASE", "https://kapi.kakao.com")  # 로컬 목 서버로 바꿔서 테스트 가능
+    KAKAO_PROFILE_CACHE_TTL = int(os.getenv("KAKAO_PROFILE_CACHE_TTL", 300))  # 같은 토큰 재로그인 시 카카오 호출 생략(초)
+
+    # 구글 로그인
+    GOOGLE_CERTS_URL = os.getenv("GOOGLE_CERTS_URL", "https://www.googleapis.com/oauth2/v3/certs")
+    # 앱의 OAuth 클라이언트 ID (쉼표로 여러 개, 비워두면 aud 검사 생략)
+    GOOGLE_CLIENT_IDS = [cid.strip() for cid in os.getenv("GOOGLE_CLIENT_IDS", "").split(",") if cid.strip()]
+
+    # 게시글 사진 업로드
+    UPLOAD_DIR = os.getenv("UPLOAD_DIR", "uploads")
+    UPLOAD_MAX_BYTES = int(os.getenv("UPLOAD_MAX_BYTES", 10 * 1024 * 1024))  # 기본 10MB
+    UPLOAD_ORPHAN_GRACE = int(os.getenv("UPLOAD_ORPHAN_GRACE", 3600))  # 최근 (재)사용된 사진은 이 시간(초) 동안 지우지 않음
+    UPLOAD_SWEEP_INTERVAL = int(os.getenv("UPLOAD_SWEEP_INTERVAL", 3600))  # 안 쓰는 사진 정리 간격(초)
+
+    # 게시글 사진 변환 (썸네일/피드/원본 크기 버전)
+    IMAGE_VARIANT_FORMAT = os.getenv("IMAGE_VARIANT_FORMAT", "webp")  # webp 또는 jpeg
+    IMAGE_WORKERS = int(os.getenv("IMAGE_WORKERS", 2))
+
+    # 서버 내 주기 작업 (app/jobs/scheduler.py)
+    SCHEDULER_ENABLED = os.getenv("SCHEDULER_ENABLED", "true").lower() in ("1", "true", "yes")
+    STREAK_JOB_INTERVAL = int(os.getenv("STREAK_JOB_INTERVAL", 300))  # 시간대별 자정이 지났는지 확인하는 간격(초)
+    STREAK_JOB_CHUNK = int(os.getenv("STREAK_JOB_CHUNK", 5000))       # 한 번에(한 트랜잭션에) 처리할 유저 id 구간 크기
 
 
 settings = Settings()
\ No newline at end of file
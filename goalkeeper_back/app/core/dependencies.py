@@ -1,30 +1,62 @@
+from typing import Optional
+
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from jose import JWTError, jwt
+from app.core.cache import TTLCache
 from app.core.config import settings
 
 # 토큰 입력창
 security = HTTPBearer()
+# 로그인 선택(눈팅 가능) API 용: 토큰이 없어도 에러 없이 None
+optional_security = HTTPBearer(auto_error=False)
+
+# 해석이 끝난 토큰 -> 유저 정보 (토큰의 exp 시각에 만료)
+# 같은 토큰으로 계속 요청이 오므로 매번 서명 검증을 다시 하지 않음
+_claims_cache = TTLCache(maxsize=settings.AUTH_CACHE_SIZE)
+
+
+# 토큰 해석 (잘못됐거나 만료된 토큰이면 None)
+def decode_access_token(token: str) -> Optional[dict]:
+    claims = _claims_cache.get(token)
+    if claims is not None:
+        return claims
 
-def get_current_user_info(credentials: HTTPAuthorizationCredentials = Depends(security)):
-    token = credentials.credentials 
-    
-    credentials_exception = HTTPException(
-        status_code=status.HTTP_401_UNAUTHORIZED,
-        detail="Could not validate credentials",
-        headers={"WWW-Authenticate": "Bearer"},
-    )
     try:
-        # 토큰 해석
         payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
-        
-        user_id: str = payload.get("sub")
-        username: str = payload.get("username")
-
-        if user_id is None:
-            raise credentials_exception
-            
-        return {"sub": user_id, "username": username}
-        
     except JWTError:
-        raise credentials_exception
\ No newline at end of file
+        return None
+
+    user_id: str = payload.get("sub")
+    username: str = payload.get("username")
+    if user_id is None:
+        return None
+
+    claims = {"sub": user_id, "username": username}
+    exp = payload.get("exp")
+    _claims_cache.set(token, claims, expires_at=float(exp) if exp is not None else None)
+    return claims
+
+
+def get_current_user_info(credentials: HTTPAuthorizationCredentials = Depends(security)):
+    claims = decode_access_token(credentials.credentials)
+
+    if claims is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Could not validate credentials",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
+    return dict(claims)
+
+
+# 로그인 선택 API 용: 토큰이 없거나 만료/위조됐으면 로그인 안 한 사람 취급 (None)
+def get_optional_user_info(
+    credentials: Optional[HTTPAuthorizationCredentials] = Depends(optional_security),
+) -> Optional[dict]:
+    if credentials is None:
+        return None
+
+    claims = decode_access_token(credentials.credentials)
+    return dict(claims) if claims is not None else None
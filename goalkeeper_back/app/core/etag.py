@@ -0,0 +1,60 @@
+# ETag / If-None-Match 처리
+# 유저별 데이터 버전(users.data_version)을 목표/마스코트/액세서리/프로필을 바꾸는 라우터에서 +1 하고,
+# 조회 라우터는 이 버전으로 ETag 를 만들어서 바뀐 게 없으면 본문 없이 304 를 돌려줌
+from typing import Optional
+
+from fastapi import Request, Response
+from sqlalchemy import select, update
+from sqlalchemy.orm import Session
+
+from app import models
+
+# 브라우저/앱이 캐시는 하되 쓰기 전에 항상 ETag 로 재검증하도록
+PRIVATE_REVALIDATE = "private, no-cache"
+
+
+# 유저 데이터가 바뀌었음을 표시 (commit 은 호출한 쪽에서)
+def bump_user_version(db: Session, user_id: int):
+    db.execute(
+        update(models.User)
+        .where(models.User.id == user_id)
+        .values(data_version=models.User.data_version + 1)
+    )
+
+
+def get_user_version(db: Session, user_id: int) -> Optional[int]:
+    return db.execute(
+        select(models.User.data_version).where(models.User.id == user_id)
+    ).scalar_one_or_none()
+
+
+def make_etag(*parts) -> str:
+    return 'W/"' + "-".join(str(part) for part in parts) + '"'
+
+
+# 요청의 If-None-Match 가 etag 와 같으면 304 응답, 아니면 response 에 ETag 를 달고 None
+def check_not_modified(request: Request, response: Response, etag: str) -> Optional[Response]:
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match:
+        candidates = [tag.strip() for tag in if_none_match.split(",")]
+        if etag in candidates or "*" in candidates:
+            return Response(
+                status_code=304,
+                headers={"ETag": etag, "Cache-Control": PRIVATE_REVALIDATE},
+            )
+
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = PRIVATE_REVALIDATE
+    return None
+
+
+# 유저 데이터 기반 조회 라우터용: 버전 조회(PK 1번) 후 304 여부 판단
+def check_user_not_modified(
+    request: Request,
+    response: Response,
+    db: Session,
+    user_id: int,
+    resource: str,
+) -> Optional[Response]:
+    version = get_user_version(db, user_id)
+    return check_not_modified(request, response, make_etag(resource, user_id, version))
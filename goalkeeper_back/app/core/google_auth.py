@@ -0,0 +1,114 @@
+# 구글 ID 토큰 검증 (이벤트 루프를 막지 않는 버전)
+# - 구글 서명 키(JWKS)는 공용 HTTP 클라이언트로 받아서 Cache-Control max-age 동안 메모리에 보관
+# - 만료 전에 백그라운드에서 미리 갱신하고, 서명 검증은 로컬에서 처리
+# - 모르는 kid 가 오면(구글이 키를 교체한 직후) 그때만 즉시 다시 받음
+#   (단, MIN_REFRESH_INTERVAL 에 한 번까지 -> 아무 kid 나 넣은 토큰으로 매 요청 구글을 부르게 만들 수 없음)
+# - 키를 못 받거나(구글 장애) 응답이 이상하면 ValueError (잘못된 토큰과 같은 취급)
+import asyncio
+import re
+import time
+from typing import Dict, List, Optional
+
+import httpx
+from jose import JWTError, jwt
+
+from app.core.config import settings
+from app.core.http import http_request
+
+GOOGLE_ISSUERS = ("accounts.google.com", "https://accounts.google.com")
+DEFAULT_MAX_AGE = 3600
+REFRESH_MARGIN = 300  # 만료 5분 전에 미리 갱신
+RETRY_DELAY = 60
+MIN_REFRESH_INTERVAL = 30  # 요청 중에 키를 다시 받는 최소 간격(초)
+
+
+def _parse_max_age(cache_control: Optional[str]) -> int:
+    match = re.search(r"max-age=(\d+)", cache_control or "")
+    return int(match.group(1)) if match else DEFAULT_MAX_AGE
+
+
+class GoogleTokenVerifier:
+    def __init__(self, certs_url: str, audiences: List[str]):
+        self.certs_url = certs_url
+        self.audiences = audiences
+        self._keys: Dict[str, dict] = {}
+        self._expires_at = 0.0
+        self._last_refresh_at = 0.0
+        self._lock = asyncio.Lock()
+        self._refresh_task: Optional[asyncio.Task] = None
+
+    # 구글 서명 키 다시 받기 (잠금은 호출한 쪽에서)
+    async def _fetch(self):
+        self._last_refresh_at = time.time()
+        try:
+            res = await http_request("GET", self.certs_url)
+            res.raise_for_status()
+            keys = {key["kid"]: key for key in res.json()["keys"]}
+        except (httpx.HTTPError, KeyError, TypeError, ValueError) as e:
+            raise ValueError(f"구글 서명 키를 받지 못했습니다: {e}")
+        self._keys = keys
+        self._expires_at = time.time() + _parse_max_age(res.headers.get("cache-control"))
+
+    async def refresh(self):
+        async with self._lock:
+            await self._fetch()
+
+    async def _refresh_loop(self):
+        while True:
+            try:
+                await self.refresh()
+                delay = max(self._expires_at - time.time() - REFRESH_MARGIN, RETRY_DELAY)
+            except Exception as e:
+                print(f"⚠️ 구글 서명 키 갱신 실패 ({RETRY_DELAY}초 뒤 재시도): {e}")
+                delay = RETRY_DELAY
+            await asyncio.sleep(delay)
+
+    # 서버 시작 시 (main.py lifespan)
+    def start(self):
+        if self._refresh_task is None:
+            self._refresh_task = asyncio.create_task(self._refresh_loop())
+
+    async def stop(self):
+        if self._refresh_task is not None:
+            self._refresh_task.cancel()
+            self._refresh_task = None
+
+    def _is_fresh(self, kid: Optional[str]) -> bool:
+        return kid in self._keys and time.time() < self._expires_at
+
+    async def _get_key(self, kid: Optional[str]) -> dict:
+        if not self._is_fresh(kid):
+            async with self._lock:
+                # 기다리는 동안 다른 요청이 이미 받아왔을 수 있음
+                if not self._is_fresh(kid) and time.time() - self._last_refresh_at >= MIN_REFRESH_INTERVAL:
+                    await self._fetch()
+
+        # 갱신 간격 안이면 가지고 있는 키(만료됐더라도)로 검증
+        key = self._keys.get(kid)
+        if key is None:
+            raise ValueError("알 수 없는 서명 키입니다.")
+        return key
+
+    # 검증된 토큰의 내용(sub, email, name ...)을 돌려줌. 잘못된 토큰이면 ValueError
+    async def verify(self, token: str) -> dict:
+        try:
+            kid = jwt.get_unverified_header(token).get("kid")
+            key = await self._get_key(kid)
+            claims = jwt.decode(
+                token,
+                key,
+                algorithms=["RS256"],
+                audience=self.audiences[0] if len(self.audiences) == 1 else None,
+                options={"verify_aud": len(self.audiences) == 1, "verify_at_hash": False},
+            )
+        except JWTError as e:
+            raise ValueError(str(e))
+
+        if claims.get("iss") not in GOOGLE_ISSUERS:
+            raise ValueError("구글이 발급한 토큰이 아닙니다.")
+        if len(self.audiences) > 1 and claims.get("aud") not in self.audiences:
+            raise ValueError("이 앱용 토큰이 아닙니다.")
+        return claims
+
+
+google_verifier = GoogleTokenVerifier(settings.GOOGLE_CERTS_URL, settings.GOOGLE_CLIENT_IDS)
@@ -0,0 +1,57 @@
+# 외부 API 호출용 공용 HTTP 클라이언트 (서버가 떠 있는 동안 하나만 사용)
+# 요청마다 클라이언트를 새로 만들면 매번 TCP + TLS 연결을 새로 맺으므로 keep-alive 로 재사용
+import asyncio
+from importlib.util import find_spec
+from typing import Optional
+
+import httpx
+
+from app.core.config import settings
+
+_client: Optional[httpx.AsyncClient] = None
+_semaphore: Optional[asyncio.Semaphore] = None
+
+
+def _create_client() -> httpx.AsyncClient:
+    return httpx.AsyncClient(
+        http2=find_spec("h2") is not None,  # httpx[http2] 가 설치돼 있으면 HTTP/2 사용
+        timeout=httpx.Timeout(settings.HTTP_TIMEOUT, connect=settings.HTTP_CONNECT_TIMEOUT),
+        limits=httpx.Limits(
+            max_connections=settings.HTTP_MAX_CONNECTIONS,
+            max_keepalive_connections=settings.HTTP_MAX_CONNECTIONS,
+            keepalive_expiry=60,
+        ),
+    )
+
+
+# 서버 시작 시 (main.py lifespan)
+async def start_http_client():
+    global _client, _semaphore
+    if _client is None:
+        _client = _create_client()
+    _semaphore = asyncio.Semaphore(settings.HTTP_MAX_CONCURRENCY)
+
+
+# 서버 종료 시
+async def close_http_client():
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    global _client
+    if _client is None:
+        _client = _create_client()
+    return _client
+
+
+# 동시에 나가는 외부 요청 수를 제한해서 호출
+async def http_request(method: str, url: str, **kwargs) -> httpx.Response:
+    global _semaphore
+    if _semaphore is None:
+        _semaphore = asyncio.Semaphore(settings.HTTP_MAX_CONCURRENCY)
+
+    async with _semaphore:
+        return await get_http_client().request(method, url, **kwargs)
@@ -0,0 +1,124 @@
+# Idempotency-Key 처리 (구매/인증처럼 재시도되면 안 되는 POST 용)
+# - 앱이 네트워크 문제로 같은 요청을 다시 보내면, 처음 응답을 그대로 돌려주고 비즈니스 테이블은 건드리지 않음
+# - 저장소: idempotency_key 테이블 + 메모리 LRU (같은 키 재시도는 보통 몇 초 안에 오므로 대부분 메모리에서 끝남)
+# - 응답 기록은 비즈니스 쓰기와 같은 트랜잭션에서 커밋 -> "돈은 빠졌는데 기록이 없음" 같은 상태가 없음
+# - 처리 전에 키 행을 먼저 INSERT(claim) -> 같은 키 재시도가 동시에 들어오면 뒤의 요청은 앞의 트랜잭션이
+#   끝날 때까지 기다렸다가 그 응답을 돌려받음 (앞의 요청이 실패해 롤백되면 뒤의 요청이 새로 처리)
+# - 키는 IDEMPOTENCY_KEY_TTL 동안만 유효 (지난 키는 없는 것으로 보고, 주기 작업 purge_expired_keys 가 삭제)
+# 헤더가 없으면 아무것도 하지 않음 (기존 클라이언트 그대로 동작)
+import json
+from datetime import timedelta
+from typing import Optional
+
+from fastapi import Depends, Header, HTTPException, Request
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from app import models
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.core.dependencies import get_current_user_info
+from app.core.timeutil import utcnow
+
+# (user_id, 키) -> (scope, 응답) - 키 유효 기간보다 오래 들고 있지 않도록
+_response_cache = TTLCache(
+    maxsize=settings.IDEMPOTENCY_CACHE_SIZE,
+    ttl=min(settings.IDEMPOTENCY_CACHE_TTL, settings.IDEMPOTENCY_KEY_TTL),
+)
+
+
+def _expired_before():
+    return utcnow() - timedelta(seconds=settings.IDEMPOTENCY_KEY_TTL)
+
+
+def _is_expired(record: models.IdempotencyKey) -> bool:
+    return record.created_at is not None and record.created_at.replace(tzinfo=None) < _expired_before()
+
+
+class Idempotency:
+    def __init__(self, user_id: int, key: Optional[str], scope: str):
+        self.user_id = user_id
+        self.key = key
+        self.scope = scope  # 예: "POST /mascots/3/buy" (다른 요청에 같은 키를 쓰면 거절)
+        self._record: Optional[models.IdempotencyKey] = None  # claim 으로 선점한 행
+        self._stale: Optional[models.IdempotencyKey] = None  # 유효 기간이 지났는데 아직 안 지워진 행
+
+    # 같은 키로 이미 처리된 요청이면 그때 응답, 아니면 None
+    def replay(self, db: Session) -> Optional[dict]:
+        if not self.key:
+            return None
+
+        cached = _response_cache.get((self.user_id, self.key))
+        if cached is None:
+            record = db.get(models.IdempotencyKey, (self.user_id, self.key))
+            if record is None:
+                return None
+            if _is_expired(record):
+                self._stale = record
+                return None
+            cached = (record.scope, json.loads(record.response_body))
+            _response_cache.set((self.user_id, self.key), cached)
+
+        scope, body = cached
+        if scope != self.scope:
+            raise HTTPException(status_code=422, detail="다른 요청에 이미 사용된 Idempotency-Key 입니다.")
+        return body
+
+    # 이미 처리된 요청이면 그때 응답, 아니면 키를 선점하고 None (선점은 비즈니스 행을 잠그기 전에)
+    # 같은 키로 처리 중인 요청이 있으면 INSERT 가 그 트랜잭션이 끝날 때까지 기다림
+    def claim(self, db: Session) -> Optional[dict]:
+        if not self.key:
+            return None
+
+        replayed = self.replay(db)
+        if replayed is not None:
+            return replayed
+
+        # 유효 기간이 지난 키가 아직 안 지워졌으면 지우고 새로 선점
+        if self._stale is not None:
+            db.delete(self._stale)
+            db.flush()
+            self._stale = None
+
+        self._record = models.IdempotencyKey(
+            user_id=self.user_id, key=self.key, scope=self.scope, response_body="", created_at=utcnow()
+        )
+        db.add(self._record)
+        try:
+            db.flush()
+        except IntegrityError:
+            db.rollback()
+            replayed = self.replay(db)
+            if replayed is None:
+                raise
+            return replayed
+        return None
+
+    # 응답 기록 + 커밋 (claim 으로 선점한 행에 응답을 채움)
+    def commit(self, db: Session, body: dict) -> dict:
+        if not self.key:
+            db.commit()
+            return body
+
+        self._record.response_body = json.dumps(body, ensure_ascii=False, default=str)
+        db.commit()
+
+        _response_cache.set((self.user_id, self.key), (self.scope, body))
+        return body
+
+
+# 유효 기간이 지난 키 삭제 (주기 작업) -> 지운 행 수
+def purge_expired_keys(db: Session) -> int:
+    deleted = db.query(models.IdempotencyKey).filter(
+        models.IdempotencyKey.created_at < _expired_before()
+    ).delete(synchronize_session=False)
+    db.commit()
+    return deleted
+
+
+def get_idempotency(
+    request: Request,
+    idempotency_key: Optional[str] = Header(None, alias="Idempotency-Key", max_length=64),
+    current_user: dict = Depends(get_current_user_info),
+) -> Idempotency:
+    return Idempotency(int(current_user["sub"]), idempotency_key, f"{request.method} {request.url.path}")
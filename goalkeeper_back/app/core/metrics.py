@@ -0,0 +1,93 @@
+# 서버 내부 지표 (Prometheus 텍스트 형식으로 /metrics 에서 노출)
+# 지금은 DB 커넥션 풀 지표만: 체크아웃/체크인 횟수, 대기 시간, 타임아웃, 사용 중인 커넥션 수
+import threading
+import time
+
+from sqlalchemy import event
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import QueuePool
+
+# 커넥션 대기 시간 구간(초)
+WAIT_BUCKETS = (0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 10.0, 30.0)
+
+
+class PoolMetrics:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.connects = 0
+        self.checkouts = 0
+        self.checkins = 0
+        self.timeouts = 0
+        self.wait_count = 0
+        self.wait_sum = 0.0
+        self.wait_buckets = [0] * len(WAIT_BUCKETS)
+
+    def observe_wait(self, seconds: float):
+        with self._lock:
+            self.wait_count += 1
+            self.wait_sum += seconds
+            for i, bound in enumerate(WAIT_BUCKETS):
+                if seconds <= bound:
+                    self.wait_buckets[i] += 1
+
+    def inc(self, name: str):
+        with self._lock:
+            setattr(self, name, getattr(self, name) + 1)
+
+
+pool_metrics = PoolMetrics()
+
+
+# 커넥션을 얻기까지 걸린 시간(대기 시간)과 타임아웃을 기록하는 QueuePool
+class InstrumentedQueuePool(QueuePool):
+    def connect(self):
+        start = time.perf_counter()
+        try:
+            return super().connect()
+        except PoolTimeoutError:
+            pool_metrics.inc("timeouts")
+            raise
+        finally:
+            pool_metrics.observe_wait(time.perf_counter() - start)
+
+
+# 엔진에 체크아웃/체크인 이벤트 연결
+def instrument_engine(engine):
+    event.listen(engine, "connect", lambda *args: pool_metrics.inc("connects"))
+    event.listen(engine, "checkout", lambda *args: pool_metrics.inc("checkouts"))
+    event.listen(engine, "checkin", lambda *args: pool_metrics.inc("checkins"))
+
+
+def render_metrics(engine) -> str:
+    pool = engine.pool
+    m = pool_metrics
+    lines = [
+        "# TYPE db_pool_connects_total counter",
+        f"db_pool_connects_total {m.connects}",
+        "# TYPE db_pool_checkouts_total counter",
+        f"db_pool_checkouts_total {m.checkouts}",
+        "# TYPE db_pool_checkins_total counter",
+        f"db_pool_checkins_total {m.checkins}",
+        "# TYPE db_pool_timeouts_total counter",
+        f"db_pool_timeouts_total {m.timeouts}",
+    ]
+
+    if isinstance(pool, QueuePool):
+        lines += [
+            "# TYPE db_pool_size gauge",
+            f"db_pool_size {pool.size()}",
+            "# TYPE db_pool_checked_out gauge",
+            f"db_pool_checked_out {pool.checkedout()}",
+            "# TYPE db_pool_overflow gauge",
+            f"db_pool_overflow {pool.overflow()}",
+        ]
+
+    lines.append("# TYPE db_pool_wait_seconds histogram")
+    for bound, count in zip(WAIT_BUCKETS, m.wait_buckets):
+        lines.append(f'db_pool_wait_seconds_bucket{{le="{bound}"}} {count}')
+    lines += [
+        f'db_pool_wait_seconds_bucket{{le="+Inf"}} {m.wait_count}',
+        f"db_pool_wait_seconds_sum {m.wait_sum:.6f}",
+        f"db_pool_wait_seconds_count {m.wait_count}",
+    ]
+    return "\n".join(lines) + "\n"
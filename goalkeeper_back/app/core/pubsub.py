@@ -0,0 +1,176 @@
+# 서버 -> 앱 실시간 이벤트 (SSE /events/stream 용 pub/sub)
+# - 허브: 연결마다 크기가 정해진 큐. 큐가 꽉 차면(앱이 못 따라옴) 쌓인 이벤트를 버리고 "resync" 하나만 남김
+#         -> 느린 연결 하나 때문에 서버 메모리가 늘어나지 않고, 앱은 resync 를 받으면 목록을 다시 조회
+# - 브로커: 이벤트를 허브까지 전달하는 통로
+#     InProcessBroker - 이 프로세스 안에서만 전달 (uvicorn 워커 1개일 때)
+#     RedisBroker     - PUBSUB_REDIS_URL 이 있으면 Redis PUBLISH/SUBSCRIBE 로 모든 워커에 전달
+#                       (로컬에서는 redis-server 하나 띄워서 워커 여러 개 테스트 가능, redis 패키지 필요)
+# - publish 는 동기 라우터(스레드풀)에서도 부를 수 있음 (이벤트 루프로 넘겨서 처리)
+# - 커밋이 끝난 뒤에 publish 할 것 (롤백된 변경이 나가지 않도록)
+import asyncio
+import json
+import logging
+from typing import Iterable, Optional
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+RESYNC_EVENT = {"type": "resync"}
+
+
+class Subscription:
+    def __init__(self, topics: Iterable[str], maxsize: int):
+        self.topics = frozenset(topics)
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=maxsize)
+
+    # 이벤트 루프 스레드에서만 호출
+    def push(self, event: dict):
+        try:
+            self.queue.put_nowait(event)
+        except asyncio.QueueFull:
+            while not self.queue.empty():
+                self.queue.get_nowait()
+            self.queue.put_nowait(RESYNC_EVENT)
+
+    async def get(self) -> dict:
+        return await self.queue.get()
+
+
+class Hub:
+    def __init__(self):
+        self._subscriptions: dict[str, set[Subscription]] = {}
+        self._count = 0
+
+    def subscribe(self, topics: Iterable[str]) -> Optional[Subscription]:
+        if self._count >= settings.PUBSUB_MAX_CONNECTIONS:
+            return None
+
+        subscription = Subscription(topics, settings.PUBSUB_QUEUE_SIZE)
+        for topic in subscription.topics:
+            self._subscriptions.setdefault(topic, set()).add(subscription)
+        self._count += 1
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription):
+        for topic in subscription.topics:
+            subscribers = self._subscriptions.get(topic)
+            if subscribers is not None:
+                subscribers.discard(subscription)
+                if not subscribers:
+                    del self._subscriptions[topic]
+        self._count -= 1
+
+    def deliver(self, topic: str, event: dict):
+        for subscription in tuple(self._subscriptions.get(topic, ())):
+            subscription.push(event)
+
+    def __len__(self):
+        return self._count
+
+
+class InProcessBroker:
+    def __init__(self, hub: Hub):
+        self.hub = hub
+
+    async def start(self):
+        pass
+
+    async def stop(self):
+        pass
+
+    async def publish(self, topic: str, event: dict):
+        self.hub.deliver(topic, event)
+
+
+class RedisBroker:
+    def __init__(self, hub: Hub, url: str, prefix: str = "goalkeeper:"):
+        self.hub = hub
+        self.url = url
+        self.prefix = prefix
+        self._redis = None
+        self._task: Optional[asyncio.Task] = None
+
+    async def start(self):
+        try:
+            import redis.asyncio as aioredis
+        except ImportError:
+            raise RuntimeError("PUBSUB_REDIS_URL 을 쓰려면 redis 패키지가 필요합니다. (pip install redis)")
+
+        self._redis = aioredis.from_url(self.url)
+        self._task = asyncio.create_task(self._listen())
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+        if self._redis is not None:
+            await self._redis.aclose()
+            self._redis = None
+
+    # 모든 워커가 같은 채널을 구독 -> 받은 이벤트를 자기 허브에 전달
+    async def _listen(self):
+        while True:
+            try:
+                pubsub = self._redis.pubsub()
+                await pubsub.psubscribe(f"{self.prefix}*")
+                async for message in pubsub.listen():
+                    if message["type"] != "pmessage":
+                        continue
+                    topic = message["channel"].decode()[len(self.prefix):]
+                    self.hub.deliver(topic, json.loads(message["data"]))
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("Redis 구독 끊김, 다시 연결합니다.")
+                await asyncio.sleep(1)
+
+    async def publish(self, topic: str, event: dict):
+        await self._redis.publish(f"{self.prefix}{topic}", json.dumps(event, ensure_ascii=False))
+
+
+class PubSub:
+    def __init__(self):
+        self.hub = Hub()
+        self.broker = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    # 서버 시작 시 (main.py lifespan)
+    async def start(self):
+        if settings.PUBSUB_REDIS_URL:
+            self.broker = RedisBroker(self.hub, settings.PUBSUB_REDIS_URL)
+        else:
+            self.broker = InProcessBroker(self.hub)
+        await self.broker.start()
+        self._loop = asyncio.get_running_loop()
+
+    # 서버 종료 시
+    async def stop(self):
+        self._loop = None
+        if self.broker is not None:
+            await self.broker.stop()
+            self.broker = None
+
+    async def _publish(self, topic: str, event: dict):
+        try:
+            await self.broker.publish(topic, event)
+        except Exception:
+            logger.exception("이벤트 전달 실패: %s", topic)
+
+    # 어느 스레드에서든 호출 가능 (서버가 안 떠 있으면 무시)
+    def publish(self, topic: str, event: dict):
+        loop = self._loop
+        if loop is None or loop.is_closed():
+            return
+        loop.call_soon_threadsafe(lambda: loop.create_task(self._publish(topic, event)))
+
+
+pubsub = PubSub()
+
+
+def user_topic(user_id: int) -> str:
+    return f"user:{user_id}"
+
+
+COMMUNITY_TOPIC = "community"
@@ -0,0 +1,116 @@
+# /static 정적 파일 서빙 (캐시 친화적)
+# - 내용 해시가 들어간 주소(/static/고얌이.1a2b3c4d.png)는 1년 + immutable 캐시
+# - 업로드 사진처럼 파일명 자체가 sha256 인 파일도 immutable 캐시
+# - 그 외 주소는 no-cache (ETag 로 재검증 -> 바뀌지 않았으면 304)
+# 조건부 요청(If-None-Match / If-Modified-Since)과 Range 요청은 Starlette FileResponse 가 처리
+# 해시 계산/존재 확인 전에 경로가 폴더 안인지 먼저 확인 (../ 로 폴더 밖 파일을 읽지 않도록)
+import hashlib
+import os
+import re
+import threading
+from typing import Dict, Optional, Tuple
+
+import anyio
+from fastapi.staticfiles import StaticFiles
+from starlette.types import Scope
+
+from app.core.config import settings
+
+# 고얌이.1a2b3c4d.png -> (고얌이, 1a2b3c4d, .png)
+HASHED_NAME = re.compile(r"^(?P<stem>.+)\.(?P<hash>[0-9a-f]{8})(?P<ext>\.[^./]+)$")
+# save_image 로 저장된 업로드 사진 / 그 변환 버전 (sha256 파일명)
+CONTENT_ADDRESSED_NAME = re.compile(r"^(variants/)?[0-9a-f]{64}[._]")
+
+IMMUTABLE_CACHE = "public, max-age=31536000, immutable"
+REVALIDATE_CACHE = "no-cache"
+
+
+class CachedStaticFiles(StaticFiles):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # 파일 경로 -> ((mtime, size), 해시 8자리)
+        self._hashes: Dict[str, Tuple[Tuple[float, int], str]] = {}
+        self._lock = threading.Lock()
+
+    # 폴더 안의 실제 경로, 폴더 밖을 가리키면(../, 심볼릭 링크) None
+    def _resolve(self, path: str) -> Optional[str]:
+        root = os.path.realpath(self.directory)
+        full_path = os.path.realpath(os.path.join(root, path))
+        if os.path.commonpath([root, full_path]) != root:
+            return None
+        return full_path
+
+    # 파일 내용 해시 (수정 시간/크기가 그대로면 다시 읽지 않음)
+    def file_hash(self, path: str) -> str:
+        full_path = self._resolve(path)
+        if full_path is None:
+            raise FileNotFoundError(path)
+        stat = os.stat(full_path)
+        stamp = (stat.st_mtime, stat.st_size)
+
+        with self._lock:
+            cached = self._hashes.get(path)
+        if cached and cached[0] == stamp:
+            return cached[1]
+
+        hasher = hashlib.sha256()
+        with open(full_path, "rb") as f:
+            for chunk in iter(lambda: f.read(64 * 1024), b""):
+                hasher.update(chunk)
+        digest = hasher.hexdigest()[:8]
+
+        with self._lock:
+            self._hashes[path] = (stamp, digest)
+        return digest
+
+    # "/static/고얌이.png" (또는 예전 해시 주소) -> "/static/고얌이.<현재 해시>.png"
+    # /static/ 주소가 아니거나 파일이 없으면 받은 주소를 그대로 돌려줌
+    def hashed_url(self, url: str) -> str:
+        if not url.startswith("/static/"):
+            return url
+
+        path = url[len("/static/"):]
+        match = HASHED_NAME.match(path)
+        if match:
+            original = self._resolve(match["stem"] + match["ext"])
+            if original is not None and os.path.exists(original):
+                path = match["stem"] + match["ext"]
+
+        full_path = self._resolve(path)
+        if full_path is None or not os.path.isfile(full_path):
+            return url
+
+        stem, ext = os.path.splitext(path)
+        return f"/static/{stem}.{self.file_hash(path)}{ext}"
+
+    async def get_response(self, path: str, scope: Scope):
+        cache_control = REVALIDATE_CACHE
+
+        match = HASHED_NAME.match(path)
+        if match:
+            original = match["stem"] + match["ext"]
+            try:
+                current_hash = await anyio.to_thread.run_sync(self.file_hash, original)
+            except OSError:
+                current_hash = None
+
+            if current_hash is not None:
+                path = original
+                # 해시가 다르면(예전 주소) 최신 파일을 주되 캐시는 고정하지 않음
+                if current_hash == match["hash"]:
+                    cache_control = IMMUTABLE_CACHE
+        elif CONTENT_ADDRESSED_NAME.match(path):
+            cache_control = IMMUTABLE_CACHE
+
+        response = await super().get_response(path, scope)
+        if response.status_code in (200, 206, 304):
+            response.headers["Cache-Control"] = cache_control
+        return response
+
+
+static_files = CachedStaticFiles(directory=settings.UPLOAD_DIR)
+
+
+# 시드 데이터 등에서 쓰는 해시 주소 생성
+def static_url(url: str) -> str:
+    return static_files.hashed_url(url)
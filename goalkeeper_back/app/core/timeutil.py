@@ -0,0 +1,48 @@
+# 시간 유틸
+# - DB 에는 시각을 naive UTC 로 저장 (서버 시간대와 무관하게 같은 값)
+# - "오늘/어제" 판단은 유저 시간대(users.timezone)의 자정 기준
+from datetime import date, datetime, time, timedelta, timezone
+from functools import lru_cache
+from typing import Optional
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+DEFAULT_TIMEZONE = "Asia/Seoul"
+
+
+@lru_cache(maxsize=None)
+def _zone(name: str) -> Optional[ZoneInfo]:
+    try:
+        return ZoneInfo(name)
+    except (ZoneInfoNotFoundError, ValueError):
+        return None
+
+
+def is_valid_timezone(name: str) -> bool:
+    return bool(name) and _zone(name) is not None
+
+
+# 잘못된 이름이면 기본 시간대(서울)
+def get_zone(name: Optional[str]) -> ZoneInfo:
+    return _zone(name or DEFAULT_TIMEZONE) or _zone(DEFAULT_TIMEZONE)
+
+
+# 지금 (naive UTC, DB 저장용)
+def utcnow() -> datetime:
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+# naive UTC 시각 -> 그 시간대의 날짜
+def local_date(utc_dt: datetime, tz_name: Optional[str]) -> date:
+    return utc_dt.replace(tzinfo=timezone.utc).astimezone(get_zone(tz_name)).date()
+
+
+# 그 시간대의 day 자정 -> naive UTC 시각
+def local_midnight_utc(day: date, tz_name: Optional[str]) -> datetime:
+    local = datetime.combine(day, time.min, tzinfo=get_zone(tz_name))
+    return local.astimezone(timezone.utc).replace(tzinfo=None)
+
+
+# 이 시각 이전에 마지막으로 인증했으면 연속 기록이 끊긴 것 (= 그 시간대의 '어제' 자정)
+def streak_cutoff_utc(tz_name: Optional[str], now: Optional[datetime] = None) -> datetime:
+    today = local_date(now or utcnow(), tz_name)
+    return local_midnight_utc(today - timedelta(days=1), tz_name)
@@ -1,12 +1,24 @@
 from sqlalchemy import create_engine
+from sqlalchemy.dialects.mysql import insert as mysql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 from app.core.config import settings
+from app.core.metrics import InstrumentedQueuePool, instrument_engine
 
-engine = create_engine(
-    settings.DB_URL,
-    pool_recycle=3600
-)
+engine_options = {
+    "poolclass": InstrumentedQueuePool,
+    "pool_size": settings.DB_POOL_SIZE,
+    "max_overflow": settings.DB_MAX_OVERFLOW,
+    "pool_timeout": settings.DB_POOL_TIMEOUT,
+    "pool_recycle": settings.DB_POOL_RECYCLE,
+    "pool_pre_ping": settings.DB_POOL_PRE_PING,
+}
+if settings.DB_ISOLATION_LEVEL:
+    engine_options["isolation_level"] = settings.DB_ISOLATION_LEVEL
+
+engine = create_engine(settings.DB_URL, **engine_options)
+instrument_engine(engine)
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
@@ -17,4 +29,41 @@ def get_db():
     try:
         yield db
     finally:
-        db.close()
\ No newline at end of file
+        db.close()
+
+# --- 비동기 DB 스택 (settings.DB_ASYNC=true 일 때만 생성) ---
+def _async_url(url: str) -> str:
+    if url.startswith("mysql+pymysql"):
+        return url.replace("mysql+pymysql", "mysql+aiomysql", 1)
+    if url.startswith("sqlite+pysqlite"):
+        return url.replace("sqlite+pysqlite", "sqlite+aiosqlite", 1)
+    if url.startswith("sqlite:"):
+        return url.replace("sqlite:", "sqlite+aiosqlite:", 1)
+    return url
+
+
+async_engine = None
+AsyncSessionLocal = None
+
+if settings.DB_ASYNC:
+    from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+    async_engine_options = {key: value for key, value in engine_options.items() if key != "poolclass"}
+    async_engine = create_async_engine(settings.DB_ASYNC_URL or _async_url(settings.DB_URL), **async_engine_options)
+    instrument_engine(async_engine.sync_engine)
+
+    AsyncSessionLocal = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=True)
+
+
+async def get_async_db():
+    async with AsyncSessionLocal() as db:
+        yield db
+
+# INSERT ... ON DUPLICATE KEY UPDATE (MySQL) / ON CONFLICT DO UPDATE (SQLite) 를 만들어줌
+# set_ 에 model.count + 1 처럼 기존 값을 참조하는 식을 넣으면 원자적으로 증가시킬 수 있음
+def upsert_stmt(model, values: dict, index_elements: list, set_: dict):
+    if engine.dialect.name == "mysql":
+        return mysql_insert(model).values(**values).on_duplicate_key_update(**set_)
+    return sqlite_insert(model).values(**values).on_conflict_do_update(
+        index_elements=index_elements, set_=set_
+    )
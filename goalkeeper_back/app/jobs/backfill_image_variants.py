@@ -0,0 +1,38 @@
+# 기존 게시글 사진들의 크기별 버전(thumb/feed/full)을 한 번에 생성
+# 사용법 (goalkeeper_back 폴더에서):
+#   python -m app.jobs.backfill_image_variants
+import os
+
+from app import models
+from app.core.config import settings
+from app.database import SessionLocal
+from app.services.images import submit_image_processing
+
+
+def main():
+    db = SessionLocal()
+    try:
+        image_urls = [
+            image_url
+            for (image_url,) in db.query(models.BoardPost.image_url)
+            .filter(models.BoardPost.image_url.isnot(None))
+            .distinct()
+        ]
+    finally:
+        db.close()
+
+    filenames = []
+    for image_url in image_urls:
+        filename = image_url.replace("/static/", "")
+        if os.path.exists(os.path.join(settings.UPLOAD_DIR, filename)):
+            filenames.append(filename)
+
+    print(f"🚀 게시글 사진 {len(filenames)}개 변환을 시작합니다...")
+    futures = [submit_image_processing(filename) for filename in filenames]
+    for future in futures:
+        future.result()
+    print("✅ 사진 변환 완료!")
+
+
+if __name__ == "__main__":
+    main()
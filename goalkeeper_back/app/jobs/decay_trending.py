@@ -0,0 +1,28 @@
+# 인기글 점수 감쇠 (서버에서는 app.jobs.scheduler 가 TRENDING_DECAY_INTERVAL 마다 자동 실행)
+# 사용법 (goalkeeper_back 폴더에서):
+#   python -m app.jobs.decay_trending              # 지난 실행 이후 흐른 시간만큼 감쇠
+#   python -m app.jobs.decay_trending --rebuild    # reaction 테이블 기준으로 전체 재계산 (처음 도입할 때)
+import sys
+
+from app import models  # noqa: F401 (테이블 등록)
+from app.database import Base, SessionLocal, engine
+from app.services.trending import decay_trending_scores, rebuild_trending_scores
+
+
+def main(argv: list[str]):
+    Base.metadata.create_all(bind=engine)
+
+    db = SessionLocal()
+    try:
+        if "--rebuild" in argv:
+            count = rebuild_trending_scores(db)
+            print(f"✅ 인기글 점수 재계산 완료! (점수가 있는 글 {count}개)")
+        else:
+            count = decay_trending_scores(db)
+            print(f"✅ 인기글 점수 감쇠 완료! (게시글 {count}개)")
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,27 @@
+# 이모지 개수 카운터(post_reaction_count)를 reaction 테이블 기준으로 다시 계산
+# 사용법 (goalkeeper_back 폴더에서):
+#   python -m app.jobs.rebuild_reaction_counts            # 전체 재계산
+#   python -m app.jobs.rebuild_reaction_counts 12 34      # 특정 게시글만
+import sys
+
+from app import models  # noqa: F401 (테이블 등록)
+from app.database import Base, SessionLocal, engine
+from app.services.reactions import rebuild_reaction_counts
+
+
+def main(argv: list[str]):
+    Base.metadata.create_all(bind=engine)
+    post_ids = [int(arg) for arg in argv]
+
+    db = SessionLocal()
+    try:
+        rebuild_reaction_counts(db, post_ids or None)
+    finally:
+        db.close()
+
+    target = f"게시글 {len(post_ids)}개" if post_ids else "전체 게시글"
+    print(f"✅ {target}의 이모지 카운터 재계산 완료!")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,29 @@
+# 끊긴 연속 기록(스트릭) 정리 (서버에서는 app.jobs.scheduler 가 각 시간대 자정이 지나면 자동 실행)
+# 사용법 (goalkeeper_back 폴더에서):
+#   python -m app.jobs.reset_streaks                    # 모든 시간대
+#   python -m app.jobs.reset_streaks Asia/Seoul UTC     # 특정 시간대만
+import sys
+import time
+
+from app import models  # noqa: F401 (테이블 등록)
+from app.database import Base, SessionLocal, engine
+from app.services.streaks import reset_all_broken_streaks
+
+
+def main(argv: list[str]):
+    Base.metadata.create_all(bind=engine)
+
+    started = time.perf_counter()
+    db = SessionLocal()
+    try:
+        result = reset_all_broken_streaks(db, argv or None)
+    finally:
+        db.close()
+
+    for tz, (users, goals) in result.items():
+        print(f"  {tz}: 유저 {users}명, 목표 {goals}개 스트릭 초기화")
+    print(f"✅ 스트릭 정리 완료! ({time.perf_counter() - started:.1f}초)")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,111 @@
+# 서버 안에서 도는 주기 작업 (main.py lifespan 에서 시작/종료)
+# - 작업은 스레드풀에서 실행 (동기 DB 세션 사용, 이벤트 루프를 막지 않음)
+# - 서버를 여러 개 띄우면 각자 실행되므로 작업은 여러 번 돌아도 결과가 같아야 함
+import asyncio
+import logging
+from datetime import date
+from typing import Callable
+
+from app.core.config import settings
+from app.core.idempotency import purge_expired_keys
+from app.core.timeutil import local_date, utcnow
+from app.database import SessionLocal
+from app.services.streaks import reset_all_broken_streaks, user_timezones
+from app.services.leaderboard import leaderboard
+from app.services.trending import decay_trending_scores
+from app.services.uploads import sweep_orphan_images
+
+logger = logging.getLogger(__name__)
+
+
+class Scheduler:
+    def __init__(self):
+        self._jobs: list[tuple[str, float, Callable[[], None]]] = []
+        self._tasks: list[asyncio.Task] = []
+
+    # interval 초마다 job 실행 (시작하자마자 한 번)
+    def every(self, interval: float, name: str):
+        def register(job: Callable[[], None]):
+            self._jobs.append((name, interval, job))
+            return job
+        return register
+
+    async def _run(self, name: str, interval: float, job: Callable[[], None]):
+        while True:
+            try:
+                await asyncio.to_thread(job)
+            except Exception:
+                logger.exception("주기 작업 실패: %s", name)
+            await asyncio.sleep(interval)
+
+    def start(self):
+        if not settings.SCHEDULER_ENABLED or self._tasks:
+            return
+        self._tasks = [
+            asyncio.create_task(self._run(name, interval, job), name=name)
+            for name, interval, job in self._jobs
+        ]
+
+    async def stop(self):
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+
+scheduler = Scheduler()
+
+# 시간대별로 마지막으로 정리한 현지 날짜 (자정이 지난 시간대만 다시 정리)
+_streaks_done: dict[str, date] = {}
+
+
+@scheduler.every(settings.STREAK_JOB_INTERVAL, "reset_streaks")
+def reset_streaks_job():
+    now = utcnow()
+    db = SessionLocal()
+    try:
+        due = [tz for tz in user_timezones(db) if _streaks_done.get(tz) != local_date(now, tz)]
+        if not due:
+            return
+        reset_all_broken_streaks(db, due, now)
+    finally:
+        db.close()
+
+    for tz in due:
+        _streaks_done[tz] = local_date(now, tz)
+
+
+@scheduler.every(settings.TRENDING_DECAY_INTERVAL, "decay_trending")
+def decay_trending_job():
+    db = SessionLocal()
+    try:
+        decay_trending_scores(db)
+    finally:
+        db.close()
+
+
+@scheduler.every(settings.LEADERBOARD_REBUILD_INTERVAL, "rebuild_leaderboard")
+def rebuild_leaderboard_job():
+    db = SessionLocal()
+    try:
+        leaderboard.rebuild(db)
+    finally:
+        db.close()
+
+
+@scheduler.every(settings.UPLOAD_SWEEP_INTERVAL, "sweep_orphan_images")
+def sweep_orphan_images_job():
+    db = SessionLocal()
+    try:
+        sweep_orphan_images(db)
+    finally:
+        db.close()
+
+
+@scheduler.every(settings.IDEMPOTENCY_PURGE_INTERVAL, "purge_idempotency_keys")
+def purge_idempotency_keys_job():
+    db = SessionLocal()
+    try:
+        purge_expired_keys(db)
+    finally:
+        db.close()
@@ -1,5 +1,5 @@
 # app/models.py
-from sqlalchemy import Column, Integer, String, Boolean, DateTime, ForeignKey, Text
+from sqlalchemy import Column, Integer, String, Boolean, Date, DateTime, Float, ForeignKey, Text, Index, UniqueConstraint
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.database import Base
@@ -14,16 +14,25 @@ class User(Base):
 
     # 💎 통합 스트릭 시스템
     total_streak = Column(Integer, default=0) # 앱 전체 연속 달성 횟수
-    last_check_date = Column(DateTime(timezone=True), nullable=True) # 마지막 인증 날짜
+    last_check_date = Column(DateTime(timezone=True), nullable=True) # 마지막 인증 시각 (UTC)
+    timezone = Column(String(64), nullable=False, default="Asia/Seoul", server_default="Asia/Seoul") # '오늘' 판단 기준 시간대
     
     # 💎 성장 및 재화 시스템
     level = Column(Integer, default=1)
     exp = Column(Integer, default=0)
     cash = Column(Integer, default=0) # 👈 [NEW] 재화 (코인) 추가 완료!
+
+    # 유저 데이터(프로필/목표/마스코트/액세서리)가 바뀔 때마다 +1 -> 조회 API 의 ETag 로 사용
+    data_version = Column(Integer, nullable=False, default=0, server_default="0")
+
+    # 안 읽은 알림 수 (알림 받을 때 +, 읽음 처리할 때 - 로 유지 -> COUNT(*) 안 함)
+    unread_notifications = Column(Integer, nullable=False, default=0, server_default="0")
     
     # 소셜 로그인 정보
     provider = Column(String(50))     
     provider_id = Column(String(255), unique=True)
+    # 기본 아이템(짜근 하먀, 방) 지급 완료 여부 -> 완료된 유저는 로그인 때 확인 생략
+    default_items_granted = Column(Boolean, nullable=False, default=False, server_default="0")
     
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     
@@ -49,9 +58,70 @@ class Goal(Base):
     is_completed = Column(Boolean, default=False)
 
     current_streak = Column(Integer, default=0)
-    last_verified_at = Column(DateTime(timezone=True), nullable=True)
+    last_verified_at = Column(DateTime(timezone=True), nullable=True) # 마지막 인증 시각 (UTC)
+    period_start = Column(Date, nullable=True) # 마지막으로 인증한 기간의 시작일 (유저 시간대 기준, app/services/periods.py)
     user = relationship("User", back_populates="goals")
 
+    __table_args__ = (
+        Index("ix_goal_user_period_start", "user_id", "period_start"),
+    )
+
+
+# --- 목표 인증 기록 (GoalCheckin) ---
+# 인증 1번 = 1행 (day 는 유저 시간대 기준 날짜) -> 달력/히스토리/통계용
+class GoalCheckin(Base):
+    __tablename__ = "goal_checkin"
+
+    goal_id = Column(Integer, ForeignKey("goal.goal_id", ondelete="CASCADE"), primary_key=True)
+    day = Column(Date, primary_key=True)
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    checked_at = Column(DateTime(timezone=True), nullable=False) # 인증 시각 (UTC)
+    cash = Column(Integer, nullable=False, default=0) # 이 인증으로 받은 코인
+
+    __table_args__ = (
+        # 달력 조회(유저 + 날짜 범위)가 테이블을 읽지 않고 인덱스만으로 끝나도록 goal_id 까지 포함
+        Index("ix_goal_checkin_user_day_goal", "user_id", "day", "goal_id"),
+    )
+
+
+# --- 보상 내역 (RewardLedger) ---
+# 목표 인증으로 받은 보상을 항목별로 쌓아두는 장부 (추가만 하고 수정/삭제하지 않음)
+class RewardLedger(Base):
+    __tablename__ = "reward_ledger"
+
+    ledger_id = Column(Integer, primary_key=True, index=True)
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    goal_id = Column(Integer, nullable=True) # 목표가 삭제돼도 내역은 남도록 FK 없음
+    label = Column(String(100), nullable=False)
+    cash = Column(Integer, nullable=False, default=0)
+    exp = Column(Integer, nullable=False, default=0)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+
+    __table_args__ = (
+        Index("ix_reward_ledger_user_created", "user_id", "created_at"),
+    )
+
+
+# --- 멱등키 (IdempotencyKey) ---
+# Idempotency-Key 헤더로 들어온 요청의 처음 응답 (재시도 시 그대로 돌려줌)
+class IdempotencyKey(Base):
+    __tablename__ = "idempotency_key"
+
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), primary_key=True)
+    key = Column(String(64), primary_key=True)
+    scope = Column(String(255), nullable=False) # 예: "POST /mascots/3/buy"
+    response_body = Column(Text, nullable=False) # JSON
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+
+
+# --- 주기 작업 상태 (JobState) ---
+# 서버 여러 대가 같은 주기 작업을 돌려도 한 번만 반영되도록 마지막 실행 시각을 저장
+class JobState(Base):
+    __tablename__ = "job_state"
+
+    name = Column(String(50), primary_key=True)
+    last_run_at = Column(DateTime, nullable=False) # UTC
+
 
 # --- 게시판 (BoardPost) ---
 class BoardPost(Base):
@@ -63,9 +133,26 @@ class BoardPost(Base):
     content = Column(Text, nullable=False)
     image_url = Column(String(255), nullable=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
+    # 인기글 점수 (시간이 지나면 줄어드는 반응 수, app/services/trending.py)
+    # 커서에 그대로 들어가므로 배정밀도 (MySQL 의 FLOAT 는 단정밀도라 저장하며 반올림됨)
+    trending_score = Column(Float(precision=53), nullable=False, default=0, server_default="0")
 
     user = relationship("User", back_populates="posts")
-    reactions = relationship("Reaction", back_populates="post")
+    # 게시글을 지우면 반응/카운터도 같이 삭제 (남아 있으면 MySQL 에서 FK 위반)
+    reactions = relationship("Reaction", back_populates="post", cascade="all, delete")
+    reaction_counts = relationship("PostReactionCount", cascade="all, delete-orphan")
+
+    # 커서 페이지네이션: (created_at, post_id) 범위 조건을 인덱스로 탐색
+    # 인기글: (trending_score, post_id) 인덱스를 높은 점수부터 읽음
+    # 검색: MySQL FULLTEXT + ngram 파서 (SQLite 는 app/services/search.py 의 FTS5 테이블 사용)
+    __table_args__ = (
+        Index("ix_board_post_created_at_post_id", "created_at", "post_id"),
+        Index("ix_board_post_trending_score_post_id", "trending_score", "post_id"),
+        Index(
+            "ft_board_post_title_content", "title", "content",
+            mysql_prefix="FULLTEXT", mysql_with_parser="ngram",
+        ).ddl_if(dialect="mysql"),
+    )
 
 
 # --- 반응/이모지 (Reaction) ---
@@ -76,10 +163,27 @@ class Reaction(Base):
     post_id = Column(Integer, ForeignKey("board_post.post_id"), nullable=False)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
     emoji_type = Column(String(50), nullable=False) # like, heart, fire
+    created_at = Column(DateTime, nullable=True) # 반응 시각 (UTC, 인기글 점수 계산용 / 예전 데이터는 NULL)
 
     post = relationship("BoardPost", back_populates="reactions")
     user = relationship("User", back_populates="reactions")
 
+    # 피드 집계(GROUP BY post_id, emoji_type)를 인덱스만으로 처리하기 위함
+    __table_args__ = (
+        Index("ix_reaction_post_emoji", "post_id", "emoji_type"),
+    )
+
+
+# --- 게시글별 이모지 개수 요약 (PostReactionCount) ---
+# reaction 테이블을 매번 세지 않도록 react_to_post 에서 함께 갱신하는 카운터
+# 어긋났을 때는 python -m app.jobs.rebuild_reaction_counts 로 재계산
+class PostReactionCount(Base):
+    __tablename__ = "post_reaction_count"
+
+    post_id = Column(Integer, ForeignKey("board_post.post_id", ondelete="CASCADE"), primary_key=True)
+    emoji_type = Column(String(50), primary_key=True)
+    count = Column(Integer, nullable=False, default=0)
+
 
 # --- 마스코트 도감 (Mascot) ---
 class Mascot(Base):
@@ -109,6 +213,10 @@ class UserMascot(Base):
     user = relationship("User", back_populates="mascots")
     mascot = relationship("Mascot")
 
+    __table_args__ = (
+        UniqueConstraint("user_id", "mascot_id", name="uq_user_mascot_user_mascot"), # 같은 마스코트 중복 보유 방지
+    )
+
 # --- 장신구 상점 (Accessory) ---
 class Accessory(Base):
     __tablename__ = "accessory"
@@ -133,27 +241,40 @@ class UserAccessory(Base):
     user = relationship("User")
     accessory = relationship("Accessory")
 
+    __table_args__ = (
+        UniqueConstraint("user_id", "accessory_id", name="uq_user_accessory_user_accessory"), # 같은 장신구 중복 보유 방지
+    )
+
 
 # --- 알림 (Notifications) ---
 class Notification(Base):
     __tablename__ = "notifications"
 
     notification_id = Column(Integer, primary_key=True, index=True)
-    sender_id = Column(Integer, ForeignKey("users.id"), nullable=False)
-    receiver_id = Column(Integer, ForeignKey("users.id"), nullable=False)
-    goal_id = Column(Integer, ForeignKey("goal.goal_id"), nullable=True)
+    sender_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    receiver_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    goal_id = Column(Integer, ForeignKey("goal.goal_id", ondelete="SET NULL"), nullable=True) # 목표가 지워져도 알림은 남김
     
     type = Column(String(50), nullable=False) # wake_up, friend_request
     message = Column(Text)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     is_read = Column(Boolean, default=False)
 
+    __table_args__ = (
+        # 받은 알림함 (안 읽은 것만 / 최신순 키셋 페이지네이션)
+        Index("ix_notifications_receiver_read_created", "receiver_id", "is_read", "created_at"),
+    )
+
 
 # --- 알림 차단 (NotificationBlock) ---
 class NotificationBlock(Base):
     __tablename__ = "notification_block"
 
     block_id = Column(Integer, primary_key=True, index=True)
-    user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
     notification_type = Column(String(50), nullable=False)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
+
+    __table_args__ = (
+        Index("ix_notification_block_user", "user_id"),
+    )
@@ -1,35 +1,60 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
+from sqlalchemy import insert, update
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session, joinedload
 from app.database import get_db
 from app import models, schemas
 from app.core.dependencies import get_current_user_info
+from app.core.etag import bump_user_version, check_not_modified, check_user_not_modified
+from app.core.idempotency import Idempotency, get_idempotency
+from app.services.catalog import catalog
+from app.services.leaderboard import leaderboard
 
 router = APIRouter()
 
 # 상점 목록
 @router.get("/", response_model=list[schemas.AccessoryResponse])
-def get_all_accessories(db: Session = Depends(get_db)):
-    return db.query(models.Accessory).all()
+def get_all_accessories(request: Request, response: Response, db: Session = Depends(get_db)):
+    snapshot = catalog.get(db)
+    not_modified = check_not_modified(request, response, snapshot.accessories_etag)
+    if not_modified:
+        return not_modified
+
+    # 도감 캐시에 미리 직렬화해 둔 JSON 을 그대로 내려줌
+    return Response(content=snapshot.accessories_json, media_type="application/json", headers=response.headers)
 
 # 🟢 [핵심 수정] 내 액세서리 목록 (없으면 '방' 자동 지급)
 @router.get("/my", response_model=list[schemas.UserAccessoryResponse])
 def get_my_accessories(
+    request: Request,
+    response: Response,
     db: Session = Depends(get_db),
     current_user: dict = Depends(get_current_user_info)
 ):
     user_id = int(current_user["sub"])
-    
+
+    # 바뀐 게 없으면 304
+    not_modified = check_user_not_modified(request, response, db, user_id, "accessories-my")
+    if not_modified:
+        return not_modified
 
     return db.query(models.UserAccessory).options(joinedload(models.UserAccessory.accessory)).filter(models.UserAccessory.user_id == user_id).all()
 
 # 장착 중인 목록
 @router.get("/equipped", response_model=list[schemas.UserAccessoryResponse])
 def get_equipped_accessories(
+    request: Request,
+    response: Response,
     db: Session = Depends(get_db),
     current_user: dict = Depends(get_current_user_info)
 ):
     user_id = int(current_user["sub"])
 
+    # 바뀐 게 없으면 304
+    not_modified = check_user_not_modified(request, response, db, user_id, "accessories-equipped")
+    if not_modified:
+        return not_modified
+
     
     return db.query(models.UserAccessory).options(joinedload(models.UserAccessory.accessory)).filter(
         models.UserAccessory.user_id == user_id,
@@ -40,34 +65,49 @@ def get_equipped_accessories(
 def buy_accessory(
     accessory_id: int,
     db: Session = Depends(get_db),
-    current_user: dict = Depends(get_current_user_info)
+    current_user: dict = Depends(get_current_user_info),
+    idempotency: Idempotency = Depends(get_idempotency)
 ):
     user_id = int(current_user["sub"])
-    
-    user = db.query(models.User).filter(models.User.id == user_id).first()
-    item = db.query(models.Accessory).filter(models.Accessory.accessory_id == accessory_id).first()
+
+    # 같은 Idempotency-Key 로 이미 처리된 구매(앱 재시도)면 그때 응답 그대로 (이중 결제 방지)
+    # (동시에 들어온 재시도는 키 선점에서 앞의 요청이 끝나길 기다렸다가 그 응답을 받음)
+    replayed = idempotency.claim(db)
+    if replayed is not None:
+        return replayed
+
+    item = catalog.get(db).accessories.get(accessory_id)
     
     if not item:
         raise HTTPException(status_code=404, detail="Item not found")
 
-    existing = db.query(models.UserAccessory).filter(
-        models.UserAccessory.user_id == user_id,
-        models.UserAccessory.accessory_id == accessory_id
-    ).first()
-    
-    if existing:
-        raise HTTPException(status_code=400, detail="이미 보유 중입니다.")
-    
-    if user.cash < item.price:
+    # 잔액이 충분할 때만 차감 (UPDATE ... WHERE cash >= price)
+    # 유저 행을 먼저 잠가야 같은 유저의 동시 구매끼리 데드락이 나지 않음
+    paid = db.execute(
+        update(models.User)
+        .where(models.User.id == user_id, models.User.cash >= item.price)
+        .values(cash=models.User.cash - item.price)
+    )
+    if paid.rowcount == 0:
+        db.rollback()
         raise HTTPException(status_code=400, detail="캐시가 부족합니다.")
-    
-    user.cash -= item.price
-    new_item = models.UserAccessory(user_id=user.id, accessory_id=item.accessory_id, is_active=False)
-    
-    db.add(new_item)
-    db.commit()
-    
-    return {"message": f"{item.name} 구매 완료!", "remaining_cash": user.cash}
+
+    # 보유 목록에 추가 (이미 있으면 유니크 제약 위반 -> 차감도 함께 롤백)
+    try:
+        db.execute(insert(models.UserAccessory).values(user_id=user_id, accessory_id=accessory_id, is_active=False))
+    except IntegrityError:
+        db.rollback()
+        replayed = idempotency.replay(db)
+        if replayed is not None:
+            return replayed
+        raise HTTPException(status_code=400, detail="이미 보유 중입니다.")
+
+    remaining_cash = db.query(models.User.cash).filter(models.User.id == user_id).scalar()
+    bump_user_version(db, user_id)
+
+    body = idempotency.commit(db, {"message": f"{item.name} 구매 완료!", "remaining_cash": remaining_cash})
+    leaderboard.update_user(user_id, cash=body["remaining_cash"])
+    return body
 
 # 장착
 @router.post("/{accessory_id}/equip")
@@ -78,7 +118,7 @@ def equip_accessory(
 ):
     user_id = int(current_user["sub"])
     
-    my_item = db.query(models.UserAccessory).options(joinedload(models.UserAccessory.accessory)).filter(
+    my_item = db.query(models.UserAccessory).filter(
         models.UserAccessory.user_id == user_id, 
         models.UserAccessory.accessory_id == accessory_id
     ).first()
@@ -86,19 +126,25 @@ def equip_accessory(
     if not my_item:
         raise HTTPException(status_code=400, detail="구매하지 않은 아이템입니다.")
     
-    item_type = my_item.accessory.type 
+    # 부위(type)는 도감 캐시에서 확인 (도감에서 빠진 아이템이면 404)
+    snapshot = catalog.get(db)
+    accessory = snapshot.accessories.get(accessory_id)
+    if not accessory:
+        raise HTTPException(status_code=404, detail="Item not found")
+    item_type = accessory.type
 
     # 같은 타입 해제
-    active_items_of_same_type = db.query(models.UserAccessory).join(models.Accessory).filter(
+    active_items_of_same_type = db.query(models.UserAccessory).filter(
         models.UserAccessory.user_id == user_id,
         models.UserAccessory.is_active == True,
-        models.Accessory.type == item_type
+        models.UserAccessory.accessory_id.in_(snapshot.accessory_ids_of_type(item_type))
     ).all()
 
     for item in active_items_of_same_type:
         item.is_active = False
     
     my_item.is_active = True
+    bump_user_version(db, user_id)
     db.commit()
     
     return {"message": "장착 완료!"}
@@ -121,6 +167,7 @@ def unequip_accessory(
         raise HTTPException(status_code=400, detail="보유하지 않은 아이템입니다.")
     
     my_item.is_active = False
+    bump_user_version(db, user_id)
     db.commit()
     
     return {"message": "장착 해제 완료!"}
\ No newline at end of file
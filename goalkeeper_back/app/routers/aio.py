@@ -0,0 +1,77 @@
+# 비동기 DB 스택용 라우터 (settings.DB_ASYNC=true 일 때 main.py 에서 사용)
+# 기존 동기 라우터의 핸들러를 그대로 재사용:
+#   - db: Session 대신 AsyncSession 을 받는 async 핸들러를 만들고
+#   - AsyncSession.run_sync 로 기존 핸들러를 실행 (쿼리는 비동기 드라이버로 나가고 스레드풀을 쓰지 않음)
+#   - 응답 모델 변환(지연 로딩 포함)도 run_sync 안에서 끝내서 세션 밖에서 DB 접근이 일어나지 않도록 함
+#   - run_sync 안의 핸들러는 이벤트 루프 스레드에서 돌기 때문에, 파일 쓰기 같은 무거운 non-DB 작업은
+#     app/core/blocking.run_blocking 으로 스레드풀에 넘겨야 함 (save_image, release_image, 랭킹 재계산 등)
+# 동기 라우터에 라우트를 추가/수정하면 비동기 스택에도 자동으로 반영됨
+import inspect
+from functools import wraps
+
+from fastapi import APIRouter, Depends, Response
+from fastapi.routing import APIRoute
+from pydantic import TypeAdapter
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.database import get_async_db, get_db
+
+
+def _wrap_endpoint(endpoint, response_model):
+    signature = inspect.signature(endpoint)
+    db_params = [
+        name for name, param in signature.parameters.items()
+        if getattr(param.default, "dependency", None) is get_db
+    ]
+    if not db_params:
+        return endpoint
+
+    db_param = db_params[0]
+    adapter = TypeAdapter(response_model) if response_model is not None else None
+
+    def call_sync(session, kwargs):
+        result = endpoint(**kwargs, **{db_param: session})
+        if inspect.iscoroutine(result):
+            result.close()
+            raise TypeError(f"{endpoint.__name__} 는 async 핸들러라 run_sync 로 실행할 수 없습니다.")
+        if adapter is None or isinstance(result, Response):
+            return result
+        return adapter.validate_python(result, from_attributes=True)
+
+    @wraps(endpoint)
+    async def async_endpoint(**kwargs):
+        db: AsyncSession = kwargs.pop(db_param)
+        return await db.run_sync(call_sync, kwargs)
+
+    async_endpoint.__signature__ = signature.replace(
+        parameters=[
+            param.replace(default=Depends(get_async_db), annotation=AsyncSession)
+            if name == db_param else param
+            for name, param in signature.parameters.items()
+        ]
+    )
+    return async_endpoint
+
+
+# add_api_route 로 넘길 수 있는 라우트 설정 (tags, dependencies, responses, summary, include_in_schema ...)
+_ROUTE_OPTIONS = [
+    name for name in inspect.signature(APIRouter.add_api_route).parameters
+    if name not in ("self", "path", "endpoint")
+]
+
+
+# 동기 라우터 -> 같은 경로/설정을 가진 비동기 라우터 (핸들러만 바꿔 끼움)
+def make_async_router(sync_router: APIRouter) -> APIRouter:
+    async_router = APIRouter()
+    for route in sync_router.routes:
+        if not isinstance(route, APIRoute):
+            continue
+        # async 핸들러(로그인 등)는 그대로 사용
+        endpoint = route.endpoint
+        if not inspect.iscoroutinefunction(endpoint):
+            endpoint = _wrap_endpoint(endpoint, route.response_model)
+
+        options = {name: getattr(route, name) for name in _ROUTE_OPTIONS if hasattr(route, name)}
+        options["methods"] = list(route.methods)
+        async_router.add_api_route(route.path, endpoint, **options)
+    return async_router
@@ -1,21 +1,27 @@
 from fastapi import APIRouter, Depends, HTTPException
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import exists, insert, literal, select, update
 from sqlalchemy.orm import Session
-from app.database import get_db
+from app.database import get_db, upsert_stmt
 from app.models import User
 from app import models, schemas
 from app.core.config import settings
 from app.core.dependencies import get_current_user_info
+from app.core.cache import TTLCache
+from app.core.http import http_request
 from jose import jwt
 from datetime import datetime, timedelta
+import hashlib
 import httpx
 from app import schemas
-
-# 구글 토큰 검증용 라이브러리
-from google.oauth2 import id_token
-from google.auth.transport import requests
+from app.core.google_auth import google_verifier
+from app.services.catalog import catalog
 
 router = APIRouter()
 
+# 카카오 토큰(sha256) -> /v2/user/me 결과 (앱 재실행 시 같은 토큰으로 로그인하면 카카오 호출 생략)
+kakao_profile_cache = TTLCache(maxsize=10000, ttl=settings.KAKAO_PROFILE_CACHE_TTL)
+
 #  토큰 생성 함수 
 def create_access_token(user_id: int, nickname: str):
     expire = datetime.utcnow() + timedelta(hours=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
@@ -23,40 +29,113 @@ def create_access_token(user_id: int, nickname: str):
     encoded_jwt = jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
     return encoded_jwt
 
-# 🟢 [정석] 기본 아이템 지급 함수 (재사용성을 위해 분리)
-def check_and_grant_default_items(db: Session, user_id: int, nickname: str):
-    try:
-        # 1. 마스코트 확인 ('짜근 하먀')
-        default_mascot = db.query(models.Mascot).filter(models.Mascot.name == "짜근 하먀").first()
-        if default_mascot:
-            has_mascot = db.query(models.UserMascot).filter(
-                models.UserMascot.user_id == user_id,
-                models.UserMascot.mascot_id == default_mascot.mascot_id
-            ).first()
-
-            if not has_mascot:
-                print(f"🎁 {nickname}님에게 [짜근 하먀] 지급 완료")
-                # 지급하면서 바로 장착(is_active=True)
-                db.add(models.UserMascot(user_id=user_id, mascot_id=default_mascot.mascot_id, is_active=True))
-
-        # 2. 배경 확인 ('방')
-        default_bg = db.query(models.Accessory).filter(models.Accessory.name == "방").first()
-        if default_bg:
-            has_room = db.query(models.UserAccessory).filter(
-                models.UserAccessory.user_id == user_id,
-                models.UserAccessory.accessory_id == default_bg.accessory_id
-            ).first()
-
-            if not has_room:
-                print(f"🎁 {nickname}님에게 [방] 지급 완료")
-                # 지급하면서 바로 장착(is_active=True)
-                db.add(models.UserAccessory(user_id=user_id, accessory_id=default_bg.accessory_id, is_active=True))
-        
+# 🟢 [정석] 기본 아이템 (가입 시 지급 + 바로 장착)
+DEFAULT_MASCOT_NAME = "짜근 하먀"
+DEFAULT_BACKGROUND_NAME = "방"
+
+# 기본 아이템 지급 (이미 있으면 아무것도 안 함, commit 은 호출한 쪽에서)
+# 아이템 id 는 도감 캐시에서 찾고, "없으면 INSERT" 를 문장 하나로 처리
+# 기본 아이템을 모두 갖게 됐으면 True (도감에 아직 없는 아이템이 있으면 False -> 다음 로그인 때 다시 지급)
+def grant_default_items(db: Session, user_id: int) -> bool:
+    snapshot = catalog.get(db)
+    mascot_id = snapshot.find_mascot_id(DEFAULT_MASCOT_NAME)
+    background_id = snapshot.find_accessory_id(DEFAULT_BACKGROUND_NAME)
+
+    grants = []
+    if mascot_id is not None:
+        grants.append((models.UserMascot, "mascot_id", mascot_id))
+    if background_id is not None:
+        grants.append((models.UserAccessory, "accessory_id", background_id))
+
+    for model, item_column, item_id in grants:
+        already_owned = exists().where(model.user_id == user_id, getattr(model, item_column) == item_id)
+        db.execute(
+            insert(model).from_select(
+                ["user_id", item_column, "is_active"],
+                select(literal(user_id), literal(item_id), literal(True)).where(~already_owned),
+            )
+        )
+
+    return mascot_id is not None and background_id is not None
+
+# 같은 provider_id 가 다른 로그인 방식(카카오/구글)으로 이미 가입돼 있으면 409
+def _check_provider(db: Session, user: User, provider: str):
+    if user.provider != provider:
+        db.rollback()
+        raise HTTPException(status_code=409, detail="다른 로그인 방식으로 가입된 계정입니다.")
+
+# 🟢 로그인/회원가입 처리 + 우리 서버 토큰 발급 (카카오/구글 공통)
+# 동기 DB 작업이라 async 라우터에서는 run_in_threadpool 로 호출 (이벤트 루프를 막지 않도록)
+# - 기존 유저(기본 아이템 지급 완료): 유저 조회 1번, commit 없음
+# - 신규 유저: 가입(INSERT ... ON DUPLICATE KEY) + 기본 아이템 지급 + 지급 완료 표시를 한 트랜잭션으로
+# 유저는 provider_id(유니크)로 찾음 -> 가입 INSERT 의 충돌 키와 같아야, 동시 가입에서 다시 조회할 때 항상 찾아짐
+def login_or_signup(db: Session, provider: str, provider_id: str, nickname: str, email: str):
+    user = db.query(User).filter(User.provider_id == provider_id).first()
+    if user:
+        _check_provider(db, user, provider)
+
+    if not user or not user.default_items_granted:
+        if not user:
+            # 같은 계정으로 동시에 로그인해도 한 명만 생성됨
+            db.execute(
+                upsert_stmt(
+                    User,
+                    {
+                        "provider_id": provider_id,
+                        "nickname": nickname,
+                        "email": email,
+                        "provider": provider,
+                        "level": 1,
+                        "exp": 0,
+                        "cash": 0,
+                    },
+                    index_elements=["provider_id"],
+                    set_={"provider_id": User.provider_id},
+                )
+            )
+            user = db.query(User).filter(User.provider_id == provider_id).one()
+            _check_provider(db, user, provider)
+
+        values = {"data_version": User.data_version + 1}
+        if grant_default_items(db, user.id):
+            values["default_items_granted"] = True
+        db.execute(update(User).where(User.id == user.id).values(**values))
         db.commit()
 
-    except Exception as e:
-        print(f"⚠️ 기본 아이템 지급 중 에러 (무시하고 진행): {e}")
-        db.rollback() # 에러나면 롤백
+    # 우리 서버 토큰 발급 
+    access_token = create_access_token(
+        user_id=user.id,
+        nickname=user.nickname
+    )
+    
+    return {
+        "access_token": access_token,
+        "token_type": "bearer",
+        "nickname": user.nickname,
+        "level": user.level,
+        "cash": user.cash
+    }
+
+# 카카오 서버에 "이 토큰 주인 누구야?" 물어보기 (짧게 캐시)
+async def fetch_kakao_user(kakao_access_token: str) -> dict:
+    cache_key = hashlib.sha256(kakao_access_token.encode()).hexdigest()
+    user_info = kakao_profile_cache.get(cache_key)
+    if user_info is not None:
+        return user_info
+
+    try:
+        user_res = await http_request("GET", f"{settings.KAKAO_API_BASE}/v2/user/me", headers={
+            "Authorization": f"Bearer {kakao_access_token}"
+        })
+    except httpx.HTTPError:
+        raise HTTPException(status_code=502, detail="카카오 서버에 연결할 수 없습니다.")
+
+    if user_res.status_code != 200:
+        raise HTTPException(status_code=400, detail="Invalid Kakao Token")
+
+    user_info = user_res.json()
+    kakao_profile_cache.set(cache_key, user_info)
+    return user_info
 
 #  카카오 SDK 로그인 
 @router.post("/kakao")
@@ -64,18 +143,8 @@ async def kakao_native_login(
     req: schemas.SocialLoginRequest,  
     db: Session = Depends(get_db)
 ):
-    kakao_access_token = req.token
-    
     # 카카오 서버에 "이 토큰 주인 누구야?" 물어보기
-    async with httpx.AsyncClient() as client:
-        user_res = await client.get("https://kapi.kakao.com/v2/user/me", headers={
-            "Authorization": f"Bearer {kakao_access_token}"
-        })
-    
-    if user_res.status_code != 200:
-        raise HTTPException(status_code=400, detail="Invalid Kakao Token")
-
-    user_info = user_res.json()
+    user_info = await fetch_kakao_user(req.token)
 
     # 정보 추출
     provider_id = str(user_info.get("id"))
@@ -89,36 +158,7 @@ async def kakao_native_login(
         nickname = email.split("@")[0] if email else "Unknown"
 
     # 로그인/회원가입 처리
-    user = db.query(User).filter(User.provider_id == provider_id, User.provider == "kakao").first()
-
-    if not user:
-        new_user = User(
-            provider_id=provider_id,
-            nickname=nickname,
-            email=email,
-            provider="kakao",
-            level=1,
-            exp=0,
-            cash=0
-        )
-        db.add(new_user)
-        db.commit()
-        db.refresh(new_user)
-        user = new_user
-    check_and_grant_default_items(db, user.id, user.nickname)
-    # 우리 서버 토큰 발급 
-    access_token = create_access_token(
-        user_id=user.id,
-        nickname=user.nickname
-    )
-    
-    return {
-        "access_token": access_token,
-        "token_type": "bearer",
-        "nickname": user.nickname,
-        "level": user.level,
-        "cash": user.cash
-    }
+    return await run_in_threadpool(login_or_signup, db, "kakao", provider_id, nickname, email)
 
 #  구글 SDK 로그인 (앱 전용) 
 @router.post("/google")
@@ -128,51 +168,20 @@ async def google_native_login(
 ):
     try:
         # 구글 ID 토큰 검증 
-        # 프론트에서 받은 req.token(idToken)이 진짜인지 확인
-        idinfo = id_token.verify_oauth2_token(req.token, requests.Request())
-
-        # 정보 추출
-        provider_id = idinfo.get('sub') 
-        email = idinfo.get('email')
-        name = idinfo.get('name')
-        
-        # DB 확인 및 저장
-        user = db.query(User).filter(User.provider_id == provider_id, User.provider == "google").first()
+        # 프론트에서 받은 req.token(idToken)이 진짜인지 확인 (서명 키는 캐시, 검증은 로컬)
+        idinfo = await google_verifier.verify(req.token)
 
-        if not user:
-            new_user = User(
-                provider_id=provider_id,
-                nickname=name if name else "Unknown",
-                email=email,
-                provider="google",
-                level=1,
-                exp=0,
-                cash=0
-            )
-            db.add(new_user)
-            db.commit()
-            db.refresh(new_user)
-            user = new_user
-
-        check_and_grant_default_items(db, user.id, user.nickname)
+    except ValueError:
+        # 토큰 위조, 만료, 구글 서명 키를 못 받은 경우
+        raise HTTPException(status_code=401, detail="Invalid Google Token")
 
-        # 우리 서버 토큰 발급
-        access_token = create_access_token(
-            user_id=user.id,
-            nickname=user.nickname
-        )
-        
-        return {
-            "access_token": access_token,
-            "token_type": "bearer",
-            "nickname": user.nickname,
-            "level": user.level,
-            "cash": user.cash
-        }
+    # 정보 추출
+    provider_id = idinfo.get('sub') 
+    email = idinfo.get('email')
+    name = idinfo.get('name')
 
-    except ValueError:
-        # 토큰 위조, 만료 등의 경우
-        raise HTTPException(status_code=400, detail="Invalid Google Token")
+    # DB 확인 및 저장
+    return await run_in_threadpool(login_or_signup, db, "google", provider_id, name if name else "Unknown", email)
 
 
 # 내 정보 조회
@@ -1,36 +1,23 @@
-import jwt
-import os
-import shutil
-from datetime import datetime
 from typing import Dict, Optional
-from collections import Counter
 
 from fastapi import APIRouter, Depends, UploadFile, File, Form, HTTPException
-from fastapi.security import OAuth2PasswordBearer
-from sqlalchemy.orm import Session
+from sqlalchemy import and_, func, or_, select
+from sqlalchemy.orm import Session, joinedload
 
 from app.database import get_db
 from app import models, schemas
-from app.core.dependencies import get_current_user_info
-
-# .env 파일에서 환경변수 로딩
-from dotenv import load_dotenv
-load_dotenv()
+from app.core.cursor import decode_cursor, decode_score_cursor, encode_cursor, encode_score_cursor
+from app.core.dependencies import get_current_user_info, get_optional_user_info
+from app.core.timeutil import utcnow
+from app.services.images import submit_image_processing, variant_urls
+from app.services.posts import build_post_responses
+from app.services.reactions import bump_reaction_count, delete_reaction_counts, publish_reaction
+from app.services.search import MIN_QUERY_LENGTH, search_posts
+from app.services.trending import bump_trending_score, reaction_weight
+from app.services.uploads import release_image, save_image
 
 router = APIRouter()
 
-# 설정값 (환경변수에서 가져오고, 없으면 기본값 사용)
-SECRET_KEY = os.getenv("SECRET_KEY", "supersecretkey")
-ALGORITHM = "HS256"
-
-# 사진 저장할 폴더 설정
-UPLOAD_DIR = "uploads"
-if not os.path.exists(UPLOAD_DIR):
-    os.makedirs(UPLOAD_DIR)
-
-# 토큰 인증 설정 (auto_error=False: 토큰이 없어도 에러 안 내고 None 처리)
-oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/auth/kakao/url", auto_error=False)
-
 
 #  게시글 작성 (사진 + 글) - 로그인 필수
 @router.post("/", response_model=schemas.PostResponse)
@@ -42,27 +29,23 @@ def create_post(
     current_user: dict = Depends(get_current_user_info) # 글 쓸 땐 로그인 필수
 ):
     user_id = int(current_user["sub"])
-    # --- 수정된 부분: 유저 DB에서 직접 닉네임 가져오기 ---
-    user = db.query(models.User).filter(models.User.id == user_id).first()
-    if not user:
-        raise HTTPException(status_code=404, detail="유저를 찾을 수 없습니다.")
-    
-    user_nickname = user.nickname # DB에서 가져온 진짜 닉네임
-
     image_url = None
 
     # 사진이 있다면 서버 폴더에 저장
+    # (DB 조회 전에 먼저 저장 -> 파일을 쓰는 동안 DB 커넥션을 잡고 있지 않음)
     if image:
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"{timestamp}_{image.filename}"
-        file_path = os.path.join(UPLOAD_DIR, filename)
-        
-        with open(file_path, "wb") as buffer:
-            shutil.copyfileobj(image.file, buffer)
-            
+        filename = save_image(image)
+        # 썸네일 등 크기별 버전은 백그라운드에서 생성
+        submit_image_processing(filename)
         # DB에는 파일 경로(URL)만 저장
         image_url = f"/static/{filename}"
 
+    # --- 수정된 부분: 유저 DB에서 직접 닉네임 가져오기 ---
+    user = db.query(models.User).filter(models.User.id == user_id).first()
+    if not user:
+        release_image(db, image_url)
+        raise HTTPException(status_code=404, detail="유저를 찾을 수 없습니다.")
+
     # DB 저장
     new_post = models.BoardPost(
         title = title,
@@ -81,6 +64,7 @@ def create_post(
         title=new_post.title,
         content=new_post.content,
         image_url=new_post.image_url,
+        image_variants=variant_urls(new_post.image_url),
         created_at=new_post.created_at,
         reaction_counts={},
         my_reaction=None
@@ -93,90 +77,174 @@ def get_posts(
     skip: int = 0, 
     limit: int = 10, 
     db: Session = Depends(get_db),
-    token: Optional[str] = Depends(oauth2_scheme) # 토큰은 없으면 None
+    current_user: Optional[dict] = Depends(get_optional_user_info) # 토큰이 없거나 이상하면 None
 ):
-    # 토큰이 있다면 유저 ID 추출 (내가 누른 좋아요 확인용)
-    current_user_id = None
-    if token:
-        try:
-            payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-            current_user_id = int(payload.get("sub"))
-        except:
-            pass # 토큰이 만료됐거나 이상하면 그냥 로그인 안 한 사람 취급
-
-    # 게시글 최신순 조회
-    posts = db.query(models.BoardPost).order_by(models.BoardPost.created_at.desc()).offset(skip).limit(limit).all()
-    
-    result = []
-    for post in posts:
-        # 이 게시글의 모든 리액션 가져오기
-        reactions = db.query(models.Reaction).filter(models.Reaction.post_id == post.post_id).all()
-        
-        # 이모지 종류별로 개수 세기 (예: {"👍": 2, "❤️": 1})
-        counts = dict(Counter([r.emoji_type for r in reactions]))
-        
-        #  내가 누른 게 있는지 확인 (로그인 한 경우만)
-        my_reaction = None
-        if current_user_id:
-            # 내 user_id로 된 리액션 찾기
-            my_react_obj = next((r for r in reactions if r.user_id == current_user_id), None)
-            if my_react_obj:
-                my_reaction = my_react_obj.emoji_type
-
-        # 결과 리스트에 추가
-        result.append({
-            "post_id": post.post_id,
-            "user_id": post.user_id,
-            "nickname": post.user.nickname if post.user else "알수없음",
-            "title" : post.title,
-            "content": post.content,
-            "image_url": post.image_url,
-            "created_at": post.created_at,
-            "reaction_counts": counts, 
-            "my_reaction": my_reaction 
-        })
-        
-    return result
+    # 로그인했다면 유저 ID (내가 누른 좋아요 확인용)
+    current_user_id = int(current_user["sub"]) if current_user else None
+
+    # 게시글 최신순 조회 (작성자 닉네임은 JOIN 으로 같이 가져옴)
+    posts = (
+        db.query(models.BoardPost)
+        .options(joinedload(models.BoardPost.user))
+        .order_by(models.BoardPost.created_at.desc(), models.BoardPost.post_id.desc())
+        .offset(skip)
+        .limit(limit)
+        .all()
+    )
+
+    # 이모지 개수 / 내 반응은 페이지 단위로 한 번에 집계
+    return build_post_responses(db, posts, current_user_id)
+
+# 게시글 목록 조회 (커서 방식) - 스크롤이 깊어져도 느려지지 않고, 새 글이 올라와도 중복/누락 없음
+# 첫 페이지는 cursor 없이 호출하고, 이후에는 응답의 next_cursor 를 그대로 넘기면 됨
+@router.get("/feed", response_model=schemas.PostPage)
+def get_posts_by_cursor(
+    cursor: Optional[str] = None,
+    limit: int = 10,
+    db: Session = Depends(get_db),
+    current_user: Optional[dict] = Depends(get_optional_user_info)
+):
+    limit = max(1, min(limit, 50))
+
+    current_user_id = int(current_user["sub"]) if current_user else None
+
+    query = db.query(models.BoardPost).options(joinedload(models.BoardPost.user))
+
+    # (created_at, post_id) 가 커서보다 "이전"인 글만 (인덱스 범위 탐색)
+    # 비교 기준 시각은 커서 글에 저장된 값 그대로 사용 (SQLite 는 시각을 문자열로 비교하는데,
+    # server_default 로 들어간 값은 소수점 초가 없어 파이썬에서 넘긴 값과 형식이 달라짐)
+    # 커서 글이 삭제됐으면 커서에 담긴 시각으로 대신함
+    if cursor:
+        last_created_at, last_post_id = decode_cursor(cursor)
+        stored_created_at = (
+            select(models.BoardPost.created_at)
+            .where(models.BoardPost.post_id == last_post_id)
+            .scalar_subquery()
+        )
+        last_created_at = func.coalesce(stored_created_at, last_created_at)
+        query = query.filter(
+            or_(
+                models.BoardPost.created_at < last_created_at,
+                and_(
+                    models.BoardPost.created_at == last_created_at,
+                    models.BoardPost.post_id < last_post_id,
+                ),
+            )
+        )
+
+    # 다음 페이지가 있는지 알기 위해 1개 더 가져옴
+    posts = (
+        query.order_by(models.BoardPost.created_at.desc(), models.BoardPost.post_id.desc())
+        .limit(limit + 1)
+        .all()
+    )
+
+    next_cursor = None
+    if len(posts) > limit:
+        posts = posts[:limit]
+        next_cursor = encode_cursor(posts[-1].created_at, posts[-1].post_id)
+
+    return schemas.PostPage(
+        items=build_post_responses(db, posts, current_user_id),
+        next_cursor=next_cursor,
+    )
+
+# 인기글 목록 (최근 반응이 많은 순, 커서 방식) - (trending_score, post_id) 인덱스를 위에서부터 읽음
+# 점수는 반응/시간에 따라 계속 바뀌므로 페이지 사이에 순위가 조금 달라질 수 있음
+@router.get("/trending", response_model=schemas.PostPage)
+def get_trending_posts(
+    cursor: Optional[str] = None,
+    limit: int = 10,
+    db: Session = Depends(get_db),
+    current_user: Optional[dict] = Depends(get_optional_user_info)
+):
+    limit = max(1, min(limit, 50))
+
+    current_user_id = int(current_user["sub"]) if current_user else None
+
+    query = db.query(models.BoardPost).options(joinedload(models.BoardPost.user)).filter(
+        models.BoardPost.trending_score > 0
+    )
+
+    if cursor:
+        last_score, last_post_id = decode_score_cursor(cursor)
+        query = query.filter(
+            or_(
+                models.BoardPost.trending_score < last_score,
+                and_(
+                    models.BoardPost.trending_score == last_score,
+                    models.BoardPost.post_id < last_post_id,
+                ),
+            )
+        )
+
+    # 다음 페이지가 있는지 알기 위해 1개 더 가져옴
+    posts = (
+        query.order_by(models.BoardPost.trending_score.desc(), models.BoardPost.post_id.desc())
+        .limit(limit + 1)
+        .all()
+    )
+
+    next_cursor = None
+    if len(posts) > limit:
+        posts = posts[:limit]
+        next_cursor = encode_score_cursor(posts[-1].trending_score, posts[-1].post_id)
+
+    return schemas.PostPage(
+        items=build_post_responses(db, posts, current_user_id),
+        next_cursor=next_cursor,
+    )
+
+# 게시글 검색 (제목 + 내용, 관련도순, 커서 방식)
+@router.get("/search", response_model=schemas.PostPage)
+def search_community_posts(
+    q: str,
+    cursor: Optional[str] = None,
+    limit: int = 10,
+    db: Session = Depends(get_db),
+    current_user: Optional[dict] = Depends(get_optional_user_info)
+):
+    limit = max(1, min(limit, 50))
+    q = " ".join(q.split())
+    if len(q) < MIN_QUERY_LENGTH:
+        raise HTTPException(status_code=400, detail=f"검색어는 {MIN_QUERY_LENGTH}글자 이상 입력해 주세요.")
+
+    current_user_id = int(current_user["sub"]) if current_user else None
+
+    after = decode_score_cursor(cursor) if cursor else None
+    results, has_more = search_posts(db, q, after, limit)
+
+    next_cursor = None
+    if has_more and results:
+        last_post, last_score = results[-1]
+        next_cursor = encode_score_cursor(last_score, last_post.post_id)
+
+    return schemas.PostPage(
+        items=build_post_responses(db, [post for post, _ in results], current_user_id),
+        next_cursor=next_cursor,
+    )
 
 # [추가할 코드] 게시글 상세 조회 (글 1개 가져오기)
 @router.get("/{post_id}", response_model=schemas.PostResponse)
 def get_post(
     post_id: int, 
     db: Session = Depends(get_db),
-    token: Optional[str] = Depends(oauth2_scheme)
+    current_user: Optional[dict] = Depends(get_optional_user_info)
 ):
     # 1. 게시글 찾기
-    post = db.query(models.BoardPost).filter(models.BoardPost.post_id == post_id).first()
+    post = (
+        db.query(models.BoardPost)
+        .options(joinedload(models.BoardPost.user))
+        .filter(models.BoardPost.post_id == post_id)
+        .first()
+    )
     if not post:
         raise HTTPException(status_code=404, detail="게시글을 찾을 수 없습니다.")
 
-    # 2. 좋아요 정보 계산
-    reactions = db.query(models.Reaction).filter(models.Reaction.post_id == post.post_id).all()
-    counts = dict(Counter([r.emoji_type for r in reactions]))
-    
-    my_reaction = None
-    if token:
-        try:
-            payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-            current_user_id = int(payload.get("sub"))
-            my_react_obj = next((r for r in reactions if r.user_id == current_user_id), None)
-            if my_react_obj:
-                my_reaction = my_react_obj.emoji_type
-        except:
-            pass
-
-    # 3. 응답 데이터 조립 (닉네임 포함)
-    return schemas.PostResponse(
-        post_id=post.post_id,
-        user_id=post.user_id,
-        nickname=post.user.nickname if post.user else "알수없음",
-        title=post.title,
-        content=post.content,
-        image_url=post.image_url,
-        created_at=post.created_at,
-        reaction_counts=counts,
-        my_reaction=my_reaction
-    )
+    current_user_id = int(current_user["sub"]) if current_user else None
+
+    # 2. 좋아요 정보 계산 + 응답 조립 (피드와 같은 집계 경로)
+    return build_post_responses(db, [post], current_user_id)[0]
 
 # 이모지 반응 남기기 (추가/변경/취소) - 로그인 필수
 @router.post("/{post_id}/react")
@@ -203,14 +271,23 @@ def react_to_post(
     if existing_reaction:
         # 경우 1: 같은 이모지를 또 누름 -> 취소 (삭제)
         if existing_reaction.emoji_type == emoji:
+            # 인기글 점수에서는 이 반응이 지금 차지하는 무게만큼만 뺌 (감쇠된 점수에서 1을 빼면 다른 반응까지 지워짐)
+            weight = reaction_weight(db, existing_reaction.created_at or post.created_at)
             db.delete(existing_reaction)
+            bump_reaction_count(db, post_id, emoji, -1)
+            bump_trending_score(db, post_id, -weight)
             db.commit()
+            publish_reaction(post_id, {emoji: -1})
             return {"message": "반응 취소", "action": "deleted"}
         
         # 경우 2: 다른 이모지를 누름 -> 변경 (업데이트)
         else:
+            old_emoji = existing_reaction.emoji_type
+            bump_reaction_count(db, post_id, old_emoji, -1)
+            bump_reaction_count(db, post_id, emoji, +1)
             existing_reaction.emoji_type = emoji
             db.commit()
+            publish_reaction(post_id, {old_emoji: -1, emoji: +1})
             return {"message": "반응 변경", "action": "updated", "emoji": emoji}
             
     else:
@@ -218,10 +295,14 @@ def react_to_post(
         new_reaction = models.Reaction(
             post_id=post_id,
             user_id=user_id,
-            emoji_type=emoji
+            emoji_type=emoji,
+            created_at=utcnow()
         )
         db.add(new_reaction)
+        bump_reaction_count(db, post_id, emoji, +1)
+        bump_trending_score(db, post_id, +1)
         db.commit()
+        publish_reaction(post_id, {emoji: +1})
         return {"message": "반응 추가", "action": "created", "emoji": emoji}
 
 # 게시글 수정하기 (제목, 내용, 사진 변경) - 본인만 가능
@@ -235,15 +316,24 @@ def update_post(
     current_user: dict = Depends(get_current_user_info)
 ):
     user_id = int(current_user["sub"])
-    
+
+    # 새 사진은 DB 조회 전에 먼저 저장
+    new_image_url = None
+    if image:
+        filename = save_image(image)
+        submit_image_processing(filename)
+        new_image_url = f"/static/{filename}"
+
     # 게시글 찾기
     post = db.query(models.BoardPost).filter(models.BoardPost.post_id == post_id).first()
     
     if not post:
+        release_image(db, new_image_url)
         raise HTTPException(status_code=404, detail="게시글을 찾을 수 없습니다.")
         
     # 권한 확인 (내 글인지?)
     if post.user_id != user_id:
+        release_image(db, new_image_url)
         raise HTTPException(status_code=403, detail="본인의 게시글만 수정할 수 있습니다.")
 
     # 내용 수정 (보낸 값만 업데이트)
@@ -252,37 +342,21 @@ def update_post(
     if content:
         post.content = content
         
-    # 사진 수정 로직 (사진을 새로 보냈다면?)
-    if image:
-        #  기존 파일 삭제 로직
-        if post.image_url:
-             old_file_path = post.image_url.replace("/static/", "")
-             if os.path.exists(os.path.join(UPLOAD_DIR, old_file_path)):
-                 os.remove(os.path.join(UPLOAD_DIR, old_file_path))
-        
-        # 새 파일 저장
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"{timestamp}_{image.filename}"
-        file_path = os.path.join(UPLOAD_DIR, filename)
-        
-        with open(file_path, "wb") as buffer:
-            shutil.copyfileobj(image.file, buffer)
-            
-        post.image_url = f"/static/{filename}"
+    # 사진 수정 로직 (사진을 새로 보냈다면 교체)
+    old_image_url = None
+    if new_image_url and new_image_url != post.image_url:
+        old_image_url = post.image_url
+        post.image_url = new_image_url
 
     # DB 저장
     db.commit()
     db.refresh(post)
-    post.nickname = post.user.nickname if post.user_id else "알수없음"
-    
+
+    # 기존 사진은 다른 글이 같이 쓰고 있지 않을 때만 삭제
+    release_image(db, old_image_url)
+
     # 응답을 위해 리액션 정보 채우기 (기존 정보 유지)
-    reactions = db.query(models.Reaction).filter(models.Reaction.post_id == post.post_id).all()
-    post.reaction_counts = dict(Counter([r.emoji_type for r in reactions]))
-    
-    my_react_obj = next((r for r in reactions if r.user_id == user_id), None)
-    post.my_reaction = my_react_obj.emoji_type if my_react_obj else None
-    
-    return post
+    return build_post_responses(db, [post], user_id)[0]
 
 
 
@@ -306,22 +380,15 @@ def delete_post(
     if post.user_id != user_id:
         raise HTTPException(status_code=403, detail="본인의 게시글만 삭제할 수 있습니다.")
     
-    if post.image_url:
-        
-        filename = post.image_url.replace("/static/", "")
-        
-        file_path = os.path.join(UPLOAD_DIR, filename)
-        
-        # 파일이 실제로 존재하는지 확인 후 삭제
-        if os.path.exists(file_path):
-            try:
-                os.remove(file_path) # 파일 삭제
-            except Exception as e:
-                # 파일 삭제에 실패해도 DB 삭제는 진행되어야 하므로 에러 로그만 찍고 넘어감
-                print(f"이미지 파일 삭제 실패: {e}")
-
-    # DB 삭제 
+    image_url = post.image_url
+
+    # DB 삭제 (반응 / 반응 카운터 먼저 정리)
+    db.query(models.Reaction).filter(models.Reaction.post_id == post_id).delete(synchronize_session=False)
+    delete_reaction_counts(db, post_id)
     db.delete(post)
     db.commit()
+
+    # 사진 파일은 다른 글이 같이 쓰고 있지 않을 때만 삭제
+    release_image(db, image_url)
     
     return {"message": "게시글이 삭제되었습니다."}
\ No newline at end of file
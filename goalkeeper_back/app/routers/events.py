@@ -0,0 +1,69 @@
+# 실시간 이벤트 (Server-Sent Events)
+# 앱은 연결을 하나 열어두고 아래 이벤트를 받음
+#   reaction     - 게시글 이모지 개수 변화 {"post_id", "deltas": {"🔥": 1, "👍": -1}}
+#   notification - 새 알림 {"notification_type", "sender_id", "goal_id", "message"}
+#   resync       - 놓친 이벤트가 있음 -> 목록을 다시 조회
+import asyncio
+import json
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Request, status
+from fastapi.responses import StreamingResponse
+from fastapi.security import HTTPAuthorizationCredentials
+
+from app.core.config import settings
+from app.core.dependencies import decode_access_token, optional_security
+from app.core.pubsub import COMMUNITY_TOPIC, pubsub, user_topic
+
+router = APIRouter()
+
+
+def _format_event(event: dict) -> str:
+    return f"event: {event['type']}\ndata: {json.dumps(event, ensure_ascii=False)}\n\n"
+
+
+# 토큰은 Authorization 헤더 또는 ?token= (헤더를 못 붙이는 EventSource 용)
+@router.get("/stream")
+async def stream_events(
+    request: Request,
+    token: Optional[str] = None,
+    credentials: Optional[HTTPAuthorizationCredentials] = Depends(optional_security),
+):
+    claims = decode_access_token(credentials.credentials if credentials else token or "")
+    if claims is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Could not validate credentials",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
+    topics = [user_topic(int(claims["sub"])), COMMUNITY_TOPIC]
+    if len(pubsub.hub) >= settings.PUBSUB_MAX_CONNECTIONS:
+        raise HTTPException(status_code=503, detail="접속자가 많아 잠시 후 다시 연결해 주세요.")
+
+    # 구독은 스트림이 실제로 시작된 뒤에 (응답을 보내기 전에 연결이 끊겨 제너레이터가 시작되지 않으면
+    # finally 도 실행되지 않으므로, 밖에서 구독하면 구독이 허브에 남음)
+    async def event_stream():
+        subscription = pubsub.hub.subscribe(topics)
+        if subscription is None:
+            # 위에서 확인한 뒤에 자리가 찼으면 재연결 간격만 알려주고 종료
+            yield "retry: 3000\n\n"
+            return
+
+        try:
+            yield "retry: 3000\n\n"
+            while not await request.is_disconnected():
+                try:
+                    event = await asyncio.wait_for(subscription.get(), timeout=settings.PUBSUB_HEARTBEAT)
+                except asyncio.TimeoutError:
+                    yield ": ping\n\n"  # 프록시/앱이 연결을 끊지 않도록
+                    continue
+                yield _format_event(event)
+        finally:
+            pubsub.hub.unsubscribe(subscription)
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
@@ -1,8 +1,16 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
 from sqlalchemy.orm import Session
-from app.database import get_db
+from app.database import get_db, upsert_stmt
 from app import models, schemas
 from app.core.dependencies import get_current_user_info
+from app.core.etag import bump_user_version, check_user_not_modified
+from app.core.idempotency import Idempotency, get_idempotency
+from app.services.rewards import apply_rewards
+from app.core.timeutil import local_date, utcnow
+from app.services import periods
+from app.services.checkins import MAX_CALENDAR_DAYS, calendar_bitmaps
+from app.services.leaderboard import leaderboard
+from app.services.notifications import detach_goal_notifications
 from datetime import datetime, timedelta, date
 
 router = APIRouter()
@@ -15,6 +23,9 @@ def create_goal(
     current_user: dict = Depends(get_current_user_info)
 ):
     user_id = int(current_user["sub"])
+    if not periods.is_valid_period(goal.period):
+        raise HTTPException(status_code=400, detail="주기는 daily, weekly, yearly 중 하나여야 합니다.")
+
     new_goal = models.Goal(
         title=goal.title,
         category=goal.category,
@@ -23,6 +34,7 @@ def create_goal(
         user_id=user_id
     )
     db.add(new_goal)
+    bump_user_version(db, user_id)
     db.commit()
     db.refresh(new_goal)
     return new_goal
@@ -30,13 +42,52 @@ def create_goal(
 # 내 목표 조회하기
 @router.get("/", response_model=list[schemas.GoalResponse])
 def read_my_goals(
+    request: Request,
+    response: Response,
     db: Session = Depends(get_db),
     current_user: dict = Depends(get_current_user_info)
 ):
     user_id = int(current_user["sub"])
+
+    # 바뀐 게 없으면 304
+    not_modified = check_user_not_modified(request, response, db, user_id, "goals")
+    if not_modified:
+        return not_modified
+
     goals = db.query(models.Goal).filter(models.Goal.user_id == user_id).all()
     return goals
 
+# 인증 달력 (모든 목표, 기간별 비트맵) - /{goal_id} 보다 먼저 선언
+@router.get("/calendar", response_model=schemas.GoalCalendarResponse)
+def read_goal_calendar(
+    request: Request,
+    response: Response,
+    from_date: date = Query(..., alias="from"),
+    to_date: date = Query(..., alias="to"),
+    db: Session = Depends(get_db),
+    current_user: dict = Depends(get_current_user_info)
+):
+    user_id = int(current_user["sub"])
+
+    num_days = (to_date - from_date).days + 1
+    if num_days < 1:
+        raise HTTPException(status_code=400, detail="from 은 to 보다 이후일 수 없습니다.")
+    if num_days > MAX_CALENDAR_DAYS:
+        raise HTTPException(status_code=400, detail=f"한 번에 최대 {MAX_CALENDAR_DAYS}일까지 조회할 수 있습니다.")
+
+    # 바뀐 게 없으면 304
+    not_modified = check_user_not_modified(request, response, db, user_id, f"goals-calendar:{from_date}:{to_date}")
+    if not_modified:
+        return not_modified
+
+    bitmaps = calendar_bitmaps(db, user_id, from_date, to_date)
+    return {
+        "from_date": from_date,
+        "to_date": to_date,
+        "days": num_days,
+        "goals": [{"goal_id": goal_id, "bitmap": bitmap} for goal_id, bitmap in sorted(bitmaps.items())],
+    }
+
 # 목표 수정
 @router.patch("/{goal_id}", response_model=schemas.GoalResponse)
 def update_goal(
@@ -55,9 +106,17 @@ def update_goal(
         raise HTTPException(status_code=404, detail="목표를 찾을 수 없습니다.")
 
     update_data = goal_update.dict(exclude_unset=True)
+    if "period" in update_data and update_data["period"] != target_goal.period:
+        if not periods.is_valid_period(update_data["period"]):
+            raise HTTPException(status_code=400, detail="주기는 daily, weekly, yearly 중 하나여야 합니다.")
+        # 주기가 바뀌면 기간 기준이 달라지므로 연속 기록은 새로 시작
+        target_goal.period_start = None
+        target_goal.current_streak = 0
+
     for key, value in update_data.items():
         setattr(target_goal, key, value)
 
+    bump_user_version(db, user_id)
     db.commit()
     db.refresh(target_goal)
     return target_goal
@@ -78,7 +137,11 @@ def delete_goal(
     if not target_goal:
         raise HTTPException(status_code=404, detail="목표를 찾을 수 없습니다.")
 
+    # 인증 기록 먼저 삭제 (보상 장부는 남겨둠), 이 목표를 찍은 알림은 목표 연결만 끊음
+    db.query(models.GoalCheckin).filter(models.GoalCheckin.goal_id == goal_id).delete(synchronize_session=False)
+    detach_goal_notifications(db, goal_id)
     db.delete(target_goal)
+    bump_user_version(db, user_id)
     db.commit()
     return {"message": "목표가 삭제되었습니다."}
 
@@ -89,36 +152,51 @@ def delete_goal(
 def check_goal(
     goal_id: int,
     db: Session = Depends(get_db),
-    current_user: dict = Depends(get_current_user_info)
+    current_user: dict = Depends(get_current_user_info),
+    idempotency: Idempotency = Depends(get_idempotency)
 ):
     user_id = int(current_user["sub"])
+
+    # 같은 Idempotency-Key 로 이미 인증된 요청(앱 재시도)이면 그때 응답 그대로
+    # (동시에 들어온 재시도는 키 선점에서 앞의 요청이 끝나길 기다렸다가 그 응답을 받음)
+    replayed = idempotency.claim(db)
+    if replayed is not None:
+        return replayed
     
-    # 유저 찾기
-    user = db.query(models.User).filter(models.User.id == user_id).first()
+    # 유저 찾기 (행 잠금: 같은 유저의 인증이 동시에 와도 하나씩 처리 -> '오늘의 첫 인증' 중복 방지)
+    user = db.query(models.User).filter(models.User.id == user_id).with_for_update().first()
+    if not user:
+        raise HTTPException(status_code=404, detail="User not found")
 
     # 목표 찾기
     goal = db.query(models.Goal).filter(
         models.Goal.goal_id == goal_id, 
         models.Goal.user_id == user_id
-    ).first()
+    ).with_for_update().first()
     
     if not goal:
         raise HTTPException(status_code=404, detail="Goal not found")
 
-    # 날짜 비교 로직
-    now = datetime.now()
-    today = now.date()
-    last_date = goal.last_verified_at.date() if goal.last_verified_at else None
+    # 날짜 비교 로직 (저장은 UTC, '오늘/이번 주/올해'는 유저 시간대 기준)
+    now = utcnow()
+    today = local_date(now, user.timezone)
+    current_start = periods.period_start(goal.period, today)
 
-    # 중복 인증 방지
-    if last_date == today:
-        raise HTTPException(status_code=400, detail="오늘은 이미 인증했습니다!")
+    # 마지막으로 인증한 기간 (period_start 가 없는 예전 데이터는 마지막 인증 시각으로 계산)
+    last_start = goal.period_start
+    if last_start is None and goal.last_verified_at:
+        last_start = periods.period_start(goal.period, local_date(goal.last_verified_at, user.timezone))
+
+    # 중복 인증 방지 (이번 기간에 이미 인증)
+    if last_start == current_start:
+        raise HTTPException(status_code=400, detail=periods.ALREADY_VERIFIED_MESSAGES[periods.normalize_period(goal.period)])
     
     # 개별 목표 스트릭 계산
-    if last_date == (today - timedelta(days=1)):
-        goal.current_streak += 1 # 어제 했으면 +1
+    if last_start == periods.previous_period_start(goal.period, current_start):
+        goal.current_streak += 1 # 지난 기간(어제/지난주/작년)에 했으면 +1
     else:
         goal.current_streak = 0 # 아니면 초기화
+    goal.period_start = current_start
 
 
     # 1. 보상 항목을 담을 리스트 생성
@@ -131,7 +209,7 @@ def check_goal(
     rewards_breakdown.append({"label": "목표 달성 기본 보상", "amount": base_cash})
 
     # 3. 유저 통합 스트릭 및 '오늘의 첫 인증' 판별
-    last_user_date = user.last_check_date.date() if user.last_check_date else None
+    last_user_date = local_date(user.last_check_date, user.timezone) if user.last_check_date else None
 
     if last_user_date != today:
         # ✅ 오늘 앱에서 처음으로 목표를 달성한 순간!
@@ -166,26 +244,32 @@ def check_goal(
     #     total_cash += 500
     #     total_exp += 100
 
-    # 유저 지갑 업데이트
-    user = db.query(models.User).filter(models.User.id == user_id).first()
-    user.cash += total_cash
-    user.exp += total_exp
-
     # 🆙 레벨업 체크 (예: 경험치가 100 넘으면 레벨업)
-    is_level_up = False
-    if user.exp >= 100:
-        user.level += 1
-        user.exp -= 100 # 경험치 소모
-        is_level_up = True
+    is_level_up = user.exp + total_exp >= 100
+
+    # 유저 지갑 업데이트 (UPDATE users SET cash = cash + ... 원자적 갱신) + 보상 장부 기록
+    apply_rewards(db, user_id, goal_id, rewards_breakdown, total_exp, created_at=now)
+
+    # 인증 기록 (달력/히스토리용)
+    # 시간대를 바꾸면 이미 기록된 현지 날짜에 다시 인증될 수 있음 -> 같은 날 기록에 합침 (PK 충돌로 500 이 나지 않도록)
+    db.execute(
+        upsert_stmt(
+            models.GoalCheckin,
+            {"goal_id": goal_id, "day": today, "user_id": user_id, "checked_at": now, "cash": total_cash},
+            index_elements=["goal_id", "day"],
+            set_={"checked_at": now, "cash": models.GoalCheckin.cash + total_cash},
+        )
+    )
 
     # 시간 갱신 및 저장
     goal.last_verified_at = now
-    db.commit()
-    db.refresh(goal)
+    bump_user_version(db, user_id)
+    db.flush()
     db.refresh(user) # 유저 정보도 갱신된 걸 가져와야 함
+    ranking_values = dict(total_streak=user.total_streak, level=user.level, exp=user.exp, cash=user.cash)
 
-    # 프론트엔드로 보낼 응답 
-    return {
+    # 프론트엔드로 보낼 응답 (멱등키 기록과 함께 커밋)
+    body = idempotency.commit(db, {
         "message": "인증 성공!",
         "current_streak": goal.current_streak,
         "total_streak": user.total_streak, # 전체 스트릭 반환
@@ -195,4 +279,48 @@ def check_goal(
         "total_cash": user.cash,
         "current_level": user.level,
         "is_level_up": is_level_up
+    })
+
+    # 랭킹 갱신 (커밋 전에 읽어둔 값 사용)
+    leaderboard.update_user(user_id, **ranking_values)
+    return body
+
+# 목표 인증 기록 (최근 기간부터)
+@router.get("/{goal_id}/history", response_model=schemas.GoalHistoryResponse)
+def read_goal_history(
+    goal_id: int,
+    limit: int = 100,
+    db: Session = Depends(get_db),
+    current_user: dict = Depends(get_current_user_info)
+):
+    user_id = int(current_user["sub"])
+    limit = max(1, min(limit, 366))
+
+    row = db.query(models.Goal.period, models.User.timezone).join(
+        models.User, models.User.id == models.Goal.user_id
+    ).filter(
+        models.Goal.goal_id == goal_id,
+        models.Goal.user_id == user_id
+    ).first()
+    if not row:
+        raise HTTPException(status_code=404, detail="목표를 찾을 수 없습니다.")
+    period, tz = row
+
+    # 최근 인증부터 (기본키 (goal_id, day) 범위 조회)
+    checkins = db.query(models.GoalCheckin.day, models.GoalCheckin.checked_at, models.GoalCheckin.cash).filter(
+        models.GoalCheckin.goal_id == goal_id
+    ).order_by(models.GoalCheckin.day.desc()).limit(limit).all()
+
+    return {
+        "goal_id": goal_id,
+        "period": periods.normalize_period(period),
+        "current_period_start": periods.period_start(period, local_date(utcnow(), tz)),
+        "items": [
+            {
+                "period_start": periods.period_start(period, day),
+                "checked_at": checked_at,
+                "gained_cash": gained_cash,
+            }
+            for day, checked_at, gained_cash in checkins
+        ],
     }
@@ -0,0 +1,72 @@
+from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy.orm import Session
+from app.database import get_db
+from app import models, schemas
+from app.core.dependencies import get_current_user_info
+from app.services.leaderboard import BOARDS, CASH, EXP, LEVEL, STREAK, leaderboard
+
+router = APIRouter()
+
+
+# (순위, user_id, 값) 목록 -> 응답 (닉네임은 한 번에 조회)
+def _entries(db: Session, rows) -> list[schemas.LeaderboardEntry]:
+    user_ids = [user_id for _, user_id, _ in rows]
+    nicknames = dict(
+        db.query(models.User.id, models.User.nickname).filter(models.User.id.in_(user_ids)).all()
+    ) if user_ids else {}
+
+    return [
+        schemas.LeaderboardEntry(
+            rank=rank,
+            user_id=user_id,
+            nickname=nicknames.get(user_id),
+            total_streak=stats[STREAK],
+            level=stats[LEVEL],
+            exp=stats[EXP],
+            cash=stats[CASH],
+        )
+        for rank, user_id, stats in rows
+    ]
+
+
+def _check_board(board: str):
+    if board not in BOARDS:
+        raise HTTPException(status_code=404, detail="랭킹 종류는 streak, level, cash 중 하나입니다.")
+
+
+# 1등부터 limit 명
+@router.get("/{board}", response_model=schemas.LeaderboardResponse)
+def get_top_ranking(
+    board: str,
+    limit: int = 10,
+    db: Session = Depends(get_db)
+):
+    _check_board(board)
+    limit = max(1, min(limit, 100))
+    leaderboard.ensure_loaded(db)
+
+    return schemas.LeaderboardResponse(
+        board=board,
+        total=len(leaderboard),
+        entries=_entries(db, leaderboard.top(board, limit)),
+    )
+
+# 내 순위 + 내 위아래 neighbours 명
+@router.get("/{board}/me", response_model=schemas.LeaderboardResponse)
+def get_my_ranking(
+    board: str,
+    neighbours: int = 5,
+    db: Session = Depends(get_db),
+    current_user: dict = Depends(get_current_user_info)
+):
+    _check_board(board)
+    user_id = int(current_user["sub"])
+    neighbours = max(0, min(neighbours, 50))
+    leaderboard.ensure_loaded(db)
+
+    return schemas.LeaderboardResponse(
+        board=board,
+        total=len(leaderboard),
+        entries=_entries(db, leaderboard.around(board, user_id, neighbours)),
+        my_rank=leaderboard.rank(board, user_id),
+    )
@@ -1,33 +1,59 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
+from sqlalchemy import insert, update
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 from app.database import get_db
 from app import models, schemas
 from app.core.dependencies import get_current_user_info
+from app.core.etag import bump_user_version, check_not_modified, check_user_not_modified
+from app.core.idempotency import Idempotency, get_idempotency
+from app.services.catalog import catalog
+from app.services.leaderboard import leaderboard
 
 router = APIRouter()
 
 # 1. 상점: 전체 마스코트 목록 보기
 @router.get("/", response_model=list[schemas.MascotResponse])
-def get_all_mascots(db: Session = Depends(get_db)):
-    return db.query(models.Mascot).all()
+def get_all_mascots(request: Request, response: Response, db: Session = Depends(get_db)):
+    snapshot = catalog.get(db)
+    not_modified = check_not_modified(request, response, snapshot.mascots_etag)
+    if not_modified:
+        return not_modified
+
+    # 도감 캐시에 미리 직렬화해 둔 JSON 을 그대로 내려줌
+    return Response(content=snapshot.mascots_json, media_type="application/json", headers=response.headers)
 
 # 🟢 [핵심 수정] 내 마스코트 목록 (없으면 기본 지급)
 @router.get("/my", response_model=list[schemas.UserMascotResponse])
 def get_my_mascots(
+    request: Request,
+    response: Response,
     db: Session = Depends(get_db),
     current_user: dict = Depends(get_current_user_info)
 ):
     user_id = int(current_user["sub"])
-    
+
+    # 바뀐 게 없으면 304
+    not_modified = check_user_not_modified(request, response, db, user_id, "mascots-my")
+    if not_modified:
+        return not_modified
+
     return db.query(models.UserMascot).filter(models.UserMascot.user_id == user_id).all()
 
 # 현재 장착 중인 마스코트 조회
 @router.get("/equipped", response_model=schemas.UserMascotResponse)
 def get_equipped_mascot(
+    request: Request,
+    response: Response,
     db: Session = Depends(get_db),
     current_user: dict = Depends(get_current_user_info)
 ):
     user_id = int(current_user["sub"])
+
+    # 바뀐 게 없으면 304
+    not_modified = check_user_not_modified(request, response, db, user_id, "mascots-equipped")
+    if not_modified:
+        return not_modified
     
     # 장착된 놈 찾기
     equipped = db.query(models.UserMascot).filter(
@@ -41,34 +67,49 @@ def get_equipped_mascot(
 def buy_mascot(
     mascot_id: int,
     db: Session = Depends(get_db),
-    current_user: dict = Depends(get_current_user_info)
+    current_user: dict = Depends(get_current_user_info),
+    idempotency: Idempotency = Depends(get_idempotency)
 ):
     user_id = int(current_user["sub"])
-    
-    user = db.query(models.User).filter(models.User.id == user_id).first()
-    mascot = db.query(models.Mascot).filter(models.Mascot.mascot_id == mascot_id).first()
+
+    # 같은 Idempotency-Key 로 이미 처리된 구매(앱 재시도)면 그때 응답 그대로 (이중 결제 방지)
+    # (동시에 들어온 재시도는 키 선점에서 앞의 요청이 끝나길 기다렸다가 그 응답을 받음)
+    replayed = idempotency.claim(db)
+    if replayed is not None:
+        return replayed
+
+    mascot = catalog.get(db).mascots.get(mascot_id)
     
     if not mascot:
         raise HTTPException(status_code=404, detail="Mascot not found")
 
-    existing = db.query(models.UserMascot).filter(
-        models.UserMascot.user_id == user_id,
-        models.UserMascot.mascot_id == mascot_id
-    ).first()
-    
-    if existing:
-        raise HTTPException(status_code=400, detail="이미 가지고 있는 마스코트입니다.")
-    
-    if user.cash < mascot.price:
+    # 잔액이 충분할 때만 차감 (UPDATE ... WHERE cash >= price)
+    # 유저 행을 먼저 잠가야 같은 유저의 동시 구매끼리 데드락이 나지 않음
+    paid = db.execute(
+        update(models.User)
+        .where(models.User.id == user_id, models.User.cash >= mascot.price)
+        .values(cash=models.User.cash - mascot.price)
+    )
+    if paid.rowcount == 0:
+        db.rollback()
         raise HTTPException(status_code=400, detail="캐시가 부족합니다.")
-    
-    user.cash -= mascot.price
-    new_user_mascot = models.UserMascot(user_id=user.id, mascot_id=mascot.mascot_id, is_active=False)
-    
-    db.add(new_user_mascot)
-    db.commit()
-    
-    return {"message": f"{mascot.name} 구매 완료!", "remaining_cash": user.cash}
+
+    # 보유 목록에 추가 (이미 있으면 유니크 제약 위반 -> 차감도 함께 롤백)
+    try:
+        db.execute(insert(models.UserMascot).values(user_id=user_id, mascot_id=mascot_id, is_active=False))
+    except IntegrityError:
+        db.rollback()
+        replayed = idempotency.replay(db)
+        if replayed is not None:
+            return replayed
+        raise HTTPException(status_code=400, detail="이미 가지고 있는 마스코트입니다.")
+
+    remaining_cash = db.query(models.User.cash).filter(models.User.id == user_id).scalar()
+    bump_user_version(db, user_id)
+
+    body = idempotency.commit(db, {"message": f"{mascot.name} 구매 완료!", "remaining_cash": remaining_cash})
+    leaderboard.update_user(user_id, cash=body["remaining_cash"])
+    return body
 
 # 4. 마스코트 장착하기
 @router.post("/{mascot_id}/equip")
@@ -92,6 +133,7 @@ def equip_mascot(
     
     # 2. 선택한 것 장착
     my_mascot.is_active = True
+    bump_user_version(db, user_id)
     db.commit()
     
     return {"message": "마스코트 장착 완료!"}
\ No newline at end of file
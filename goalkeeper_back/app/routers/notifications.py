@@ -0,0 +1,169 @@
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy import and_, or_
+from sqlalchemy.orm import Session
+from app.database import get_db
+from app import models, schemas
+from app.core.config import settings
+from app.core.cursor import decode_cursor, encode_cursor
+from app.core.dependencies import get_current_user_info
+from app.services.notifications import (
+    NOTIFICATION_TYPES,
+    blocked_types,
+    invalidate_blocks,
+    mark_read,
+    publish_notifications,
+    send_notifications,
+)
+
+router = APIRouter()
+
+# 받은 알림함 (최신순, 커서 방식)
+@router.get("/", response_model=schemas.NotificationPage)
+def get_my_notifications(
+    cursor: Optional[str] = None,
+    limit: int = 20,
+    unread_only: bool = False,
+    db: Session = Depends(get_db),
+    current_user: dict = Depends(get_current_user_info)
+):
+    user_id = int(current_user["sub"])
+    limit = max(1, min(limit, 50))
+
+    # (receiver_id, is_read, created_at) 인덱스 범위 탐색
+    query = db.query(models.Notification).filter(models.Notification.receiver_id == user_id)
+    if unread_only:
+        query = query.filter(models.Notification.is_read == False)
+
+    if cursor:
+        last_created_at, last_id = decode_cursor(cursor)
+        query = query.filter(
+            or_(
+                models.Notification.created_at < last_created_at,
+                and_(
+                    models.Notification.created_at == last_created_at,
+                    models.Notification.notification_id < last_id,
+                ),
+            )
+        )
+
+    # 다음 페이지가 있는지 알기 위해 1개 더 가져옴
+    notifications = (
+        query.order_by(models.Notification.created_at.desc(), models.Notification.notification_id.desc())
+        .limit(limit + 1)
+        .all()
+    )
+
+    next_cursor = None
+    if len(notifications) > limit:
+        notifications = notifications[:limit]
+        next_cursor = encode_cursor(notifications[-1].created_at, notifications[-1].notification_id)
+
+    # 안 읽은 알림 수는 users 에 유지 중인 카운터
+    unread_count = db.query(models.User.unread_notifications).filter(models.User.id == user_id).scalar() or 0
+
+    return schemas.NotificationPage(items=notifications, next_cursor=next_cursor, unread_count=unread_count)
+
+# 깨우기 (여러 명에게 한 번에)
+@router.post("/wake-up")
+def send_wake_up(
+    req: schemas.WakeUpRequest,
+    db: Session = Depends(get_db),
+    current_user: dict = Depends(get_current_user_info)
+):
+    user_id = int(current_user["sub"])
+
+    receiver_ids = [receiver_id for receiver_id in dict.fromkeys(req.receiver_ids) if receiver_id != user_id]
+    if not receiver_ids:
+        raise HTTPException(status_code=400, detail="깨울 친구를 선택해 주세요.")
+    if len(receiver_ids) > settings.NOTIFICATION_MAX_RECEIVERS:
+        raise HTTPException(status_code=400, detail=f"한 번에 최대 {settings.NOTIFICATION_MAX_RECEIVERS}명까지 깨울 수 있습니다.")
+
+    sender = db.query(models.User.nickname).filter(models.User.id == user_id).first()
+    if not sender:
+        raise HTTPException(status_code=404, detail="User not found")
+
+    # 없는 유저는 제외 (쿼리 한 번)
+    existing = {
+        receiver_id for (receiver_id,) in
+        db.query(models.User.id).filter(models.User.id.in_(receiver_ids))
+    }
+    receiver_ids = [receiver_id for receiver_id in receiver_ids if receiver_id in existing]
+
+    # 목표를 찍어서 깨우는 경우: 받는 사람의 목표여야 함
+    if req.goal_id is not None:
+        goal_owner = db.query(models.Goal.user_id).filter(models.Goal.goal_id == req.goal_id).scalar()
+        if goal_owner is None or goal_owner not in receiver_ids:
+            raise HTTPException(status_code=400, detail="받는 사람의 목표가 아닙니다.")
+
+    message = req.message or f"{sender.nickname}님이 깨웠어요! 오늘 목표를 달성해 보세요 ⏰"
+    delivered = send_notifications(db, user_id, receiver_ids, "wake_up", message, req.goal_id)
+    db.commit()
+    publish_notifications(delivered, user_id, "wake_up", message, req.goal_id)
+
+    return {"message": f"{len(delivered)}명을 깨웠습니다!", "delivered": delivered}
+
+# 읽음 처리 (notification_ids 가 없으면 전부)
+@router.post("/read")
+def read_notifications(
+    req: schemas.NotificationReadRequest,
+    db: Session = Depends(get_db),
+    current_user: dict = Depends(get_current_user_info)
+):
+    user_id = int(current_user["sub"])
+
+    updated = mark_read(db, user_id, req.notification_ids)
+    db.commit()
+
+    unread_count = db.query(models.User.unread_notifications).filter(models.User.id == user_id).scalar() or 0
+    return {"updated": updated, "unread_count": unread_count}
+
+# 내가 차단한 알림 종류
+@router.get("/blocks", response_model=list[str])
+def get_my_blocks(
+    db: Session = Depends(get_db),
+    current_user: dict = Depends(get_current_user_info)
+):
+    user_id = int(current_user["sub"])
+    return sorted(blocked_types(db, [user_id])[user_id])
+
+# 알림 종류 차단
+@router.put("/blocks/{notification_type}")
+def block_notification_type(
+    notification_type: str,
+    db: Session = Depends(get_db),
+    current_user: dict = Depends(get_current_user_info)
+):
+    user_id = int(current_user["sub"])
+    if notification_type not in NOTIFICATION_TYPES:
+        raise HTTPException(status_code=400, detail="알 수 없는 알림 종류입니다.")
+
+    already = db.query(models.NotificationBlock.block_id).filter(
+        models.NotificationBlock.user_id == user_id,
+        models.NotificationBlock.notification_type == notification_type
+    ).first()
+    if not already:
+        db.add(models.NotificationBlock(user_id=user_id, notification_type=notification_type))
+        db.commit()
+    invalidate_blocks(user_id)
+
+    return {"message": "알림을 차단했습니다."}
+
+# 알림 종류 차단 해제
+@router.delete("/blocks/{notification_type}")
+def unblock_notification_type(
+    notification_type: str,
+    db: Session = Depends(get_db),
+    current_user: dict = Depends(get_current_user_info)
+):
+    user_id = int(current_user["sub"])
+
+    db.query(models.NotificationBlock).filter(
+        models.NotificationBlock.user_id == user_id,
+        models.NotificationBlock.notification_type == notification_type
+    ).delete(synchronize_session=False)
+    db.commit()
+    invalidate_blocks(user_id)
+
+    return {"message": "알림 차단을 해제했습니다."}
@@ -1,14 +1,22 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
 from sqlalchemy.orm import Session
 from app.database import get_db
 from app import models, schemas
 from app.core.dependencies import get_current_user_info
+from app.core.etag import bump_user_version, check_not_modified, make_etag
+from app.core.timeutil import is_valid_timezone
+from app.services.catalog import catalog
+from app.services.leaderboard import leaderboard
+from app.services.notifications import delete_user_notifications
+from app.services.reactions import delete_user_post_reactions
 
 router = APIRouter()
 
 # 1. 내 프로필 조회 (마이페이지용)
 @router.get("/me", response_model=schemas.UserResponse)
 def get_my_profile(
+    request: Request,
+    response: Response,
     db: Session = Depends(get_db),
     current_user: dict = Depends(get_current_user_info)
 ):
@@ -17,9 +25,72 @@ def get_my_profile(
     
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
+
+    # 바뀐 게 없으면 직렬화 없이 304
+    not_modified = check_not_modified(request, response, make_etag("me", user.id, user.data_version))
+    if not_modified:
+        return not_modified
     
     return user
 
+# 캐릭터/꾸미기 화면용: 프로필 + 보유/장착 마스코트 + 보유/장착 액세서리를 한 번에
+# 쿼리는 유저 1번 + 보유 마스코트 1번 + 보유 액세서리 1번 (상세 정보는 도감 캐시, 장착 여부는 보유 목록에서 계산)
+@router.get("/me/wardrobe", response_model=schemas.WardrobeResponse)
+def get_my_wardrobe(
+    request: Request,
+    response: Response,
+    db: Session = Depends(get_db),
+    current_user: dict = Depends(get_current_user_info)
+):
+    user_id = int(current_user["sub"])
+    user = db.query(models.User).filter(models.User.id == user_id).first()
+
+    if not user:
+        raise HTTPException(status_code=404, detail="User not found")
+
+    # 유저 데이터도 도감도 바뀐 게 없으면 304
+    snapshot = catalog.get(db)
+    etag = make_etag(
+        "wardrobe", user.id, user.data_version,
+        snapshot.mascots_etag.strip('"'), snapshot.accessories_etag.strip('"'),
+    )
+    not_modified = check_not_modified(request, response, etag)
+    if not_modified:
+        return not_modified
+
+    mascots = [
+        schemas.UserMascotResponse(
+            id=row.id,
+            user_id=row.user_id,
+            mascot_id=row.mascot_id,
+            mascot=snapshot.mascots[row.mascot_id],
+            is_active=row.is_active,
+            acquired_at=row.acquired_at,
+        )
+        for row in db.query(models.UserMascot).filter(models.UserMascot.user_id == user_id)
+        if row.mascot_id in snapshot.mascots
+    ]
+    accessories = [
+        schemas.UserAccessoryResponse(
+            id=row.id,
+            user_id=row.user_id,
+            accessory_id=row.accessory_id,
+            accessory=snapshot.accessories[row.accessory_id],
+            is_active=row.is_active,
+            acquired_at=row.acquired_at,
+        )
+        for row in db.query(models.UserAccessory).filter(models.UserAccessory.user_id == user_id)
+        if row.accessory_id in snapshot.accessories
+    ]
+
+    return schemas.WardrobeResponse(
+        profile=schemas.UserResponse.model_validate(user),
+        mascots=mascots,
+        equipped_mascot=next((m for m in mascots if m.is_active), None),
+        accessories=accessories,
+        equipped_accessories=[a for a in accessories if a.is_active],
+    )
+
 # 내 정보 수정 (닉네임 + 이메일)
 @router.patch("/me", response_model=schemas.UserResponse)
 def update_my_profile(
@@ -40,7 +111,14 @@ def update_my_profile(
     # 카카오라서 못 받았던 이메일, 여기서 수정 가능!
     if user_update.email:
         user.email = user_update.email
+
+    # 시간대 (스트릭의 '오늘/어제' 기준)
+    if user_update.timezone:
+        if not is_valid_timezone(user_update.timezone):
+            raise HTTPException(status_code=400, detail="알 수 없는 시간대입니다.")
+        user.timezone = user_update.timezone
     
+    bump_user_version(db, user_id)
     db.commit()
     db.refresh(user)
     return user
@@ -57,7 +135,12 @@ def withdraw_account(
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
     
+    # 내 게시글에 달린 반응/카운터는 묶어서 먼저 삭제 (게시글은 아래 ORM cascade 로 삭제)
+    delete_user_post_reactions(db, user_id)
+    # 주고받은 알림 / 알림 차단 설정도 삭제
+    delete_user_notifications(db, user_id)
     db.delete(user)
     db.commit()
+    leaderboard.remove_user(user_id)
     
     return {"message": "회원 탈퇴가 완료되었습니다. 모든 정보가 삭제되었습니다."}
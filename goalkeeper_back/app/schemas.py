@@ -1,6 +1,6 @@
 from pydantic import BaseModel
-from typing import Optional
-from datetime import datetime
+from typing import List, Optional
+from datetime import date, datetime
 from typing import Dict 
 
 # 목표 
@@ -20,9 +20,33 @@ class GoalResponse(BaseModel):
 
     current_streak: int 
     last_verified_at: Optional[datetime]
+    period_start: Optional[date] = None # 마지막으로 인증한 기간의 시작일
     class Config:
         from_attributes = True
 
+# 목표 인증 기록 (기간별)
+class GoalHistoryItem(BaseModel):
+    period_start: date
+    checked_at: datetime
+    gained_cash: int
+
+class GoalHistoryResponse(BaseModel):
+    goal_id: int
+    period: str
+    current_period_start: date
+    items: List[GoalHistoryItem]
+
+# 인증 달력 (bitmap: base64, i 번째 비트 = from + i 일에 인증, 바이트 안에서는 낮은 비트부터)
+class GoalCalendarItem(BaseModel):
+    goal_id: int
+    bitmap: str
+
+class GoalCalendarResponse(BaseModel):
+    from_date: date
+    to_date: date
+    days: int
+    goals: List[GoalCalendarItem]
+
 class GoalUpdate(BaseModel):
     title: Optional[str] = None
     category: Optional[str] = None
@@ -42,6 +66,7 @@ class PostResponse(BaseModel):
     nickname: str
     content: str
     image_url: Optional[str] = None # 사진 주소 (없을 수도 있음)
+    image_variants: Dict[str, str] = {}  # 크기별 사진 주소 {"thumb", "feed", "full"} (변환 전이면 비어 있음)
     created_at: datetime
     
     reaction_counts: Dict[str, int] = {}  # 예: {"👍": 5, "❤️": 2}
@@ -49,6 +74,57 @@ class PostResponse(BaseModel):
 
     class Config:
         from_attributes = True
+
+# 커서 방식 게시글 목록 (next_cursor 가 None 이면 마지막 페이지)
+class PostPage(BaseModel):
+    items: List[PostResponse]
+    next_cursor: Optional[str] = None
+
+# 알림
+class NotificationResponse(BaseModel):
+    notification_id: int
+    sender_id: int
+    type: str
+    goal_id: Optional[int] = None
+    message: Optional[str] = None
+    created_at: datetime
+    is_read: bool
+
+    class Config:
+        from_attributes = True
+
+# 커서 방식 알림함 (next_cursor 가 None 이면 마지막 페이지)
+class NotificationPage(BaseModel):
+    items: List[NotificationResponse]
+    next_cursor: Optional[str] = None
+    unread_count: int
+
+# 깨우기 (여러 명에게 한 번에)
+class WakeUpRequest(BaseModel):
+    receiver_ids: List[int]
+    goal_id: Optional[int] = None
+    message: Optional[str] = None
+
+# 읽음 처리 (notification_ids 가 없으면 전부)
+class NotificationReadRequest(BaseModel):
+    notification_ids: Optional[List[int]] = None
+
+# 랭킹
+class LeaderboardEntry(BaseModel):
+    rank: int
+    user_id: int
+    nickname: Optional[str] = None
+    total_streak: int
+    level: int
+    exp: int
+    cash: int
+
+class LeaderboardResponse(BaseModel):
+    board: str # streak, level, cash
+    total: int # 랭킹에 있는 전체 유저 수
+    entries: List[LeaderboardEntry]
+    my_rank: Optional[int] = None
+
 class SocialLoginRequest(BaseModel):
     token: str  # 앱이 카카오/구글 SDK에서 받아온 액세스 토큰
 
@@ -85,6 +161,7 @@ class UserMascotResponse(BaseModel):
 class UserUpdate(BaseModel):
     nickname: Optional[str] = None  
     email: Optional[str] = None
+    timezone: Optional[str] = None # 예: "Asia/Seoul"
 
 # 2. 유저 정보를 보여줄 때 쓰는 양식 (명함)
 class UserResponse(BaseModel):
@@ -97,6 +174,8 @@ class UserResponse(BaseModel):
     provider: Optional[str]
     total_streak: int 
     last_check_date: Optional[datetime] 
+    timezone: str
+    unread_notifications: int = 0
 
     class Config:
         from_attributes = True
@@ -129,3 +208,11 @@ class UserAccessoryResponse(BaseModel):
     class Config:
         from_attributes = True
 
+
+# --- 캐릭터/꾸미기 화면 한 번에 조회 (Wardrobe) ---
+class WardrobeResponse(BaseModel):
+    profile: UserResponse
+    mascots: List[UserMascotResponse]                       # 보유 마스코트
+    equipped_mascot: Optional[UserMascotResponse] = None    # 장착 중인 마스코트
+    accessories: List[UserAccessoryResponse]                # 보유 액세서리
+    equipped_accessories: List[UserAccessoryResponse] = []  # 장착 중인 액세서리
@@ -0,0 +1,124 @@
+# app/services/catalog.py
+# 마스코트 / 액세서리 도감 캐시
+# 도감은 init_db 시드 때만 바뀌므로 한 번 읽어서 응답 모델 + 직렬화된 JSON 바이트로 들고 있음
+# Mascot / Accessory 행이 바뀌면(insert/update/delete) 자동으로 무효화되고 다음 조회 때 다시 읽음
+import hashlib
+import json
+import threading
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Mapping, Optional, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session, object_session
+
+from app import models, schemas
+
+
+@dataclass(frozen=True)
+class CatalogSnapshot:
+    version: int
+    mascots: Mapping[int, schemas.MascotResponse]
+    accessories: Mapping[int, schemas.AccessoryResponse]
+    mascots_json: bytes
+    accessories_json: bytes
+    mascots_etag: str
+    accessories_etag: str
+
+    # 이름으로 id 찾기 (기본 지급 아이템 등)
+    def find_mascot_id(self, name: str) -> Optional[int]:
+        return next((m.mascot_id for m in self.mascots.values() if m.name == name), None)
+
+    def find_accessory_id(self, name: str) -> Optional[int]:
+        return next((a.accessory_id for a in self.accessories.values() if a.name == name), None)
+
+    # 같은 type 의 액세서리 id 목록 (장착 시 같은 부위 해제용)
+    def accessory_ids_of_type(self, item_type: Optional[str]) -> Tuple[int, ...]:
+        return tuple(
+            accessory_id
+            for accessory_id, accessory in self.accessories.items()
+            if accessory.type == item_type
+        )
+
+
+# 내용 해시로 만든 ETag (워커가 여러 개여도 같은 값)
+def _etag(body: bytes) -> str:
+    return '"' + hashlib.sha256(body).hexdigest()[:16] + '"'
+
+
+def _to_json(items) -> bytes:
+    return json.dumps(
+        [item.model_dump(mode="json") for item in items],
+        ensure_ascii=False,
+        separators=(",", ":"),
+    ).encode()
+
+
+class CatalogCache:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._version = 0
+        self._snapshot: Optional[CatalogSnapshot] = None
+
+    @property
+    def version(self) -> int:
+        return self._version
+
+    def get(self, db: Session) -> CatalogSnapshot:
+        snapshot = self._snapshot
+        if snapshot is not None:
+            return snapshot
+
+        with self._lock:
+            if self._snapshot is None:
+                self._snapshot = self._load(db)
+            return self._snapshot
+
+    def invalidate(self):
+        with self._lock:
+            self._version += 1
+            self._snapshot = None
+
+    def _load(self, db: Session) -> CatalogSnapshot:
+        mascots = [
+            schemas.MascotResponse.model_validate(row)
+            for row in db.query(models.Mascot).order_by(models.Mascot.mascot_id)
+        ]
+        accessories = [
+            schemas.AccessoryResponse.model_validate(row)
+            for row in db.query(models.Accessory).order_by(models.Accessory.accessory_id)
+        ]
+        mascots_json = _to_json(mascots)
+        accessories_json = _to_json(accessories)
+        return CatalogSnapshot(
+            version=self._version,
+            mascots=MappingProxyType({m.mascot_id: m for m in mascots}),
+            accessories=MappingProxyType({a.accessory_id: a for a in accessories}),
+            mascots_json=mascots_json,
+            accessories_json=accessories_json,
+            mascots_etag=_etag(mascots_json),
+            accessories_etag=_etag(accessories_json),
+        )
+
+
+catalog = CatalogCache()
+
+
+# 도감 행이 바뀌면 캐시 무효화
+# flush 시점에 한 번, commit 이 끝난 뒤 한 번 더 (commit 전에 다른 요청이 옛 값을 다시 읽어가는 경우 대비)
+def _mark_catalog_changed(mapper, connection, target):
+    session = object_session(target)
+    if session is not None:
+        session.info["catalog_changed"] = True
+    catalog.invalidate()
+
+
+for _model in (models.Mascot, models.Accessory):
+    for _event_name in ("after_insert", "after_update", "after_delete"):
+        event.listen(_model, _event_name, _mark_catalog_changed)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_after_commit(session):
+    if session.info.pop("catalog_changed", False):
+        catalog.invalidate()
@@ -0,0 +1,30 @@
+# 목표 인증 기록(goal_checkin) 조회
+# 달력: 기간 안의 인증을 (user_id, day, goal_id) 인덱스 범위 조회 한 번으로 읽고
+#       목표마다 "하루 = 1비트" 비트맵(base64)으로 압축 (1년치 = 46바이트 -> base64 64자)
+import base64
+from datetime import date
+
+from sqlalchemy.orm import Session
+
+from app import models
+
+MAX_CALENDAR_DAYS = 366
+
+
+# i 번째 비트 = start + i 일에 인증했는지 (바이트 안에서는 낮은 비트부터)
+def calendar_bitmaps(db: Session, user_id: int, start: date, end: date) -> dict[int, str]:
+    num_days = (end - start).days + 1
+    bitmaps: dict[int, bytearray] = {}
+
+    rows = db.query(models.GoalCheckin.goal_id, models.GoalCheckin.day).filter(
+        models.GoalCheckin.user_id == user_id,
+        models.GoalCheckin.day.between(start, end)
+    )
+    for goal_id, day in rows:
+        bits = bitmaps.get(goal_id)
+        if bits is None:
+            bits = bitmaps[goal_id] = bytearray((num_days + 7) // 8)
+        i = (day - start).days
+        bits[i >> 3] |= 1 << (i & 7)
+
+    return {goal_id: base64.b64encode(bits).decode() for goal_id, bits in bitmaps.items()}
@@ -0,0 +1,134 @@
+# app/services/images.py
+# 게시글 사진 후처리: EXIF 제거 + 최대 크기 제한 + 크기별 버전(thumb/feed/full) 생성
+# 업로드 요청을 막지 않도록 백그라운드 스레드 풀에서 실행됨 (원본의 메타데이터 제거만 저장할 때 바로 실행)
+import os
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, Optional
+
+from PIL import Image, ImageOps
+
+from app.core.cache import TTLCache
+from app.core.config import settings
+
+# 버전 이름 -> 최대 가로/세로 픽셀 (작은 것부터, full 을 마지막에 만들어서 full 이 있으면 완료된 것)
+VARIANT_SIZES = {
+    "thumb": 240,
+    "feed": 720,
+    "full": 1440,
+}
+VARIANT_FORMAT = settings.IMAGE_VARIANT_FORMAT.lower()
+VARIANT_EXT = "jpg" if VARIANT_FORMAT == "jpeg" else VARIANT_FORMAT
+VARIANT_DIR = os.path.join(settings.UPLOAD_DIR, "variants")
+
+if not os.path.exists(VARIANT_DIR):
+    os.makedirs(VARIANT_DIR)
+
+_executor = ThreadPoolExecutor(max_workers=settings.IMAGE_WORKERS, thread_name_prefix="image-variant")
+
+# 파일명 -> 변환 버전이 다 만들어졌는지 (피드/검색 렌더링마다 글 수만큼 파일을 확인하지 않도록)
+# - 이 서버에서 변환을 마치면 바로 True 로 기록 (만료 없음)
+# - 모르는 파일(다른 서버에서 변환, 서버 재시작 등)은 한 번만 확인해서 기록, 아직 없으면 잠깐 뒤 다시 확인
+_variants_ready = TTLCache(maxsize=100_000, ttl=60)
+
+
+def variant_filename(filename: str, name: str) -> str:
+    stem = os.path.splitext(filename)[0]
+    return f"{stem}_{name}.{VARIANT_EXT}"
+
+
+# 게시글 image_url -> {"thumb": url, "feed": url, "full": url}
+# 아직 변환 중이거나 변환 전인 사진은 빈 dict (앱은 image_url 을 그대로 쓰면 됨)
+def variant_urls(image_url: Optional[str]) -> Dict[str, str]:
+    if not image_url or not image_url.startswith("/static/"):
+        return {}
+
+    filename = image_url.replace("/static/", "")
+    ready = _variants_ready.get(filename)
+    if ready is None:
+        ready = os.path.exists(os.path.join(VARIANT_DIR, variant_filename(filename, "full")))
+        _variants_ready.set(filename, ready, expires_at=float("inf") if ready else None)
+    if not ready:
+        return {}
+
+    return {name: f"/static/variants/{variant_filename(filename, name)}" for name in VARIANT_SIZES}
+
+
+# uploads 폴더의 사진 하나를 변환 (이미 만들어진 버전은 건너뜀)
+def process_image(filename: str):
+    source_path = os.path.join(settings.UPLOAD_DIR, filename)
+
+    with Image.open(source_path) as source:
+        # 사진 방향(EXIF Orientation)을 픽셀에 반영한 뒤 EXIF 는 버림
+        image = ImageOps.exif_transpose(source)
+        if image.mode not in ("RGB", "RGBA") or VARIANT_FORMAT == "jpeg":
+            image = image.convert("RGB")
+
+        for name, max_size in VARIANT_SIZES.items():
+            target_path = os.path.join(VARIANT_DIR, variant_filename(filename, name))
+            if os.path.exists(target_path):
+                continue
+
+            resized = image.copy()
+            resized.thumbnail((max_size, max_size), Image.LANCZOS)
+
+            # 다 쓴 뒤에 이름을 바꿔서, 만들다 만 파일이 노출되지 않도록 함
+            tmp_path = f"{target_path}.part"
+            resized.save(tmp_path, format=VARIANT_FORMAT.upper(), quality=80)
+            os.replace(tmp_path, target_path)
+
+    _variants_ready.set(filename, True, expires_at=float("inf"))
+
+
+# 업로드된 원본에서 메타데이터(EXIF 의 GPS 위치, 촬영 기기 등) 제거 - 같은 형식으로 다시 인코딩해서 덮어씀
+# 원본도 image_url 로 그대로 내려가므로, 저장하기 전에 반드시 거쳐야 함
+def strip_metadata(path: str, image_format: str):
+    pil_format = image_format.upper()
+    tmp_path = f"{path}.clean"
+
+    with Image.open(path) as source:
+        options = {"format": pil_format}
+        if source.info.get("icc_profile"):
+            options["icc_profile"] = source.info["icc_profile"]
+
+        if getattr(source, "is_animated", False):
+            # 움짤은 프레임을 모두 유지 (방향 정보는 거의 없으므로 그대로)
+            image = source
+            options.update(save_all=True, duration=source.info.get("duration"), loop=source.info.get("loop", 0))
+        else:
+            # 사진 방향(EXIF Orientation)을 픽셀에 반영한 뒤 EXIF 는 버림
+            image = ImageOps.exif_transpose(source)
+
+        if pil_format in ("JPEG", "WEBP"):
+            options["quality"] = 95
+        image.info.pop("comment", None)
+
+        try:
+            image.save(tmp_path, **options)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    os.replace(tmp_path, path)
+
+
+def _process_image_safely(filename: str):
+    try:
+        process_image(filename)
+    except Exception as e:
+        # 변환에 실패해도 원본은 그대로 쓸 수 있으므로 로그만 남김
+        print(f"⚠️ 사진 변환 실패 ({filename}): {e}")
+
+
+# 백그라운드에서 변환 시작
+def submit_image_processing(filename: str) -> Future:
+    return _executor.submit(_process_image_safely, filename)
+
+
+# 원본 사진을 지울 때 변환된 버전도 같이 삭제
+def delete_variants(filename: str):
+    _variants_ready.pop(filename)
+    for name in VARIANT_SIZES:
+        path = os.path.join(VARIANT_DIR, variant_filename(filename, name))
+        if os.path.exists(path):
+            os.remove(path)
@@ -0,0 +1,235 @@
+# 랭킹 (연속 달성 / 레벨 / 코인)
+# - 유저 전체를 점수순으로 정렬해서 메모리에 들고 있음 (ORDER BY 전체 스캔 없음)
+#   1000개 단위로 나눈 정렬 배열들(_SortedKeys) -> 순위 = 이분 탐색 2번 + 앞 배열 개수 합(펜윅 트리) -> O(log n)
+#   하나의 큰 배열이면 갱신할 때마다 수백만 개를 밀어야 하지만, 여기서는 작은 배열 하나만 밀면 됨
+# - check_goal / 구매 후에 그 유저 값만 갱신 (빼고 다시 끼워 넣기)
+# - 다른 서버(워커)에서 바뀐 값, 스트릭 정리 작업 등은 주기적인 전체 재계산으로 맞춤 (app/jobs/scheduler.py)
+import threading
+from bisect import bisect_left, insort
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app import models
+from app.core.blocking import run_blocking
+
+# 유저별 값 순서
+STREAK, LEVEL, EXP, CASH = range(4)
+FIELDS = {"total_streak": STREAK, "level": LEVEL, "exp": EXP, "cash": CASH}
+
+
+# 정렬 키 (작을수록 높은 순위, 같으면 먼저 가입한 유저가 위)
+def _streak_key(user_id: int, stats: list) -> tuple:
+    return (-stats[STREAK], user_id)
+
+
+def _level_key(user_id: int, stats: list) -> tuple:
+    return (-stats[LEVEL], -stats[EXP], user_id)
+
+
+def _cash_key(user_id: int, stats: list) -> tuple:
+    return (-stats[CASH], user_id)
+
+
+BOARDS = {"streak": _streak_key, "level": _level_key, "cash": _cash_key}
+
+
+class _SortedKeys:
+    LOAD = 1000
+
+    def __init__(self, keys: list):
+        # keys 는 이미 정렬된 상태로 받음
+        self._lists = [keys[i:i + self.LOAD] for i in range(0, len(keys), self.LOAD)]
+        self._maxes = [sub[-1] for sub in self._lists]
+        self._len = len(keys)
+        self._build_tree()
+
+    # 배열별 개수의 펜윅 트리 (앞 구간 개수 합/위치 찾기를 O(log n) 으로)
+    def _build_tree(self):
+        tree = [0, *map(len, self._lists)]
+        for i in range(1, len(tree)):
+            j = i + (i & -i)
+            if j < len(tree):
+                tree[j] += tree[i]
+        self._tree = tree
+
+    def _bump(self, i: int, delta: int):
+        i += 1
+        while i < len(self._tree):
+            self._tree[i] += delta
+            i += i & -i
+
+    # i 번째 배열 앞에 있는 키 수
+    def _count_before(self, i: int) -> int:
+        total = 0
+        while i > 0:
+            total += self._tree[i]
+            i -= i & -i
+        return total
+
+    def __len__(self):
+        return self._len
+
+    def add(self, key: tuple):
+        self._len += 1
+        if not self._lists:
+            self._lists, self._maxes = [[key]], [key]
+            self._build_tree()
+            return
+
+        i = min(bisect_left(self._maxes, key), len(self._maxes) - 1)
+        sub = self._lists[i]
+        insort(sub, key)
+        self._maxes[i] = sub[-1]
+        if len(sub) > 2 * self.LOAD:
+            self._lists[i:i + 1] = [sub[:self.LOAD], sub[self.LOAD:]]
+            self._maxes[i:i + 1] = [sub[self.LOAD - 1], sub[-1]]
+            self._build_tree()
+        else:
+            self._bump(i, 1)
+
+    def remove(self, key: tuple):
+        i = bisect_left(self._maxes, key)
+        if i == len(self._maxes):
+            return
+        sub = self._lists[i]
+        j = bisect_left(sub, key)
+        if j == len(sub) or sub[j] != key:
+            return
+
+        self._len -= 1
+        del sub[j]
+        if sub:
+            self._maxes[i] = sub[-1]
+            self._bump(i, -1)
+        else:
+            del self._lists[i], self._maxes[i]
+            self._build_tree()
+
+    # key 보다 앞에 있는 키 수 (= 순위 - 1)
+    def index(self, key: tuple) -> int:
+        i = bisect_left(self._maxes, key)
+        if i == len(self._maxes):
+            return self._len
+        return self._count_before(i) + bisect_left(self._lists[i], key)
+
+    def __getitem__(self, position: int) -> tuple:
+        # 펜윅 트리를 따라 내려가며 position 이 들어 있는 배열 찾기
+        i, step = 0, 1 << (len(self._tree) - 1).bit_length()
+        while step:
+            if i + step < len(self._tree) and self._tree[i + step] <= position:
+                i += step
+                position -= self._tree[i]
+            step >>= 1
+        return self._lists[i][position]
+
+
+class Leaderboard:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._load_lock = threading.Lock()  # 첫 로드용 (갱신/조회용 _lock 과 따로)
+        self._loaded = False
+        self._stats: Dict[int, list] = {}
+        self._sorted: Dict[str, _SortedKeys] = {board: _SortedKeys([]) for board in BOARDS}
+
+    def _load_rows(self, db: Session) -> Dict[int, list]:
+        User = models.User
+        rows = db.execute(select(User.id, User.total_streak, User.level, User.exp, User.cash))
+        return {
+            user_id: [streak or 0, level or 1, exp or 0, cash or 0]
+            for user_id, streak, level, exp, cash in rows
+        }
+
+    @staticmethod
+    def _sort_boards(stats: Dict[int, list]) -> Dict[str, "_SortedKeys"]:
+        return {
+            board: _SortedKeys(sorted(key(user_id, values) for user_id, values in stats.items()))
+            for board, key in BOARDS.items()
+        }
+
+    # DB 에서 전체 다시 읽어서 정렬 (정렬은 잠금 밖에서 + 비동기 스택에서는 스레드풀에서, 교체만 잠금 안에서)
+    def rebuild(self, db: Session):
+        stats = self._load_rows(db)
+        sorted_keys = run_blocking(self._sort_boards, stats)
+        with self._lock:
+            self._stats = stats
+            self._sorted = sorted_keys
+            self._loaded = True
+
+    # 처음 한 번만 전체 로드 (서버 시작 직후 요청이 몰려도 전체 조회/정렬은 한 번만)
+    # 로드 중에는 DB 조회/정렬을 기다리느라 비동기 스택에서 이벤트 루프로 돌아가므로,
+    # 잠금도 run_blocking 으로 스레드풀에서 잡음 (루프 스레드에서 기다리면 잠금을 가진 요청이 영영 진행되지 못함)
+    def ensure_loaded(self, db: Session):
+        if self._loaded:
+            return
+        run_blocking(self._load_lock.acquire)
+        try:
+            if not self._loaded:
+                self.rebuild(db)
+        finally:
+            self._load_lock.release()
+
+    # 커밋 뒤에 바뀐 값만 넘기면 됨 (예: update_user(3, cash=120))
+    # 아직 모르는 유저(새로 가입 등)는 다음 전체 재계산 때 들어감
+    def update_user(self, user_id: int, **values: int):
+        with self._lock:
+            if not self._loaded:
+                return
+            stats = self._stats.get(user_id)
+            if stats is None:
+                return
+
+            new_stats = list(stats)
+            for field, value in values.items():
+                new_stats[FIELDS[field]] = value
+            if new_stats == stats:
+                return
+
+            for board, key in BOARDS.items():
+                self._sorted[board].remove(key(user_id, stats))
+                self._sorted[board].add(key(user_id, new_stats))
+            self._stats[user_id] = new_stats
+
+    def remove_user(self, user_id: int):
+        with self._lock:
+            stats = self._stats.pop(user_id, None)
+            if stats is None:
+                return
+            for board, key in BOARDS.items():
+                self._sorted[board].remove(key(user_id, stats))
+
+    def _entry(self, board: str, index: int) -> Tuple[int, int, list]:
+        user_id = self._sorted[board][index][-1]
+        return index + 1, user_id, self._stats[user_id]
+
+    # 1등부터 limit 명 -> [(순위, user_id, [streak, level, exp, cash])]
+    def top(self, board: str, limit: int) -> List[Tuple[int, int, list]]:
+        with self._lock:
+            count = min(limit, len(self._sorted[board]))
+            return [self._entry(board, i) for i in range(count)]
+
+    # 내 순위 (없으면 None)
+    def rank(self, board: str, user_id: int) -> Optional[int]:
+        with self._lock:
+            stats = self._stats.get(user_id)
+            if stats is None:
+                return None
+            return self._sorted[board].index(BOARDS[board](user_id, stats)) + 1
+
+    # 내 위아래로 neighbours 명씩
+    def around(self, board: str, user_id: int, neighbours: int) -> List[Tuple[int, int, list]]:
+        with self._lock:
+            stats = self._stats.get(user_id)
+            if stats is None:
+                return []
+            index = self._sorted[board].index(BOARDS[board](user_id, stats))
+            start = max(0, index - neighbours)
+            end = min(len(self._sorted[board]), index + neighbours + 1)
+            return [self._entry(board, i) for i in range(start, end)]
+
+    def __len__(self):
+        return len(self._stats)
+
+
+leaderboard = Leaderboard()
@@ -0,0 +1,164 @@
+# 알림 보내기/읽음 처리
+# - 차단 확인: 유저별 차단 타입 집합을 메모리에 캐시 (보낼 때마다 notification_block 을 조회하지 않음)
+#   캐시에 없는 받는 사람들만 한 번의 IN 쿼리로 채움
+# - 보내기: 알림 INSERT 한 번 + 받는 사람들의 안 읽은 알림 수 UPDATE 한 번 (commit 은 호출한 쪽에서)
+from typing import Iterable, List, Optional
+
+from sqlalchemy import case, delete, func, insert, select, update
+from sqlalchemy.orm import Session
+
+from app import models
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.core.pubsub import pubsub, user_topic
+from app.core.timeutil import utcnow
+
+NOTIFICATION_TYPES = ("wake_up", "friend_request")
+
+# user_id -> 차단한 알림 타입 frozenset
+_block_cache = TTLCache(maxsize=settings.NOTIFICATION_BLOCK_CACHE_SIZE, ttl=settings.NOTIFICATION_BLOCK_CACHE_TTL)
+
+
+def blocked_types(db: Session, user_ids: Iterable[int]) -> dict[int, frozenset]:
+    result = {}
+    missing = []
+    for user_id in user_ids:
+        types = _block_cache.get(user_id)
+        if types is None:
+            missing.append(user_id)
+        else:
+            result[user_id] = types
+
+    if missing:
+        loaded = {user_id: set() for user_id in missing}
+        rows = db.execute(
+            select(models.NotificationBlock.user_id, models.NotificationBlock.notification_type)
+            .where(models.NotificationBlock.user_id.in_(missing))
+        )
+        for user_id, notification_type in rows:
+            loaded[user_id].add(notification_type)
+
+        for user_id, types in loaded.items():
+            result[user_id] = frozenset(types)
+            _block_cache.set(user_id, result[user_id])
+
+    return result
+
+
+# 차단 설정이 바뀌면 호출 (이 서버의 캐시만 지워짐, 다른 서버는 TTL 뒤 반영)
+def invalidate_blocks(user_id: int):
+    _block_cache.pop(user_id)
+
+
+# 차단하지 않은 받는 사람들에게 알림 생성 -> 실제로 받은 유저 id 목록
+def send_notifications(
+    db: Session,
+    sender_id: int,
+    receiver_ids: Iterable[int],
+    notification_type: str,
+    message: Optional[str] = None,
+    goal_id: Optional[int] = None,
+) -> List[int]:
+    receiver_ids = list(dict.fromkeys(receiver_ids))  # 중복 제거 (순서 유지)
+    blocks = blocked_types(db, receiver_ids)
+    receivers = [user_id for user_id in receiver_ids if notification_type not in blocks[user_id]]
+    if not receivers:
+        return []
+
+    now = utcnow()
+    db.execute(
+        insert(models.Notification),
+        [
+            {
+                "sender_id": sender_id,
+                "receiver_id": receiver_id,
+                "goal_id": goal_id,
+                "type": notification_type,
+                "message": message,
+                "is_read": False,
+                "created_at": now,
+            }
+            for receiver_id in receivers
+        ],
+    )
+    db.execute(
+        update(models.User)
+        .where(models.User.id.in_(receivers))
+        .values(
+            unread_notifications=models.User.unread_notifications + 1,
+            data_version=models.User.data_version + 1,
+        )
+    )
+    return receivers
+
+
+# 받은 사람들에게 실시간 이벤트 (커밋 뒤에 호출)
+def publish_notifications(
+    receiver_ids: Iterable[int],
+    sender_id: int,
+    notification_type: str,
+    message: Optional[str] = None,
+    goal_id: Optional[int] = None,
+):
+    event = {
+        "type": "notification",
+        "notification_type": notification_type,
+        "sender_id": sender_id,
+        "goal_id": goal_id,
+        "message": message,
+    }
+    for receiver_id in receiver_ids:
+        pubsub.publish(user_topic(receiver_id), event)
+
+
+# 읽음 처리 (notification_ids 가 None 이면 전부) -> 새로 읽음 처리된 개수
+def mark_read(db: Session, user_id: int, notification_ids: Optional[List[int]] = None) -> int:
+    stmt = update(models.Notification).where(
+        models.Notification.receiver_id == user_id,
+        models.Notification.is_read == False,
+    )
+    if notification_ids is not None:
+        stmt = stmt.where(models.Notification.notification_id.in_(notification_ids))
+
+    updated = db.execute(stmt.values(is_read=True)).rowcount
+    if updated:
+        unread = models.User.unread_notifications
+        db.execute(
+            update(models.User)
+            .where(models.User.id == user_id)
+            .values(
+                unread_notifications=case((unread > updated, unread - updated), else_=0),
+                data_version=models.User.data_version + 1,
+            )
+        )
+    return updated
+
+
+# 목표를 지울 때 (알림은 남기고 목표 연결만 끊음, commit 은 호출한 쪽에서)
+def detach_goal_notifications(db: Session, goal_id: int):
+    db.execute(update(models.Notification).where(models.Notification.goal_id == goal_id).values(goal_id=None))
+
+
+# 탈퇴할 때 주고받은 알림 + 차단 설정 삭제 (commit 은 호출한 쪽에서)
+# 내가 보낸 안 읽은 알림은 받은 사람들의 안 읽은 알림 수에서도 빼 줌
+def delete_user_notifications(db: Session, user_id: int):
+    Notification = models.Notification
+    unread_by_receiver = db.execute(
+        select(Notification.receiver_id, func.count())
+        .where(Notification.sender_id == user_id, Notification.receiver_id != user_id, Notification.is_read == False)
+        .group_by(Notification.receiver_id)
+    ).all()
+    for receiver_id, count in unread_by_receiver:
+        unread = models.User.unread_notifications
+        db.execute(
+            update(models.User)
+            .where(models.User.id == receiver_id)
+            .values(
+                unread_notifications=case((unread > count, unread - count), else_=0),
+                data_version=models.User.data_version + 1,
+            )
+        )
+
+    db.execute(delete(Notification).where((Notification.sender_id == user_id) | (Notification.receiver_id == user_id)))
+    db.execute(delete(models.NotificationBlock).where(models.NotificationBlock.user_id == user_id))
+    invalidate_blocks(user_id)
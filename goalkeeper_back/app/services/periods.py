@@ -0,0 +1,60 @@
+# 목표 주기(daily/weekly/yearly)별 인증 기간 계산
+# - 기간은 유저 시간대의 날짜 기준 [시작일, 다음 기간 시작일)
+# - weekly 는 ISO 주 (월요일 시작), yearly 는 1월 1일 시작
+# - goal.period_start 에 마지막으로 인증한 기간의 시작일을 저장 -> "이번 기간에 이미 인증?" 은 날짜 하나 비교
+from datetime import date, timedelta
+
+PERIODS = ("daily", "weekly", "yearly")
+DEFAULT_PERIOD = "daily"
+
+# 중복 인증 안내 문구
+ALREADY_VERIFIED_MESSAGES = {
+    "daily": "오늘은 이미 인증했습니다!",
+    "weekly": "이번 주는 이미 인증했습니다!",
+    "yearly": "올해는 이미 인증했습니다!",
+}
+
+
+def is_valid_period(period: str) -> bool:
+    return period in PERIODS
+
+
+# 알 수 없는 값(예전 데이터)은 daily 로 취급
+def normalize_period(period: str) -> str:
+    return period if period in PERIODS else DEFAULT_PERIOD
+
+
+# day 가 속한 기간의 시작일
+def period_start(period: str, day: date) -> date:
+    period = normalize_period(period)
+    if period == "weekly":
+        return day - timedelta(days=day.weekday())
+    if period == "yearly":
+        return date(day.year, 1, 1)
+    return day
+
+
+# 다음 기간의 시작일 (= 이번 기간의 끝, 미포함)
+def next_period_start(period: str, start: date) -> date:
+    period = normalize_period(period)
+    if period == "weekly":
+        return start + timedelta(days=7)
+    if period == "yearly":
+        return date(start.year + 1, 1, 1)
+    return start + timedelta(days=1)
+
+
+# 이전 기간의 시작일 (여기에 인증했으면 연속 기록 유지)
+def previous_period_start(period: str, start: date) -> date:
+    period = normalize_period(period)
+    if period == "weekly":
+        return start - timedelta(days=7)
+    if period == "yearly":
+        return date(start.year - 1, 1, 1)
+    return start - timedelta(days=1)
+
+
+# day 가 속한 기간 [시작일, 끝일)
+def period_window(period: str, day: date) -> tuple[date, date]:
+    start = period_start(period, day)
+    return start, next_period_start(period, start)
@@ -0,0 +1,72 @@
+# app/services/posts.py
+# 게시글 응답 조립 (피드/상세/수정이 같은 경로를 사용)
+from collections import defaultdict
+from typing import Dict, List, Optional
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app import models, schemas
+from app.services.images import variant_urls
+
+
+# 페이지에 포함된 게시글들의 이모지 개수를 카운터 테이블에서 한 번에 가져오는 쿼리
+def reaction_counts_stmt(post_ids: List[int]):
+    counter = models.PostReactionCount
+    return select(counter.post_id, counter.emoji_type, counter.count).where(
+        counter.post_id.in_(post_ids),
+        counter.count > 0,
+    )
+
+
+# 페이지에 포함된 게시글 중 내가 누른 반응만 가져오는 쿼리
+def my_reactions_stmt(post_ids: List[int], user_id: int):
+    return select(models.Reaction.post_id, models.Reaction.emoji_type).where(
+        models.Reaction.post_id.in_(post_ids),
+        models.Reaction.user_id == user_id,
+    )
+
+
+# 조회 결과를 PostResponse 로 변환 (DB 접근 없음)
+def assemble_post_responses(
+    posts: List[models.BoardPost],
+    counts: Dict[int, Dict[str, int]],
+    my_reactions: Dict[int, str],
+) -> List[schemas.PostResponse]:
+    return [
+        schemas.PostResponse(
+            post_id=post.post_id,
+            user_id=post.user_id,
+            nickname=post.user.nickname if post.user else "알수없음",
+            title=post.title,
+            content=post.content,
+            image_url=post.image_url,
+            image_variants=variant_urls(post.image_url),
+            created_at=post.created_at,
+            reaction_counts=counts.get(post.post_id, {}),
+            my_reaction=my_reactions.get(post.post_id),
+        )
+        for post in posts
+    ]
+
+
+# 게시글 목록 -> 응답 목록
+# 게시글 수와 관계없이 카운터 조회 1번 + (로그인 시) 내 반응 1번만 실행됨
+# posts 는 joinedload(models.BoardPost.user) 로 불러와야 닉네임 조회가 추가로 나가지 않음
+def build_post_responses(
+    db: Session,
+    posts: List[models.BoardPost],
+    current_user_id: Optional[int] = None,
+) -> List[schemas.PostResponse]:
+    post_ids = [post.post_id for post in posts]
+    counts: Dict[int, Dict[str, int]] = defaultdict(dict)
+    my_reactions: Dict[int, str] = {}
+
+    if post_ids:
+        for post_id, emoji_type, count in db.execute(reaction_counts_stmt(post_ids)):
+            counts[post_id][emoji_type] = count
+
+        if current_user_id:
+            my_reactions = dict(db.execute(my_reactions_stmt(post_ids, current_user_id)).all())
+
+    return assemble_post_responses(posts, counts, my_reactions)
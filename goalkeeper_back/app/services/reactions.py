@@ -0,0 +1,96 @@
+# app/services/reactions.py
+# 게시글별 이모지 개수 카운터 (post_reaction_count) 관리
+from typing import Dict, List, Optional
+
+from sqlalchemy import delete, func, insert, select, update
+from sqlalchemy.orm import Session
+
+from app import models
+from app.core.pubsub import COMMUNITY_TOPIC, pubsub
+from app.database import upsert_stmt
+
+ReactionCount = models.PostReactionCount
+
+
+# 이모지 개수 변화를 커뮤니티 화면에 실시간 전달 (커밋 뒤에 호출)
+def publish_reaction(post_id: int, deltas: Dict[str, int]):
+    pubsub.publish(COMMUNITY_TOPIC, {"type": "reaction", "post_id": post_id, "deltas": deltas})
+
+
+# 이모지 개수 +delta / -delta (commit 은 호출한 쪽에서)
+def bump_reaction_count(db: Session, post_id: int, emoji_type: str, delta: int):
+    if delta > 0:
+        db.execute(
+            upsert_stmt(
+                ReactionCount,
+                {"post_id": post_id, "emoji_type": emoji_type, "count": delta},
+                index_elements=["post_id", "emoji_type"],
+                set_={"count": ReactionCount.count + delta},
+            )
+        )
+    elif delta < 0:
+        db.execute(
+            update(ReactionCount)
+            .where(
+                ReactionCount.post_id == post_id,
+                ReactionCount.emoji_type == emoji_type,
+                ReactionCount.count > 0,
+            )
+            .values(count=ReactionCount.count + delta)
+        )
+
+
+# 게시글 삭제 시 카운터도 같이 정리
+def delete_reaction_counts(db: Session, post_id: int):
+    db.execute(delete(ReactionCount).where(ReactionCount.post_id == post_id))
+
+
+# 한 유저의 게시글을 한꺼번에 지우기 전에 (회원 탈퇴) 다른 사람이 남긴 반응과 카운터 정리
+def delete_user_post_reactions(db: Session, user_id: int):
+    post_ids = select(models.BoardPost.post_id).where(models.BoardPost.user_id == user_id)
+    db.execute(delete(models.Reaction).where(models.Reaction.post_id.in_(post_ids)))
+    db.execute(delete(ReactionCount).where(ReactionCount.post_id.in_(post_ids)))
+
+
+# reaction 테이블 기준으로 카운터 재계산 (post_id 범위 단위로 삭제 후 INSERT ... SELECT)
+# post_ids 를 주면 해당 게시글만 재계산
+def rebuild_reaction_counts(
+    db: Session,
+    post_ids: Optional[List[int]] = None,
+    chunk_size: int = 5000,
+) -> int:
+    grouped = select(
+        models.Reaction.post_id,
+        models.Reaction.emoji_type,
+        func.count(),
+    ).group_by(models.Reaction.post_id, models.Reaction.emoji_type)
+
+    if post_ids:
+        db.execute(delete(ReactionCount).where(ReactionCount.post_id.in_(post_ids)))
+        db.execute(
+            insert(ReactionCount).from_select(
+                ["post_id", "emoji_type", "count"],
+                grouped.where(models.Reaction.post_id.in_(post_ids)),
+            )
+        )
+        db.commit()
+        return len(post_ids)
+
+    max_post_id = db.query(func.max(models.BoardPost.post_id)).scalar() or 0
+    max_counter_id = db.query(func.max(ReactionCount.post_id)).scalar() or 0
+    last_id = max(max_post_id, max_counter_id)
+
+    start = 1
+    while start <= last_id:
+        end = start + chunk_size - 1
+        db.execute(delete(ReactionCount).where(ReactionCount.post_id.between(start, end)))
+        db.execute(
+            insert(ReactionCount).from_select(
+                ["post_id", "emoji_type", "count"],
+                grouped.where(models.Reaction.post_id.between(start, end)),
+            )
+        )
+        db.commit()
+        start = end + 1
+
+    return last_id
@@ -0,0 +1,56 @@
+# app/services/rewards.py
+# 목표 인증 보상 지급
+# - 지갑(cash/exp/level)은 SQL 한 문장으로 원자적으로 갱신 (동시에 인증해도 덮어쓰기 없음)
+# - 보상 내역은 reward_ledger 에 항목별로 쌓기만 함 (수정/삭제 없음)
+from datetime import datetime
+from typing import List, Optional
+
+from sqlalchemy import case, insert, update
+from sqlalchemy.orm import Session
+
+from app import models
+
+LEVEL_UP_EXP = 100  # 경험치가 100 이 되면 레벨업 (경험치 100 소모)
+
+
+# rewards_breakdown: [{"label": ..., "amount": cash}, ...]
+# commit 은 호출한 쪽에서
+def apply_rewards(
+    db: Session,
+    user_id: int,
+    goal_id: Optional[int],
+    rewards_breakdown: List[dict],
+    exp: int,
+    created_at: Optional[datetime] = None,
+):
+    User = models.User
+    total_cash = sum(item["amount"] for item in rewards_breakdown)
+    levels_up = User.exp + exp >= LEVEL_UP_EXP
+
+    # MySQL 은 SET 을 왼쪽부터 적용하므로 level 을 exp 보다 먼저 (둘 다 갱신 전 exp 기준으로 계산)
+    db.execute(
+        update(User)
+        .where(User.id == user_id)
+        .ordered_values(
+            (User.cash, User.cash + total_cash),
+            (User.level, User.level + case((levels_up, 1), else_=0)),
+            (User.exp, case((levels_up, User.exp + exp - LEVEL_UP_EXP), else_=User.exp + exp)),
+        )
+    )
+
+    # 경험치는 첫 항목(기본 보상)에 기록, created_at 은 인증 시각(UTC)으로 맞춤 (없으면 DB 현재 시각)
+    extra = {"created_at": created_at} if created_at is not None else {}
+    db.execute(
+        insert(models.RewardLedger),
+        [
+            {
+                "user_id": user_id,
+                "goal_id": goal_id,
+                "label": item["label"],
+                "cash": item["amount"],
+                "exp": exp if i == 0 else 0,
+                **extra,
+            }
+            for i, item in enumerate(rewards_breakdown)
+        ],
+    )
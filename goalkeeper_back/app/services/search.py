@@ -0,0 +1,143 @@
+# 게시글 검색 (제목 + 내용)
+# - MySQL: FULLTEXT 인덱스 + ngram 파서 (한국어는 띄어쓰기만으로 단어가 안 나뉘므로 2글자 단위로 색인)
+#          MATCH ... AGAINST 점수순
+# - SQLite(로컬 개발): FTS5 trigram 가상 테이블 board_post_fts + 트리거로 board_post 와 자동 동기화
+#          bm25 점수순 (제목에 가중치 2배), trigram 은 3글자부터라 2글자 검색어는 LIKE 로 대신함
+#          3글자 이상과 2글자 단어가 섞인 검색어는 FTS 결과 + 2글자 단어의 LIKE 결과(FTS 에 없는 글만, 점수 0)를 합침
+# - 정렬은 (점수, post_id) 내림차순 -> 커서도 (점수, post_id)
+from typing import List, Optional, Tuple
+
+from sqlalchemy import and_, or_, select, text
+from sqlalchemy.dialects.mysql import match
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session, joinedload
+
+from app import models
+
+BoardPost = models.BoardPost
+
+MIN_QUERY_LENGTH = 2
+FTS_TABLE = "board_post_fts"
+
+# SQLite FTS5 색인 + 동기화 트리거 (content= 로 본문은 board_post 에 두고 색인만 따로 저장)
+_SQLITE_FTS_DDL = [
+    f"""CREATE VIRTUAL TABLE {FTS_TABLE} USING fts5(
+        title, content, content='board_post', content_rowid='post_id', tokenize='trigram'
+    )""",
+    f"""CREATE TRIGGER board_post_fts_insert AFTER INSERT ON board_post BEGIN
+        INSERT INTO {FTS_TABLE}(rowid, title, content) VALUES (new.post_id, new.title, new.content);
+    END""",
+    f"""CREATE TRIGGER board_post_fts_delete AFTER DELETE ON board_post BEGIN
+        INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, title, content) VALUES ('delete', old.post_id, old.title, old.content);
+    END""",
+    f"""CREATE TRIGGER board_post_fts_update AFTER UPDATE OF title, content ON board_post BEGIN
+        INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, title, content) VALUES ('delete', old.post_id, old.title, old.content);
+        INSERT INTO {FTS_TABLE}(rowid, title, content) VALUES (new.post_id, new.title, new.content);
+    END""",
+    # 이미 있던 게시글 색인
+    f"INSERT INTO {FTS_TABLE}({FTS_TABLE}) VALUES ('rebuild')",
+]
+
+
+# 서버 시작 시 (main.py) - SQLite 면 FTS 테이블이 없을 때 만들고 기존 글 색인
+# MySQL 의 FULLTEXT 인덱스는 models.BoardPost 에 선언돼 있어 create_all 이 만듦
+def ensure_search_index(engine: Engine):
+    if engine.dialect.name != "sqlite":
+        return
+    with engine.begin() as conn:
+        exists = conn.execute(
+            text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = :name"), {"name": FTS_TABLE}
+        ).first()
+        if exists:
+            return
+        for ddl in _SQLITE_FTS_DDL:
+            conn.execute(text(ddl))
+
+
+def _after_cursor(score, post_id, last_score: float, last_post_id: int):
+    return or_(score < last_score, and_(score == last_score, post_id < last_post_id))
+
+
+def _mysql_search(db: Session, q: str, after: Optional[Tuple[float, int]], limit: int):
+    score = match(BoardPost.title, BoardPost.content, against=q)
+    stmt = select(BoardPost.post_id, score).where(score > 0)
+    if after:
+        stmt = stmt.where(_after_cursor(score, BoardPost.post_id, *after))
+    return db.execute(stmt.order_by(score.desc(), BoardPost.post_id.desc()).limit(limit)).all()
+
+
+def _like_pattern(term: str) -> str:
+    escaped = term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return f"%{escaped}%"
+
+
+def _sqlite_fts_search(db: Session, q: str, after: Optional[Tuple[float, int]], limit: int):
+    # 띄어쓰기로 나눈 단어 중 하나라도 들어간 글 (따옴표로 감싸서 FTS 문법 문자는 그대로 검색)
+    words = q.split()
+    terms = [term.replace('"', '""') for term in words if len(term) >= 3]
+    fts_query = " OR ".join(f'"{term}"' for term in terms)
+    params = {"q": fts_query, "limit": limit}
+
+    # trigram 색인으로 못 찾는 2글자 단어는 LIKE 로 (FTS 로 이미 찾은 글은 빼고, 점수 0 -> FTS 결과 뒤에)
+    short_terms = list(dict.fromkeys(term for term in words if MIN_QUERY_LENGTH <= len(term) < 3))
+    short_matches = ""
+    if short_terms:
+        conditions = []
+        for i, term in enumerate(short_terms):
+            params[f"like_{i}"] = _like_pattern(term)
+            conditions.append(f"title LIKE :like_{i} ESCAPE '\\' OR content LIKE :like_{i} ESCAPE '\\'")
+        short_matches = f"""
+            UNION ALL
+            SELECT post_id, 0 AS score FROM board_post
+            WHERE ({" OR ".join(conditions)})
+              AND post_id NOT IN (SELECT rowid FROM {FTS_TABLE} WHERE {FTS_TABLE} MATCH :q)
+        """
+
+    sql = f"""
+        SELECT post_id, score FROM (
+            SELECT rowid AS post_id, -bm25({FTS_TABLE}, 2.0, 1.0) AS score
+            FROM {FTS_TABLE} WHERE {FTS_TABLE} MATCH :q
+            {short_matches}
+        )
+        {"WHERE score < :last_score OR (score = :last_score AND post_id < :last_post_id)" if after else ""}
+        ORDER BY score DESC, post_id DESC
+        LIMIT :limit
+    """
+    if after:
+        params.update(last_score=after[0], last_post_id=after[1])
+    return db.execute(text(sql), params).all()
+
+
+# 색인을 못 쓰는 경우 (SQLite 의 2글자 검색어 등): 최신순, 점수는 0
+def _like_search(db: Session, q: str, after: Optional[Tuple[float, int]], limit: int):
+    stmt = select(BoardPost.post_id, text("0")).where(
+        or_(BoardPost.title.contains(q, autoescape=True), BoardPost.content.contains(q, autoescape=True))
+    )
+    if after:
+        stmt = stmt.where(BoardPost.post_id < after[1])
+    return db.execute(stmt.order_by(BoardPost.post_id.desc()).limit(limit)).all()
+
+
+# 검색 -> ([(게시글, 점수)], 다음 페이지 있음 여부) (게시글은 작성자까지 로딩된 상태)
+def search_posts(
+    db: Session, q: str, after: Optional[Tuple[float, int]], limit: int
+) -> Tuple[List[Tuple[models.BoardPost, float]], bool]:
+    dialect = db.get_bind().dialect.name
+    if dialect == "mysql":
+        rows = _mysql_search(db, q, after, limit + 1)
+    elif dialect == "sqlite" and any(len(term) >= 3 for term in q.split()):
+        rows = _sqlite_fts_search(db, q, after, limit + 1)
+    else:
+        rows = _like_search(db, q, after, limit + 1)
+
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+
+    # 점수순 id 목록 -> 게시글 (JOIN 한 번)
+    posts = {
+        post.post_id: post
+        for post in db.query(BoardPost).options(joinedload(BoardPost.user)).filter(
+            BoardPost.post_id.in_([post_id for post_id, _ in rows])
+        )
+    } if rows else {}
+    return [(posts[post_id], float(score)) for post_id, score in rows if post_id in posts], has_more
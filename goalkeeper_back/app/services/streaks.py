@@ -0,0 +1,129 @@
+# 끊긴 연속 기록(스트릭) 일괄 정리
+# check_goal 은 인증할 때만 스트릭을 다시 계산하므로, 하루 쉰 유저의 /users/me, /goals/ 에는 예전 숫자가 남아 있음
+# -> 유저 시간대별로 '어제 자정' 이전에 마지막으로 인증한 유저의 통합 스트릭,
+#    지난 기간(어제/지난주/작년)에도 인증하지 않은 목표의 스트릭을 0 으로 (집합 UPDATE, 유저 id 구간 단위로 커밋)
+# 몇 번을 다시 돌려도 결과가 같음 (이미 0 인 행은 건드리지 않음)
+from datetime import date, datetime
+from typing import Iterable, Optional
+
+from sqlalchemy import and_, func, or_, select, update
+from sqlalchemy.orm import Session
+
+from app import models
+from app.core.config import settings
+from app.core.timeutil import local_date, local_midnight_utc, streak_cutoff_utc, utcnow
+from app.services.periods import DEFAULT_PERIOD, PERIODS, period_start, previous_period_start
+
+User = models.User
+Goal = models.Goal
+
+
+def user_timezones(db: Session) -> list[str]:
+    return [tz for (tz,) in db.execute(select(User.timezone).distinct())]
+
+
+def _broken_user(cutoff: datetime):
+    return and_(
+        User.total_streak > 0,
+        or_(User.last_check_date.is_(None), User.last_check_date < cutoff),
+    )
+
+
+# 주기별로 '지난 기간 시작일' 보다 전에 마지막으로 인증했으면 끊긴 것
+# (period_start 가 없는 예전 데이터는 마지막 인증 시각으로 판단)
+def _broken_goal(tz_name: str, today: date):
+    conditions = []
+    for period in PERIODS:
+        keep_from = previous_period_start(period, period_start(period, today))
+        if period == DEFAULT_PERIOD:
+            # 알 수 없는 주기는 daily 로 취급
+            others = [p for p in PERIODS if p != DEFAULT_PERIOD]
+            is_period = or_(Goal.period.is_(None), Goal.period.notin_(others))
+        else:
+            is_period = Goal.period == period
+
+        conditions.append(and_(
+            is_period,
+            or_(
+                Goal.period_start < keep_from,
+                and_(
+                    Goal.period_start.is_(None),
+                    or_(Goal.last_verified_at.is_(None), Goal.last_verified_at < local_midnight_utc(keep_from, tz_name)),
+                ),
+            ),
+        ))
+
+    return and_(Goal.current_streak > 0, or_(*conditions))
+
+
+# 한 시간대의 끊긴 스트릭 정리 -> (정리한 유저 수, 정리한 목표 수)
+def reset_broken_streaks(
+    db: Session,
+    tz_name: str,
+    now: Optional[datetime] = None,
+    chunk_size: Optional[int] = None,
+) -> tuple[int, int]:
+    now = now or utcnow()
+    cutoff = streak_cutoff_utc(tz_name, now)
+    broken_goal = _broken_goal(tz_name, local_date(now, tz_name))
+    chunk_size = chunk_size or settings.STREAK_JOB_CHUNK
+
+    min_id, max_id = db.execute(
+        select(func.min(User.id), func.max(User.id)).where(User.timezone == tz_name)
+    ).one()
+    db.rollback()  # 조회용 트랜잭션 정리 (구간마다 새로 시작)
+    if min_id is None:
+        return 0, 0
+
+    users_reset = goals_reset = 0
+    for lo in range(min_id, max_id + 1, chunk_size):
+        hi = lo + chunk_size - 1
+        in_chunk = and_(User.id.between(lo, hi), User.timezone == tz_name)
+
+        # 1. 바뀔 유저의 data_version +1 (ETag 갱신) - 스트릭을 0 으로 만들기 전에 조건 판단
+        db.execute(
+            update(User)
+            .where(
+                in_chunk,
+                or_(
+                    _broken_user(cutoff),
+                    User.id.in_(select(Goal.user_id).where(Goal.user_id.between(lo, hi), broken_goal)),
+                ),
+            )
+            .values(data_version=User.data_version + 1)
+        )
+
+        # 2. 목표별 스트릭
+        goals_reset += db.execute(
+            update(Goal)
+            .where(
+                Goal.user_id.between(lo, hi),
+                Goal.user_id.in_(select(User.id).where(in_chunk)),
+                broken_goal,
+            )
+            .values(current_streak=0)
+        ).rowcount
+
+        # 3. 통합 스트릭
+        users_reset += db.execute(
+            update(User)
+            .where(in_chunk, _broken_user(cutoff))
+            .values(total_streak=0)
+        ).rowcount
+
+        db.commit()
+
+    return users_reset, goals_reset
+
+
+# 여러 시간대 정리 (없으면 DB 에 있는 모든 시간대) -> {시간대: (유저 수, 목표 수)}
+def reset_all_broken_streaks(
+    db: Session,
+    timezones: Optional[Iterable[str]] = None,
+    now: Optional[datetime] = None,
+) -> dict[str, tuple[int, int]]:
+    now = now or utcnow()
+    return {
+        tz: reset_broken_streaks(db, tz, now)
+        for tz in (timezones if timezones is not None else user_timezones(db))
+    }
@@ -0,0 +1,107 @@
+# 인기글(트렌딩) 점수
+# - board_post.trending_score = 최근 반응 수 (오래된 반응일수록 작게: 반감기 TRENDING_HALF_LIFE_HOURS)
+# - 반응 추가 +1 / 취소 -(그 반응의 현재 무게) 를 react_to_post 에서 바로 반영하고, 주기 작업이 전체 점수를 시간에 맞춰 줄임
+# - 인기글 목록은 (trending_score, post_id) 인덱스를 위에서부터 읽기만 하면 됨 (reaction 집계/정렬 없음)
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import bindparam, case, select, update
+from sqlalchemy.orm import Session
+
+from app import models
+from app.core.config import settings
+from app.core.timeutil import utcnow
+
+BoardPost = models.BoardPost
+DECAY_JOB_NAME = "decay_trending"
+
+
+# 점수 +delta (0 밑으로는 안 내려감, commit 은 호출한 쪽에서)
+def bump_trending_score(db: Session, post_id: int, delta: float):
+    score = BoardPost.trending_score
+    db.execute(
+        update(BoardPost)
+        .where(BoardPost.post_id == post_id)
+        .values(trending_score=case((score + delta > 0, score + delta), else_=0))
+    )
+
+
+# 반응 하나가 지금 점수에서 차지하는 무게 (반응 취소 시 이만큼 뺌)
+# 점수는 감쇠 작업이 돌 때만 줄어들므로, 반응 시각부터 마지막 감쇠 시각까지만큼 줄어든 값
+def reaction_weight(db: Session, reacted_at: Optional[datetime]) -> float:
+    if reacted_at is None:
+        return 1.0
+    last_run_at = db.query(models.JobState.last_run_at).filter(models.JobState.name == DECAY_JOB_NAME).scalar()
+    if last_run_at is None:
+        return 1.0
+    elapsed_hours = (last_run_at - reacted_at.replace(tzinfo=None)).total_seconds() / 3600
+    if elapsed_hours <= 0:
+        return 1.0
+    return 0.5 ** (elapsed_hours / settings.TRENDING_HALF_LIFE_HOURS)
+
+
+# 지난번 감쇠 이후 흐른 시간만큼 전체 점수를 줄임 -> 줄인 게시글 수
+# 마지막 실행 시각을 DB(job_state)에 잠가서 읽으므로, 서버 여러 대가 동시에 돌려도 두 번 줄지 않음
+def decay_trending_scores(db: Session, now: Optional[datetime] = None) -> int:
+    now = now or utcnow()
+    state = db.query(models.JobState).filter(models.JobState.name == DECAY_JOB_NAME).with_for_update().first()
+    if state is None:
+        db.add(models.JobState(name=DECAY_JOB_NAME, last_run_at=now))
+        db.commit()
+        return 0
+
+    elapsed_hours = (now - state.last_run_at).total_seconds() / 3600
+    if elapsed_hours <= 0:
+        db.rollback()
+        return 0
+
+    factor = 0.5 ** (elapsed_hours / settings.TRENDING_HALF_LIFE_HOURS)
+    epsilon = settings.TRENDING_EPSILON
+    score = BoardPost.trending_score
+
+    # 거의 0 이 된 글은 0 으로 (다음부터는 감쇠 대상에서 빠짐)
+    decayed = db.execute(
+        update(BoardPost)
+        .where(score > 0)
+        .values(trending_score=case((score * factor > epsilon, score * factor), else_=0))
+    ).rowcount
+
+    state.last_run_at = now
+    db.commit()
+    return decayed
+
+
+# 반응 테이블 기준으로 점수 다시 계산 (처음 도입할 때 / 어긋났을 때)
+# 반응 시각이 없는 예전 반응은 게시글 작성 시각 기준으로 감쇠
+def rebuild_trending_scores(db: Session, now: Optional[datetime] = None) -> int:
+    now = now or utcnow()
+    scores: dict[int, float] = {}
+    reactions = db.execute(
+        select(models.Reaction.post_id, models.Reaction.created_at, BoardPost.created_at)
+        .join(BoardPost, BoardPost.post_id == models.Reaction.post_id)
+    )
+    for post_id, reacted_at, posted_at in reactions:
+        reacted_at = reacted_at or posted_at
+        age_hours = max((now - reacted_at.replace(tzinfo=None)).total_seconds() / 3600, 0) if reacted_at else 0
+        scores[post_id] = scores.get(post_id, 0) + 0.5 ** (age_hours / settings.TRENDING_HALF_LIFE_HOURS)
+
+    db.execute(update(BoardPost).where(BoardPost.trending_score != 0).values(trending_score=0))
+    rows = [
+        {"b_post_id": post_id, "score": score}
+        for post_id, score in scores.items()
+        if score > settings.TRENDING_EPSILON
+    ]
+
+    if rows:
+        db.connection().execute(
+            update(BoardPost).where(BoardPost.post_id == bindparam("b_post_id")).values(trending_score=bindparam("score")),
+            rows,
+        )
+
+    state = db.get(models.JobState, DECAY_JOB_NAME)
+    if state is None:
+        db.add(models.JobState(name=DECAY_JOB_NAME, last_run_at=now))
+    else:
+        state.last_run_at = now
+    db.commit()
+    return len(rows)
@@ -0,0 +1,182 @@
+# app/services/uploads.py
+# 게시글 사진 저장
+# - 청크 단위로 임시 파일에 쓰면서 크기 제한 / 파일 형식(매직 바이트) 검사
+# - 원본도 그대로 내려가므로 저장 전에 메타데이터(GPS 위치 등)를 제거
+# - 내용의 sha256 을 파일명으로 써서 이름 충돌이 없고, 같은 사진은 한 번만 저장됨
+# - 같은 사진을 재사용하는 업로드와 삭제가 겹치지 않도록, 파일명별 잠금 + 최근에 (재)사용된 파일은 지우지 않음
+#   (그 사이 남은 파일은 주기 작업 sweep_orphan_images 가 정리)
+import hashlib
+import os
+import re
+import tempfile
+import threading
+import time
+from typing import Optional
+
+from fastapi import HTTPException, UploadFile
+from PIL import Image
+from sqlalchemy.orm import Session
+
+from app import models
+from app.core.blocking import run_blocking
+from app.core.config import settings
+from app.services.images import delete_variants, strip_metadata
+
+UPLOAD_DIR = settings.UPLOAD_DIR
+CHUNK_SIZE = 64 * 1024
+TMP_PREFIX = ".upload-"
+IMAGE_TYPES = ("jpeg", "png", "gif", "webp")
+# 이 모듈이 저장한 파일 이름 (sha256.확장자) - 정리 작업은 이 이름과 업로드 임시 파일만 지움
+# (uploads 폴더에는 마스코트/액세서리 그림처럼 게시글과 상관없는 파일도 같이 있음)
+_STORED_NAME = re.compile(r"^[0-9a-f]{64}\.(?:%s)$" % "|".join(IMAGE_TYPES))
+
+# 파일명별 잠금 (파일명 해시로 나눠 쓰는 고정 개수 잠금 - 파일이 늘어나도 잠금 수는 그대로)
+_file_locks = [threading.Lock() for _ in range(64)]
+
+
+def _file_lock(filename: str) -> threading.Lock:
+    return _file_locks[hash(filename) % len(_file_locks)]
+
+if not os.path.exists(UPLOAD_DIR):
+    os.makedirs(UPLOAD_DIR)
+
+
+# 파일 앞부분(매직 바이트)으로 실제 이미지 형식 판별 -> 확장자, 모르는 형식이면 None
+def sniff_image_type(head: bytes) -> Optional[str]:
+    if head.startswith(b"\xff\xd8\xff"):
+        return "jpeg"
+    if head.startswith(b"\x89PNG\r\n\x1a\n"):
+        return "png"
+    if head.startswith((b"GIF87a", b"GIF89a")):
+        return "gif"
+    if head[:4] == b"RIFF" and head[8:12] == b"WEBP":
+        return "webp"
+    return None
+
+
+# 업로드된 사진을 uploads 폴더에 저장하고 파일명을 돌려줌
+# 라우터에서는 DB 조회보다 먼저 호출해서, 파일을 쓰는 동안 DB 커넥션을 잡고 있지 않도록 함
+# (비동기 스택에서는 파일 쓰기/해시를 스레드풀에서 처리)
+def save_image(image: UploadFile) -> str:
+    return run_blocking(_write_image, image)
+
+
+def _write_image(image: UploadFile) -> str:
+    fd, tmp_path = tempfile.mkstemp(dir=UPLOAD_DIR, prefix=TMP_PREFIX, suffix=".part")
+    size = 0
+    ext = None
+
+    try:
+        with os.fdopen(fd, "wb") as buffer:
+            while True:
+                chunk = image.file.read(CHUNK_SIZE)
+                if not chunk:
+                    break
+
+                if ext is None:
+                    ext = sniff_image_type(chunk)
+                    if ext is None:
+                        raise HTTPException(status_code=415, detail="jpg, png, gif, webp 사진만 올릴 수 있습니다.")
+
+                size += len(chunk)
+                if size > settings.UPLOAD_MAX_BYTES:
+                    limit_mb = settings.UPLOAD_MAX_BYTES // (1024 * 1024)
+                    raise HTTPException(status_code=413, detail=f"사진은 {limit_mb}MB 까지 올릴 수 있습니다.")
+
+                buffer.write(chunk)
+
+        if ext is None:
+            raise HTTPException(status_code=400, detail="빈 파일입니다.")
+
+        try:
+            strip_metadata(tmp_path, ext)
+        except (OSError, ValueError, Image.DecompressionBombError):
+            raise HTTPException(status_code=400, detail="사진을 읽을 수 없습니다.")
+
+        # 파일명은 메타데이터를 지운 뒤의 내용으로 (같은 사진이면 같은 결과라 중복 저장도 그대로 막힘)
+        filename = f"{_file_sha256(tmp_path)}.{ext}"
+        file_path = os.path.join(UPLOAD_DIR, filename)
+
+        with _file_lock(filename):
+            if os.path.exists(file_path):
+                # 같은 사진이 이미 있으면 그대로 재사용
+                # 수정 시각을 지금으로 바꿔서, 글이 커밋되기 전에 release_image / 정리 작업이 지우지 않도록 함
+                os.remove(tmp_path)
+                os.utime(file_path)
+            else:
+                # 다 쓴 뒤에 한 번에 이름을 바꿔서, 쓰다 만 파일이 노출되지 않도록 함
+                os.replace(tmp_path, file_path)
+
+        return filename
+
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def _file_sha256(path: str) -> str:
+    hasher = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(CHUNK_SIZE), b""):
+            hasher.update(chunk)
+    return hasher.hexdigest()
+
+
+# 더 이상 어떤 게시글도 쓰지 않는 사진 파일 삭제 (같은 사진을 여러 글이 공유할 수 있음)
+# 게시글의 image_url 을 바꾸거나 게시글을 지운 뒤(commit 후)에 호출
+# 방금 올라온(재사용된) 파일은 아직 커밋 전인 글이 쓸 수 있으므로 남겨두고 정리 작업에 맡김
+def release_image(db: Session, image_url: Optional[str]):
+    if not image_url:
+        return
+
+    still_used = db.query(models.BoardPost.post_id).filter(models.BoardPost.image_url == image_url).first()
+    if still_used:
+        return
+
+    run_blocking(_delete_image_files, image_url.replace("/static/", ""), time.time() - settings.UPLOAD_ORPHAN_GRACE)
+
+
+# 어떤 게시글도 쓰지 않는 업로드 사진(sha256 이름) + 중간에 끊긴 업로드 임시 파일 정리 (주기 작업, 지운 파일 수를 돌려줌)
+def sweep_orphan_images(db: Session) -> int:
+    cutoff = time.time() - settings.UPLOAD_ORPHAN_GRACE
+    used = {
+        image_url.replace("/static/", "")
+        for (image_url,) in db.query(models.BoardPost.image_url)
+        .filter(models.BoardPost.image_url.isnot(None))
+        .distinct()
+    }
+
+    removed = 0
+    for entry in os.scandir(UPLOAD_DIR):
+        if not entry.is_file() or entry.name in used:
+            continue
+        if _is_upload_tmp(entry.name):
+            if entry.stat().st_mtime < cutoff:
+                os.remove(entry.path)
+                removed += 1
+        elif _STORED_NAME.match(entry.name) and _delete_image_files(entry.name, cutoff):
+            removed += 1
+    return removed
+
+
+def _is_upload_tmp(name: str) -> bool:
+    return name.startswith(TMP_PREFIX) and name.endswith((".part", ".part.clean"))
+
+
+# cutoff 보다 전에 마지막으로 (재)사용된 파일만 삭제, 지웠으면 True
+def _delete_image_files(filename: str, cutoff: float) -> bool:
+    file_path = os.path.join(UPLOAD_DIR, filename)
+    with _file_lock(filename):
+        try:
+            if os.path.getmtime(file_path) >= cutoff:
+                return False
+            os.remove(file_path)
+            delete_variants(filename)
+            return True
+        except FileNotFoundError:
+            return False
+        except OSError as e:
+            # 파일 삭제에 실패해도 요청은 성공해야 하므로 로그만 남김
+            print(f"이미지 파일 삭제 실패: {e}")
+            return False
@@ -0,0 +1,49 @@
+# 인증 비용 (요청 하나당)
+# - before: 매 요청 jose.jwt.decode (서명 검증 포함)
+# - after: decode_access_token (토큰 -> claims 캐시 적중)
+# - 마지막으로 인증이 필요한 API 전체 요청 시간도 같이 측정
+#   python -m benchmarks.auth --iterations 20000
+import argparse
+
+from benchmarks.common import per_call, report, use_temp_database
+
+parser = argparse.ArgumentParser()
+parser.add_argument("--iterations", type=int, default=20000)
+parser.add_argument("--requests", type=int, default=500)
+args = parser.parse_args()
+
+use_temp_database()
+
+from fastapi.testclient import TestClient  # noqa: E402
+from jose import jwt  # noqa: E402
+
+import main  # noqa: E402
+from app import models  # noqa: E402
+from app.core.config import settings  # noqa: E402
+from app.core.dependencies import decode_access_token  # noqa: E402
+from app.database import SessionLocal  # noqa: E402
+from app.routers.auth import create_access_token  # noqa: E402
+
+
+def run():
+    db = SessionLocal()
+    user = models.User(nickname="bench", provider="kakao", provider_id="bench")
+    db.add(user)
+    db.commit()
+    token = create_access_token(user.id, user.nickname)
+
+    full = per_call(lambda: jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM]), args.iterations)
+    decode_access_token(token)
+    cached = per_call(lambda: decode_access_token(token), args.iterations)
+
+    report("jose.jwt.decode per request", full * 1e6, "us")
+    report("decode_access_token (cache hit)", cached * 1e6, "us")
+
+    client = TestClient(main.app)
+    headers = {"Authorization": f"Bearer {token}"}
+    request = per_call(lambda: client.get("/auth/me", headers=headers), args.requests)
+    report("GET /auth/me (TestClient)", request * 1000, "ms")
+
+
+if __name__ == "__main__":
+    run()
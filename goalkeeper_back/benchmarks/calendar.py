@@ -0,0 +1,88 @@
+# 인증 달력 (GET /goals/calendar) 벤치마크
+# - 유저 N 명 x 목표 3개 x 1년치 인증 기록 (하루 70% 확률) 생성
+# - 실행 계획이 커버링 인덱스 범위 탐색인지, 조회+인코딩 시간, API 전체 시간/응답 크기 측정
+#   python -m benchmarks.calendar --users 3000
+import argparse
+import random
+import time
+from datetime import date, datetime, timedelta
+
+from benchmarks.common import per_call, report, use_temp_database
+
+parser = argparse.ArgumentParser()
+parser.add_argument("--users", type=int, default=3000)
+parser.add_argument("--goals-per-user", type=int, default=3)
+parser.add_argument("--requests", type=int, default=200)
+args = parser.parse_args()
+
+use_temp_database()
+
+from fastapi.testclient import TestClient  # noqa: E402
+from sqlalchemy import insert, text  # noqa: E402
+
+import main  # noqa: E402
+from app import models  # noqa: E402
+from app.database import SessionLocal, engine  # noqa: E402
+from app.routers.auth import create_access_token  # noqa: E402
+from app.services.checkins import calendar_bitmaps  # noqa: E402
+
+START = date(2025, 1, 1)
+END = date(2025, 12, 31)
+BATCH = 200_000
+
+
+def seed():
+    rng = random.Random(0)
+    goal_id = lambda user, j: user * args.goals_per_user + j + 1  # noqa: E731
+    with engine.begin() as conn:
+        conn.execute(insert(models.User), [
+            dict(id=i + 1, nickname="u", provider="bench", provider_id=f"p{i}") for i in range(args.users)
+        ])
+        conn.execute(insert(models.Goal), [
+            dict(goal_id=goal_id(i, j), user_id=i + 1, title="t", category="c")
+            for i in range(args.users) for j in range(args.goals_per_user)
+        ])
+        rows = []
+        for i in range(args.users):
+            for j in range(args.goals_per_user):
+                for d in range((END - START).days + 1):
+                    if rng.random() < 0.7:
+                        rows.append(dict(
+                            goal_id=goal_id(i, j), day=START + timedelta(days=d), user_id=i + 1,
+                            checked_at=datetime(2025, 1, 1), cash=100,
+                        ))
+            if len(rows) >= BATCH:
+                conn.execute(insert(models.GoalCheckin), rows)
+                rows = []
+        if rows:
+            conn.execute(insert(models.GoalCheckin), rows)
+
+
+def run():
+    start = time.perf_counter()
+    seed()
+    report("seed", time.perf_counter() - start, "s")
+
+    db = SessionLocal()
+    report("goal_checkin rows", db.query(models.GoalCheckin).count())
+    if engine.dialect.name == "sqlite":
+        plan = db.execute(text(
+            "EXPLAIN QUERY PLAN SELECT goal_id, day FROM goal_checkin WHERE user_id = 1 AND day BETWEEN :a AND :b"
+        ), {"a": START, "b": END}).all()
+        print("plan:", " / ".join(row[-1] for row in plan))
+
+    user_ids = [1 + i * args.users // args.requests for i in range(args.requests)]
+    it = iter(user_ids)
+    report("query + encode", per_call(lambda: calendar_bitmaps(db, next(it), START, END), args.requests) * 1000, "ms")
+
+    client = TestClient(main.app)
+    headers = [{"Authorization": f"Bearer {create_access_token(uid, 'u')}"} for uid in user_ids]
+    it = iter(headers)
+    params = {"from": START.isoformat(), "to": END.isoformat()}
+    response = client.get("/goals/calendar", params=params, headers=headers[0])
+    report("GET /goals/calendar (TestClient)", per_call(lambda: client.get("/goals/calendar", params=params, headers=next(it)), args.requests) * 1000, "ms")
+    report("response size", len(response.content), "bytes")
+
+
+if __name__ == "__main__":
+    run()
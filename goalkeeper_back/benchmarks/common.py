@@ -0,0 +1,30 @@
+# 벤치마크/부하 테스트 공통
+# - 실행: goalkeeper_back 에서 python -m benchmarks.<이름> [옵션]
+# - 기본은 임시 SQLite 파일 DB, BENCH_DB_URL 을 주면 그 DB 사용 (예: 로컬 MySQL, 비어 있는 DB 로)
+# - app 을 import 하기 전에 use_temp_database() 를 먼저 호출해야 설정이 반영됨
+import os
+import tempfile
+import time
+from typing import Callable
+
+
+def use_temp_database(**env: str):
+    tmpdir = tempfile.mkdtemp(prefix="goalkeeper-bench-")
+    os.environ["DB_URL"] = os.getenv("BENCH_DB_URL") or f"sqlite:///{os.path.join(tmpdir, 'bench.db')}"
+    os.environ["UPLOAD_DIR"] = os.path.join(tmpdir, "uploads")
+    os.environ.setdefault("SECRET_KEY", "bench-secret")
+    os.environ["SCHEDULER_ENABLED"] = "false"
+    os.environ.update(env)
+
+
+# fn 을 n 번 돌려서 1회 평균 시간(초)
+def per_call(fn: Callable[[], object], n: int) -> float:
+    start = time.perf_counter()
+    for _ in range(n):
+        fn()
+    return (time.perf_counter() - start) / n
+
+
+def report(label: str, value: float, unit: str = ""):
+    text = f"{value:,}" if isinstance(value, int) else f"{value:,.3f}"
+    print(f"{label:<40} {text:>14} {unit}")
@@ -0,0 +1,66 @@
+# 커넥션 풀 고갈 재현 + 풀 지표 확인
+# - 작은 풀(기본 2개, overflow 0, 대기 0.2초)에 동시 요청을 몰아서 QueuePool 대기/타임아웃을 만들고
+#   /metrics 의 db_pool_* 값을 출력
+# - 요청 하나가 커넥션을 hold 초 동안 잡고 있는 상황(느린 쿼리)을 스레드로 흉내냄
+#   python -m benchmarks.db_pool --workers 20 --hold 0.1
+import argparse
+import threading
+import time
+
+from benchmarks.common import report, use_temp_database
+
+parser = argparse.ArgumentParser()
+parser.add_argument("--pool-size", default="2")
+parser.add_argument("--max-overflow", default="0")
+parser.add_argument("--pool-timeout", default="0.2")
+parser.add_argument("--workers", type=int, default=20)
+parser.add_argument("--requests", type=int, default=10, help="워커 하나당 요청 수")
+parser.add_argument("--hold", type=float, default=0.1, help="요청 하나가 커넥션을 잡고 있는 시간(초)")
+args = parser.parse_args()
+
+use_temp_database(DB_POOL_SIZE=args.pool_size, DB_MAX_OVERFLOW=args.max_overflow, DB_POOL_TIMEOUT=args.pool_timeout)
+
+from fastapi.testclient import TestClient  # noqa: E402
+from sqlalchemy import text  # noqa: E402
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError  # noqa: E402
+
+import main  # noqa: E402
+from app.database import engine  # noqa: E402
+
+
+def run():
+    client = TestClient(main.app)
+    ok, timeouts = [0], [0]
+    lock = threading.Lock()
+
+    def worker():
+        for _ in range(args.requests):
+            try:
+                with engine.connect() as conn:
+                    conn.execute(text("SELECT 1"))
+                    time.sleep(args.hold)
+                result = ok
+            except PoolTimeoutError:
+                result = timeouts
+            with lock:
+                result[0] += 1
+
+    threads = [threading.Thread(target=worker) for _ in range(args.workers)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+
+    print(f"pool_size={args.pool_size} max_overflow={args.max_overflow} timeout={args.pool_timeout}s "
+          f"workers={args.workers} hold={args.hold}s")
+    report("completed", ok[0])
+    report("pool timeouts", timeouts[0])
+    report("throughput", ok[0] / elapsed, "req/s")
+    print()
+    print("\n".join(line for line in client.get("/metrics").text.splitlines() if not line.startswith("#")))
+
+
+if __name__ == "__main__":
+    run()
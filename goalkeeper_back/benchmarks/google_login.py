@@ -0,0 +1,90 @@
+# 구글 로그인 처리량 (POST /auth/google)
+# - 로컬에서 만든 RSA 키로 ID 토큰을 서명하고, 그 공개키를 내려주는 JWKS 스텁 서버를 띄움
+# - 키는 캐시되므로 로그인 수와 상관없이 JWKS 요청은 한 번이어야 함
+#   python -m benchmarks.google_login --logins 500
+import argparse
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+from jose import jwk, jwt
+
+from benchmarks.common import report, use_temp_database
+
+parser = argparse.ArgumentParser()
+parser.add_argument("--logins", type=int, default=500)
+parser.add_argument("--users", type=int, default=50, help="서로 다른 구글 계정 수")
+args = parser.parse_args()
+
+private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+private_pem = private_key.private_bytes(
+    serialization.Encoding.PEM, serialization.PrivateFormat.PKCS8, serialization.NoEncryption()
+).decode()
+public_jwk = {
+    key: value.decode() if isinstance(value, bytes) else value
+    for key, value in jwk.construct(
+        private_key.public_key().public_bytes(serialization.Encoding.PEM, serialization.PublicFormat.SubjectPublicKeyInfo),
+        "RS256",
+    ).to_dict().items()
+}
+public_jwk.update(kid="bench-key", use="sig")
+jwks_hits = [0]
+
+
+class JWKSHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        jwks_hits[0] += 1
+        body = json.dumps({"keys": [public_jwk]}).encode()
+        self.send_response(200)
+        self.send_header("Cache-Control", "public, max-age=20000")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+server = ThreadingHTTPServer(("127.0.0.1", 0), JWKSHandler)
+threading.Thread(target=server.serve_forever, daemon=True).start()
+
+use_temp_database(GOOGLE_CERTS_URL=f"http://127.0.0.1:{server.server_port}/certs", GOOGLE_CLIENT_IDS="bench-app")
+
+from fastapi.testclient import TestClient  # noqa: E402
+
+import main  # noqa: E402
+
+
+def make_token(sub: str) -> str:
+    now = int(time.time())
+    claims = {
+        "iss": "https://accounts.google.com", "aud": "bench-app", "sub": sub,
+        "email": f"{sub}@example.com", "name": sub, "exp": now + 600, "iat": now,
+    }
+    return jwt.encode(claims, private_pem, algorithm="RS256", headers={"kid": "bench-key"})
+
+
+def run():
+    tokens = [make_token(f"google-{i}") for i in range(args.users)]
+    with TestClient(main.app) as client:
+        # 가입은 미리 (로그인만 측정)
+        for token in tokens:
+            assert client.post("/auth/google", json={"token": token}).status_code == 200
+
+        start = time.perf_counter()
+        for i in range(args.logins):
+            response = client.post("/auth/google", json={"token": tokens[i % len(tokens)]})
+            assert response.status_code == 200, response.text
+        elapsed = time.perf_counter() - start
+
+    report("logins", args.logins)
+    report("throughput (TestClient, one client)", args.logins / elapsed, "logins/s")
+    report("per login", elapsed / args.logins * 1000, "ms")
+    report("JWKS fetches", jwks_hits[0])
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,77 @@
+# 랭킹 (app/services/leaderboard.py) 부하 테스트
+# - 유저 N 명 (기본 100만) 을 넣고 전체 재계산, 순위 조회, 주변 순위 조회, 값 갱신 시간 측정
+# - 끝나면 덩어리 정렬 구조가 평범한 정렬 리스트와 같은 결과를 내는지 확인
+#   python -m benchmarks.leaderboard --users 1000000
+import argparse
+import random
+import time
+
+from benchmarks.common import per_call, report, use_temp_database
+
+parser = argparse.ArgumentParser()
+parser.add_argument("--users", type=int, default=1_000_000)
+parser.add_argument("--operations", type=int, default=10_000)
+args = parser.parse_args()
+
+use_temp_database()
+
+from sqlalchemy import insert  # noqa: E402
+
+import main  # noqa: E402, F401  (테이블 생성)
+from app import models  # noqa: E402
+from app.database import SessionLocal, engine  # noqa: E402
+from app.services.leaderboard import BOARDS, Leaderboard  # noqa: E402
+
+BATCH = 200_000
+
+
+def seed(rng):
+    with engine.begin() as conn:
+        for lo in range(0, args.users, BATCH):
+            conn.execute(insert(models.User), [
+                dict(id=i + 1, nickname="u", provider="bench", provider_id=f"p{i}",
+                     total_streak=rng.randrange(100), level=rng.randrange(1, 50),
+                     exp=rng.randrange(100), cash=rng.randrange(100_000))
+                for i in range(lo, min(lo + BATCH, args.users))
+            ])
+
+
+def check_consistency(board: Leaderboard, user_ids):
+    for name, key in BOARDS.items():
+        expected = sorted(key(user_id, stats) for user_id, stats in board._stats.items())
+        keys = board._sorted[name]
+        assert len(keys) == len(expected)
+        for position in range(0, len(expected), max(1, len(expected) // 1000)):
+            assert keys[position] == expected[position]
+        for user_id in user_ids:
+            assert keys[board.rank(name, user_id) - 1][-1] == user_id
+
+
+def run():
+    rng = random.Random(0)
+    start = time.perf_counter()
+    seed(rng)
+    report("seed", time.perf_counter() - start, "s")
+
+    db = SessionLocal()
+    board = Leaderboard()
+    start = time.perf_counter()
+    board.rebuild(db)
+    report("rebuild", time.perf_counter() - start, "s")
+    report("  users", len(board))
+
+    user_ids = [rng.randrange(1, args.users + 1) for _ in range(args.operations)]
+    it = iter(user_ids)
+    report("rank", per_call(lambda: board.rank("level", next(it)), args.operations) * 1e6, "us")
+    it = iter(user_ids)
+    report("around (5 each side)", per_call(lambda: board.around("cash", next(it), 5), args.operations) * 1e6, "us")
+    it = iter(user_ids)
+    update = lambda: board.update_user(next(it), cash=rng.randrange(100_000), total_streak=rng.randrange(100), level=rng.randrange(1, 50))  # noqa: E731
+    report("update (all boards)", per_call(update, args.operations) * 1e6, "us")
+
+    check_consistency(board, user_ids[:1000])
+    print("consistency check: ok")
+
+
+if __name__ == "__main__":
+    run()
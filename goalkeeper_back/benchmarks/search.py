@@ -0,0 +1,94 @@
+# 게시글 검색 (GET /community/search) 관련도 + 지연시간 벤치마크
+# - 한국어 단어를 섞은 합성 게시글 N 개 + 드문 단어("필라테스")가 제목/본문에 들어간 글을 심어둠
+# - 관련도: 제목에 검색어가 있는 글이 위에 오는지, 커서로 끝까지 넘기면 심은 글을 빠짐없이/중복없이 다 보는지
+# - 지연시간: 드문 단어 / 흔한 단어에 대해 LIKE 전체 탐색과 FTS 비교 (SQLite), API 전체 시간
+#   python -m benchmarks.search --posts 100000
+import argparse
+import random
+import time
+
+from benchmarks.common import per_call, report, use_temp_database
+
+parser = argparse.ArgumentParser()
+parser.add_argument("--posts", type=int, default=100_000)
+parser.add_argument("--requests", type=int, default=10)
+args = parser.parse_args()
+
+use_temp_database()
+
+from fastapi.testclient import TestClient  # noqa: E402
+from sqlalchemy import insert, text  # noqa: E402
+
+import main  # noqa: E402
+from app import models  # noqa: E402
+from app.database import engine  # noqa: E402
+
+WORDS = (
+    "오늘 아침 저녁 운동 달리기 독서 공부 명상 일기 물마시기 스트레칭 요가 영어 코딩 산책 다이어트 식단 기상 "
+    "수면 인증 완료 목표 성공 실패 다시 시작 꾸준히 습관 루틴 주말 평일 한강 헬스장 도서관 카페"
+).split()
+RARE = "필라테스"
+TITLE_HITS, CONTENT_HITS = 5, 20
+
+
+def seed():
+    rng = random.Random(1)
+    with engine.begin() as conn:
+        conn.execute(insert(models.User), [dict(id=1, nickname="u", provider="bench", provider_id="p")])
+        for lo in range(0, args.posts, 50_000):
+            conn.execute(insert(models.BoardPost), [
+                dict(user_id=1, title=" ".join(rng.choices(WORDS, k=3)), content=" ".join(rng.choices(WORDS, k=30)))
+                for _ in range(lo, min(lo + 50_000, args.posts))
+            ])
+        conn.execute(insert(models.BoardPost), [
+            dict(user_id=1, title=f"{RARE} 첫 수업", content="오늘 운동 완료") for _ in range(TITLE_HITS)
+        ])
+        conn.execute(insert(models.BoardPost), [
+            dict(user_id=1, title="오늘 운동", content=" ".join(rng.choices(WORDS, k=30)) + f" {RARE}")
+            for _ in range(CONTENT_HITS)
+        ])
+
+
+def run():
+    start = time.perf_counter()
+    seed()
+    report("seed + index", time.perf_counter() - start, "s")
+
+    client = TestClient(main.app)
+
+    # 관련도
+    top = client.get("/community/search", params={"q": RARE, "limit": TITLE_HITS}).json()["items"]
+    report(f"title hits in top {TITLE_HITS}", sum(RARE in item["title"] for item in top))
+    seen, cursor = [], None
+    while True:
+        params = {"q": RARE, "limit": 7, **({"cursor": cursor} if cursor else {})}
+        page = client.get("/community/search", params=params).json()
+        seen += [item["post_id"] for item in page["items"]]
+        cursor = page["next_cursor"]
+        if not cursor:
+            break
+    report("paged hits (planted)", len(seen))
+    report("paged hits (distinct)", len(set(seen)))
+    assert len(seen) == len(set(seen)) == TITLE_HITS + CONTENT_HITS
+
+    # 지연시간
+    if engine.dialect.name == "sqlite":
+        like_sql = text("SELECT post_id FROM board_post WHERE title LIKE :q OR content LIKE :q ORDER BY post_id DESC LIMIT 11")
+        fts_sql = text(
+            "SELECT rowid, -bm25(board_post_fts, 2.0, 1.0) AS s FROM board_post_fts "
+            "WHERE board_post_fts MATCH :q ORDER BY s DESC LIMIT 11"
+        )
+        with engine.connect() as conn:
+            for word in (RARE, "크로스핏", "스트레칭"):
+                like = per_call(lambda: conn.execute(like_sql, {"q": f"%{word}%"}).all(), 5)
+                fts = per_call(lambda: conn.execute(fts_sql, {"q": f'"{word}"'}).all(), 5)
+                report(f"LIKE '{word}'", like * 1000, "ms")
+                report(f"FTS  '{word}'", fts * 1000, "ms")
+
+    for query in (RARE, "스트레칭 명상", "수영"):
+        latency = per_call(lambda: client.get("/community/search", params={"q": query, "limit": 10}), args.requests)
+        report(f"GET /community/search '{query}'", latency * 1000, "ms")
+
+
+if __name__ == "__main__":
+    run()
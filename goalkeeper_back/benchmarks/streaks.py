@@ -0,0 +1,84 @@
+# 끊긴 스트릭 일괄 정리 작업 (app/services/streaks.py) 벤치마크
+# - 유저 N 명 x 목표 M 개 (기본 10만 x 10 = 목표 100만 개), 4개 시간대, 주기 섞어서 생성
+# - 1회차 (정리할 게 있음) / 2회차 (이미 정리됨, 아무것도 안 바뀌어야 함) 시간 측정
+# - MySQL 은 goal.user_id 에 FK 인덱스가 자동으로 생기므로 SQLite 에서도 같은 인덱스를 만들어서 비교
+#   (--without-user-index 로 끄면 인덱스 없는 경우)
+#   python -m benchmarks.streaks --users 100000 --goals-per-user 10
+import argparse
+import time
+from datetime import timedelta
+
+from benchmarks.common import report, use_temp_database
+
+parser = argparse.ArgumentParser()
+parser.add_argument("--users", type=int, default=100_000)
+parser.add_argument("--goals-per-user", type=int, default=10)
+parser.add_argument("--without-user-index", action="store_true")
+args = parser.parse_args()
+
+use_temp_database()
+
+from sqlalchemy import insert, text  # noqa: E402
+
+import main  # noqa: E402, F401  (테이블 생성)
+from app import models  # noqa: E402
+from app.core.timeutil import local_date, utcnow  # noqa: E402
+from app.database import SessionLocal, engine  # noqa: E402
+from app.services.periods import PERIODS, period_start  # noqa: E402
+from app.services.streaks import reset_all_broken_streaks  # noqa: E402
+
+TIMEZONES = ["Asia/Seoul", "UTC", "America/New_York", "Europe/Berlin"]
+BATCH = 200_000
+
+
+def seed(now):
+    with engine.begin() as conn:
+        conn.execute(insert(models.User), [
+            dict(
+                id=i + 1, nickname="u", provider="bench", provider_id=f"p{i}", timezone=TIMEZONES[i % len(TIMEZONES)],
+                total_streak=i % 5, last_check_date=now - timedelta(hours=i % 72), data_version=0,
+            )
+            for i in range(args.users)
+        ])
+        rows = []
+        for i in range(args.users):
+            tz = TIMEZONES[i % len(TIMEZONES)]
+            for j in range(args.goals_per_user):
+                period = PERIODS[(i + j) % len(PERIODS)]
+                # 최근 0~40일 사이에 마지막 인증
+                last = now - timedelta(hours=(i * 7 + j * 13) % (40 * 24))
+                rows.append(dict(
+                    user_id=i + 1, title="t", category="c", period=period, current_streak=1 + j % 3,
+                    last_verified_at=last, period_start=period_start(period, local_date(last, tz)),
+                ))
+            if len(rows) >= BATCH:
+                conn.execute(insert(models.Goal), rows)
+                rows = []
+        if rows:
+            conn.execute(insert(models.Goal), rows)
+        if engine.dialect.name == "sqlite" and not args.without_user_index:
+            conn.execute(text("CREATE INDEX IF NOT EXISTS ix_bench_goal_user_id ON goal (user_id)"))
+
+
+def run():
+    now = utcnow()
+    start = time.perf_counter()
+    seed(now)
+    report("seed", time.perf_counter() - start, "s")
+    report("goals", args.users * args.goals_per_user)
+
+    db = SessionLocal()
+    start = time.perf_counter()
+    first = reset_all_broken_streaks(db, now=now)
+    report("run 1", time.perf_counter() - start, "s")
+    report("  users reset", sum(users for users, _ in first.values()))
+    report("  goals reset", sum(goals for _, goals in first.values()))
+
+    start = time.perf_counter()
+    second = reset_all_broken_streaks(db, now=now)
+    report("run 2 (no-op)", time.perf_counter() - start, "s")
+    assert all(result == (0, 0) for result in second.values()), second
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,83 @@
+# 인기글 (GET /community/trending) 벤치마크
+# - 게시글 N 개, 반응 M 개 (소수 글에 반응이 몰리도록 파레토 분포), 최근 30일 안에 흩뿌림
+# - 점수 재계산 / 감쇠 작업 시간, "반응 수 집계 후 정렬" 방식과 인기글 API 시간 비교
+#   python -m benchmarks.trending --posts 50000 --reactions 1000000
+import argparse
+import random
+import time
+from datetime import timedelta
+
+from benchmarks.common import per_call, report, use_temp_database
+
+parser = argparse.ArgumentParser()
+parser.add_argument("--posts", type=int, default=50_000)
+parser.add_argument("--reactions", type=int, default=1_000_000)
+parser.add_argument("--users", type=int, default=20_000)
+parser.add_argument("--requests", type=int, default=50)
+args = parser.parse_args()
+
+use_temp_database()
+
+from fastapi.testclient import TestClient  # noqa: E402
+from sqlalchemy import insert, text  # noqa: E402
+
+import main  # noqa: E402
+from app import models  # noqa: E402
+from app.core.timeutil import utcnow  # noqa: E402
+from app.database import SessionLocal, engine  # noqa: E402
+from app.services.trending import decay_trending_scores, rebuild_trending_scores  # noqa: E402
+
+BATCH = 200_000
+
+
+def seed(now):
+    rng = random.Random(0)
+    with engine.begin() as conn:
+        conn.execute(insert(models.User), [
+            dict(id=i + 1, nickname="u", provider="bench", provider_id=f"p{i}") for i in range(args.users)
+        ])
+        conn.execute(insert(models.BoardPost), [
+            dict(post_id=i + 1, user_id=1 + i % args.users, title="t", content="c",
+                 created_at=now - timedelta(hours=rng.random() * 24 * 30))
+            for i in range(args.posts)
+        ])
+        rows = []
+        for k in range(args.reactions):
+            rows.append(dict(
+                post_id=1 + int(rng.paretovariate(1.2)) % args.posts, user_id=1 + k % args.users,
+                emoji_type=rng.choice("🔥👍😀"), created_at=now - timedelta(hours=rng.random() * 24 * 30),
+            ))
+            if len(rows) >= BATCH:
+                conn.execute(insert(models.Reaction), rows)
+                rows = []
+        if rows:
+            conn.execute(insert(models.Reaction), rows)
+
+
+def run():
+    now = utcnow()
+    start = time.perf_counter()
+    seed(now)
+    report("seed", time.perf_counter() - start, "s")
+
+    db = SessionLocal()
+    start = time.perf_counter()
+    scored = rebuild_trending_scores(db, now)
+    report("rebuild scores", time.perf_counter() - start, "s")
+    report("  posts with a score", scored)
+
+    start = time.perf_counter()
+    decayed = decay_trending_scores(db, now + timedelta(minutes=10))
+    report("decay pass (10 min)", time.perf_counter() - start, "s")
+    report("  posts decayed", decayed)
+
+    with engine.connect() as conn:
+        group_sql = text("SELECT post_id, count(*) AS c FROM reaction GROUP BY post_id ORDER BY c DESC LIMIT 10")
+        report("GROUP BY + ORDER BY top 10", per_call(lambda: conn.execute(group_sql).all(), 10) * 1000, "ms")
+
+    client = TestClient(main.app)
+    report("GET /community/trending (TestClient)", per_call(lambda: client.get("/community/trending?limit=10"), args.requests) * 1000, "ms")
+
+
+if __name__ == "__main__":
+    run()
@@ -1,14 +1,40 @@
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
-from fastapi.staticfiles import StaticFiles
+from fastapi.responses import PlainTextResponse
 from fastapi.middleware.cors import CORSMiddleware
 from sqlalchemy.orm import Session
 from app.database import engine, Base, SessionLocal
-from app.routers import auth, goals, community, users,accessories,mascots
+from app.routers import auth, goals, community, users,accessories,mascots,notifications,events,leaderboard
 from app import models
+from app.core.config import settings
+from app.core.google_auth import google_verifier
+from app.core.http import close_http_client, start_http_client
+from app.core.metrics import render_metrics
+from app.core.pubsub import pubsub
+from app.core.static import static_files, static_url
+from app.jobs.scheduler import scheduler
+from app.services.catalog import catalog
+from app.services.search import ensure_search_index
 
 Base.metadata.create_all(bind=engine) 
+ensure_search_index(engine)
+
+# 서버 시작/종료 시 실행
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    await start_http_client()
+    google_verifier.start()
+    await pubsub.start()
+    scheduler.start()
+    yield
+    await scheduler.stop()
+    await pubsub.stop()
+    await google_verifier.stop()
+    await close_http_client()
+
 
-app = FastAPI()
+app = FastAPI(lifespan=lifespan)
 def init_db():
     db = SessionLocal()
     try:
@@ -16,10 +42,10 @@ def init_db():
         if db.query(models.Mascot).count() == 0:
             print("🚀 마스코트 데이터가 없어서 기본 데이터를 생성합니다...")
             mascots_data = [
-                models.Mascot(name="짜근 하먀", species="하마", description="악어랑 하마랑 싸우면 누가 이길까요?", price=0, image_url="/static/액세서리용_하마.png",locked_image_url="액세서리용_하마.png"),
-                models.Mascot(name="고얌이", species="고양이", description="엣취", price=0, image_url="/static/고얌이.png",locked_image_url="/static/노고얌이.png"),
-                models.Mascot(name="겁욱이", species="거북이", description="거북이가 죽으면 먼저 가있던 반려사람이 마중나온다는 얘기가 있다 나는 이 이야기를 무척 좋아한다", price=0, image_url="/static/겁욱이.png", locked_image_url="/static/노겁욱이.png"),
-                models.Mascot(name="갱쥐", species="개", description="겨울이라 군고구마 많이 먹었어요", price=0, image_url="/static/갱쥐.png", locked_image_url="/static/노갱쥐.png")
+                models.Mascot(name="짜근 하먀", species="하마", description="악어랑 하마랑 싸우면 누가 이길까요?", price=0, image_url=static_url("/static/액세서리용_하마.png"),locked_image_url="액세서리용_하마.png"),
+                models.Mascot(name="고얌이", species="고양이", description="엣취", price=0, image_url=static_url("/static/고얌이.png"),locked_image_url=static_url("/static/노고얌이.png")),
+                models.Mascot(name="겁욱이", species="거북이", description="거북이가 죽으면 먼저 가있던 반려사람이 마중나온다는 얘기가 있다 나는 이 이야기를 무척 좋아한다", price=0, image_url=static_url("/static/겁욱이.png"), locked_image_url=static_url("/static/노겁욱이.png")),
+                models.Mascot(name="갱쥐", species="개", description="겨울이라 군고구마 많이 먹었어요", price=0, image_url=static_url("/static/갱쥐.png"), locked_image_url=static_url("/static/노갱쥐.png"))
             ]
             db.add_all(mascots_data)
             db.commit()
@@ -29,20 +55,31 @@ def init_db():
         if db.query(models.Accessory).count() == 0:
             print("🚀 액세서리 데이터가 없어서 기본 데이터를 생성합니다...")
             accessories_data = [
-                models.Accessory(name="봄", type="background", price=0, image_url="/static/봄.png"),
-                models.Accessory(name="여름", type="background", price=0, image_url="/static/여름.png"),
-                models.Accessory(name="가을", type="background", price=0, image_url="/static/가을.png"),
-                models.Accessory(name="겨울", type="background", price=0, image_url="/static/겨울.png"),
-                models.Accessory(name="비니", type="head", price=0, image_url="/static/비니.png"),
-                models.Accessory(name="초롱눈", type="face", price=0, image_url="/static/초롱눈.png"),
-                models.Accessory(name="금목걸이", type="neck", price=0, image_url="/static/금목걸이.png"),
-                models.Accessory(name="방", type="background", price=0, image_url="/static/방.png"), # 기본 무료
-                models.Accessory(name="메로나 하마", type="body", price=0, image_url="/static/메로나하마.png")
+                models.Accessory(name="봄", type="background", price=0, image_url=static_url("/static/봄.png")),
+                models.Accessory(name="여름", type="background", price=0, image_url=static_url("/static/여름.png")),
+                models.Accessory(name="가을", type="background", price=0, image_url=static_url("/static/가을.png")),
+                models.Accessory(name="겨울", type="background", price=0, image_url=static_url("/static/겨울.png")),
+                models.Accessory(name="비니", type="head", price=0, image_url=static_url("/static/비니.png")),
+                models.Accessory(name="초롱눈", type="face", price=0, image_url=static_url("/static/초롱눈.png")),
+                models.Accessory(name="금목걸이", type="neck", price=0, image_url=static_url("/static/금목걸이.png")),
+                models.Accessory(name="방", type="background", price=0, image_url=static_url("/static/방.png")), # 기본 무료
+                models.Accessory(name="메로나 하마", type="body", price=0, image_url=static_url("/static/메로나하마.png"))
             ]
             db.add_all(accessories_data)
             db.commit()
             print("✅ 액세서리 생성 완료!")
-            
+
+        # 이미 저장된 이미지 주소를 현재 파일 내용의 해시 주소로 맞춤 (그림이 바뀌면 주소도 바뀜)
+        for item in db.query(models.Mascot).all() + db.query(models.Accessory).all():
+            if item.image_url:
+                item.image_url = static_url(item.image_url)
+            if getattr(item, "locked_image_url", None):
+                item.locked_image_url = static_url(item.locked_image_url)
+        db.commit()
+
+        # 도감 캐시 미리 채우기 (로그인 때 쓰는 기본 아이템 id 도 여기서 확정)
+        catalog.get(db)
+
     except Exception as e:
         print(f"❌ 데이터 초기화 중 오류 발생: {e}")
     finally:
@@ -58,14 +95,30 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
-app.mount("/static", StaticFiles(directory="uploads"), name="static")
+app.mount("/static", static_files, name="static")
 
 app.include_router(auth.router, prefix="/auth", tags=["Auth"])
-app.include_router(goals.router, prefix="/goals", tags=["Goals"])
-app.include_router(community.router, prefix="/community", tags=["Community"])
-app.include_router(users.router, prefix="/users", tags=["Users"])
-app.include_router(mascots.router, prefix="/mascots", tags=["Mascots"])
-app.include_router(accessories.router, prefix="/accessories", tags=["Accessories"])
+app.include_router(events.router, prefix="/events", tags=["Events"])
+
+# DB_ASYNC=true 면 같은 라우트를 AsyncSession 기반으로 등록 (두 스택을 같은 부하 테스트로 비교 가능)
+if settings.DB_ASYNC:
+    from app.routers.aio import make_async_router
+    serve = make_async_router
+else:
+    serve = lambda router: router
+
+app.include_router(serve(goals.router), prefix="/goals", tags=["Goals"])
+app.include_router(serve(community.router), prefix="/community", tags=["Community"])
+app.include_router(serve(users.router), prefix="/users", tags=["Users"])
+app.include_router(serve(mascots.router), prefix="/mascots", tags=["Mascots"])
+app.include_router(serve(accessories.router), prefix="/accessories", tags=["Accessories"])
+app.include_router(serve(notifications.router), prefix="/notifications", tags=["Notifications"])
+app.include_router(serve(leaderboard.router), prefix="/leaderboard", tags=["Leaderboard"])
 @app.get("/")
 def read_root():
-    return {"message": "Goal Keeper Server Running!"}
\ No newline at end of file
+    return {"message": "Goal Keeper Server Running!"}
+
+# 서버 지표 (Prometheus 수집용)
+@app.get("/metrics", response_class=PlainTextResponse, include_in_schema=False)
+def read_metrics():
+    return render_metrics(engine)
\ No newline at end of file
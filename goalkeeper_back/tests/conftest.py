@@ -0,0 +1,90 @@
+# 테스트 공통 설정
+# - 임시 SQLite 파일 DB 로 앱을 띄움 (환경변수는 app 을 import 하기 전에 설정해야 함)
+# - 테스트마다 도감(마스코트/액세서리)을 뺀 모든 테이블을 비움
+import os
+import tempfile
+
+_tmpdir = tempfile.mkdtemp(prefix="goalkeeper-test-")
+os.environ["DB_URL"] = f"sqlite:///{os.path.join(_tmpdir, 'test.db')}"
+os.environ["UPLOAD_DIR"] = os.path.join(_tmpdir, "uploads")
+os.environ.setdefault("SECRET_KEY", "test-secret")
+os.environ["SCHEDULER_ENABLED"] = "false"
+os.environ["DB_ASYNC"] = "false"
+os.environ["GOOGLE_CERTS_URL"] = "http://127.0.0.1:9/certs"  # 테스트 중에 구글을 부르지 않도록
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+
+import main
+from app import models
+from app.database import Base, SessionLocal, engine
+from app.routers.auth import create_access_token
+
+CATALOG_TABLES = {"mascot", "accessory"}
+
+
+# MySQL 처럼 외래키 제약을 검사 (SQLite 는 기본으로 꺼져 있음)
+@event.listens_for(engine, "connect")
+def _enable_foreign_keys(dbapi_connection, connection_record):
+    dbapi_connection.execute("PRAGMA foreign_keys = ON")
+
+
+@pytest.fixture(autouse=True)
+def clean_tables():
+    yield
+    with engine.begin() as conn:
+        for table in reversed(Base.metadata.sorted_tables):
+            if table.name not in CATALOG_TABLES:
+                conn.execute(table.delete())
+
+
+@pytest.fixture
+def client():
+    with TestClient(main.app) as client:
+        yield client
+
+
+@pytest.fixture
+def db():
+    session = SessionLocal()
+    try:
+        yield session
+    finally:
+        session.close()
+
+
+@pytest.fixture
+def make_user(db):
+    counter = iter(range(1, 1_000_000))
+
+    def make(**fields):
+        n = next(counter)
+        fields.setdefault("nickname", f"user{n}")
+        user = models.User(provider="kakao", provider_id=f"test-{n}", **fields)
+        db.add(user)
+        db.commit()
+        db.refresh(user)
+        return user
+
+    return make
+
+
+def auth_header(user) -> dict:
+    return {"Authorization": f"Bearer {create_access_token(user.id, user.nickname)}"}
+
+
+# GET 요청 하나가 DB 에 보낸 SQL 문 수 -> (문 수, 응답 JSON)
+def count_statements(client, path, headers):
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        response = client.get(path, headers=headers)
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+    assert response.status_code == 200, response.text
+    return len(statements), response.json()
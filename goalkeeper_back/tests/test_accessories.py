@@ -0,0 +1,26 @@
+from sqlalchemy import delete, insert
+
+from app import models
+from app.database import engine
+from app.services.catalog import catalog
+from tests.conftest import auth_header
+
+
+def test_equip_item_missing_from_catalog_returns_404(client, db, make_user):
+    # 다른 서버(워커)에서 추가돼 이 서버의 도감 캐시에는 아직 없는 아이템이어도 500 대신 404
+    user = make_user()
+    catalog.get(db)
+    with engine.begin() as conn:
+        accessory_id = conn.execute(
+            insert(models.Accessory).values(name="테스트 모자", type="hat", price=0, image_url="/static/hat.png")
+        ).inserted_primary_key[0]
+        conn.execute(insert(models.UserAccessory).values(user_id=user.id, accessory_id=accessory_id, is_active=False))
+
+    try:
+        response = client.post(f"/accessories/{accessory_id}/equip", headers=auth_header(user))
+        assert response.status_code == 404
+    finally:
+        with engine.begin() as conn:
+            conn.execute(delete(models.UserAccessory).where(models.UserAccessory.accessory_id == accessory_id))
+            conn.execute(delete(models.Accessory).where(models.Accessory.accessory_id == accessory_id))
+        catalog.invalidate()
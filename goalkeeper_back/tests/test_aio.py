@@ -0,0 +1,70 @@
+import threading
+
+from fastapi import APIRouter, Depends, FastAPI, HTTPException, Request
+from fastapi.testclient import TestClient
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import Session
+
+from app.core.blocking import run_blocking
+from app.database import get_async_db, get_db
+from app.routers.aio import make_async_router
+
+
+def _require_header(request: Request):
+    if "x-test" not in request.headers:
+        raise HTTPException(status_code=400, detail="x-test 헤더가 없습니다.")
+
+
+def _build_app(tmp_path):
+    threads = {}
+    sync_router = APIRouter()
+
+    @sync_router.get("/work", tags=["Work"], summary="무거운 작업", dependencies=[Depends(_require_header)])
+    def work(db: Session = Depends(get_db)):
+        threads["handler"] = threading.get_ident()
+        threads["work"] = run_blocking(threading.get_ident)
+        return {"value": db.execute(text("SELECT 1")).scalar()}
+
+    @sync_router.get("/hidden", include_in_schema=False, responses={418: {"description": "teapot"}})
+    def hidden(db: Session = Depends(get_db)):
+        return {}
+
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'aio.db'}")
+    sessions = async_sessionmaker(engine)
+
+    async def override_async_db():
+        async with sessions() as db:
+            yield db
+
+    app = FastAPI()
+    app.include_router(make_async_router(sync_router))
+    app.dependency_overrides[get_async_db] = override_async_db
+    return app, threads
+
+
+def test_async_router_keeps_route_configuration(tmp_path):
+    app, _ = _build_app(tmp_path)
+    client = TestClient(app)
+
+    # 라우트 dependencies 도 그대로 실행
+    assert client.get("/work").status_code == 400
+    assert client.get("/work", headers={"x-test": "1"}).json() == {"value": 1}
+
+    schema = client.get("/openapi.json").json()
+    assert schema["paths"]["/work"]["get"]["tags"] == ["Work"]
+    assert schema["paths"]["/work"]["get"]["summary"] == "무거운 작업"
+    assert "/hidden" not in schema["paths"]
+
+
+def test_blocking_work_leaves_the_event_loop(tmp_path):
+    app, threads = _build_app(tmp_path)
+    client = TestClient(app)
+
+    assert client.get("/work", headers={"x-test": "1"}).status_code == 200
+    # 핸들러는 run_sync 로 루프 스레드에서, 무거운 작업은 스레드풀에서
+    assert threads["work"] != threads["handler"]
+
+
+def test_run_blocking_calls_directly_on_the_sync_stack():
+    assert run_blocking(threading.get_ident) == threading.get_ident()
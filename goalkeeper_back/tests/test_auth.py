@@ -0,0 +1,46 @@
+import pytest
+from fastapi import HTTPException
+
+from app import models
+from app.routers import auth
+
+
+def _user(db, provider_id):
+    db.expire_all()
+    return db.query(models.User).filter(models.User.provider_id == provider_id).one()
+
+
+def test_signup_grants_default_items(client, db):
+    auth.login_or_signup(db, "kakao", "k-1", "카카오", None)
+
+    user = _user(db, "k-1")
+    assert user.default_items_granted
+    assert db.query(models.UserMascot).filter_by(user_id=user.id, is_active=True).count() == 1
+    assert db.query(models.UserAccessory).filter_by(user_id=user.id, is_active=True).count() == 1
+
+
+def test_missing_default_item_is_granted_on_next_login(client, db, monkeypatch):
+    # 도감에 기본 배경이 없으면 지급 완료로 표시하지 않고, 다음 로그인 때 다시 지급
+    monkeypatch.setattr(auth, "DEFAULT_BACKGROUND_NAME", "없는 배경")
+    auth.login_or_signup(db, "kakao", "k-2", "카카오", None)
+
+    user = _user(db, "k-2")
+    assert not user.default_items_granted
+    assert db.query(models.UserAccessory).filter_by(user_id=user.id).count() == 0
+
+    monkeypatch.undo()
+    auth.login_or_signup(db, "kakao", "k-2", "카카오", None)
+
+    user = _user(db, "k-2")
+    assert user.default_items_granted
+    assert db.query(models.UserMascot).filter_by(user_id=user.id).count() == 1
+    assert db.query(models.UserAccessory).filter_by(user_id=user.id).count() == 1
+
+
+def test_same_provider_id_on_other_provider_is_rejected(client, db):
+    auth.login_or_signup(db, "kakao", "same-id", "카카오", None)
+
+    with pytest.raises(HTTPException) as exc_info:
+        auth.login_or_signup(db, "google", "same-id", "구글", None)
+    assert exc_info.value.status_code == 409
+    assert db.query(models.User).filter_by(provider_id="same-id").count() == 1
@@ -0,0 +1,51 @@
+from app import models
+from app.services.reactions import rebuild_reaction_counts
+from tests.conftest import auth_header, count_statements
+
+
+def _make_posts(db, user, count):
+    posts = [models.BoardPost(user_id=user.id, title=f"글 {i}", content="내용") for i in range(count)]
+    db.add_all(posts)
+    db.commit()
+    return posts
+
+
+def test_feed_pages_do_not_overlap(client, db, make_user):
+    # server_default 로 들어간 created_at 은 같은 초에 몰리므로 (created_at, post_id) 커서가 제대로 넘어가야 함
+    user = make_user()
+    _make_posts(db, user, 9)
+
+    seen = []
+    cursor = None
+    for _ in range(3):
+        params = {"limit": 3}
+        if cursor:
+            params["cursor"] = cursor
+        page = client.get("/community/feed", params=params, headers=auth_header(user)).json()
+        ids = [item["post_id"] for item in page["items"]]
+        assert len(ids) == 3
+        assert not set(ids) & set(seen)
+        seen += ids
+        cursor = page["next_cursor"]
+
+    assert seen == sorted(seen, reverse=True)
+    assert cursor is None
+
+
+def test_feed_query_count_does_not_grow_with_page_size(client, db, make_user):
+    user, reader = make_user(), make_user()
+    posts = _make_posts(db, user, 60)
+    db.add_all(models.Reaction(post_id=post.post_id, user_id=reader.id, emoji_type="🔥") for post in posts[::2])
+    db.commit()
+    rebuild_reaction_counts(db)
+    db.commit()
+
+    small, small_page = count_statements(client, "/community/?limit=5", auth_header(reader))
+    large, large_page = count_statements(client, "/community/?limit=50", auth_header(reader))
+
+    assert len(small_page) == 5 and len(large_page) == 50
+    assert large == small
+    # 반응 집계 / 내 반응도 같이 채워졌는지
+    reacted = [item for item in large_page if item["reaction_counts"]]
+    assert len(reacted) == 25
+    assert all(item["my_reaction"] == "🔥" for item in reacted)
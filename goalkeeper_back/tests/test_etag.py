@@ -0,0 +1,48 @@
+import pytest
+
+from tests.conftest import auth_header
+
+ENDPOINTS = ["/users/me", "/users/me/wardrobe", "/goals/", "/mascots/my", "/accessories/equipped"]
+
+
+def _get(client, user, path, etag=None):
+    headers = auth_header(user)
+    if etag:
+        headers["If-None-Match"] = etag
+    return client.get(path, headers=headers)
+
+
+@pytest.mark.parametrize("path", ENDPOINTS)
+def test_if_none_match_returns_304(client, make_user, path):
+    user = make_user()
+    first = _get(client, user, path)
+    assert first.status_code == 200
+    etag = first.headers["etag"]
+
+    not_modified = _get(client, user, path, etag)
+    assert not_modified.status_code == 304
+    assert not_modified.content == b""
+    assert not_modified.headers["etag"] == etag
+
+
+@pytest.mark.parametrize("path", ENDPOINTS)
+def test_mutation_changes_etag(client, make_user, path):
+    user = make_user()
+    etag = _get(client, user, path).headers["etag"]
+
+    response = client.patch("/users/me", json={"nickname": "새닉네임"}, headers=auth_header(user))
+    assert response.status_code == 200
+
+    changed = _get(client, user, path, etag)
+    assert changed.status_code == 200
+    assert changed.headers["etag"] != etag
+
+
+@pytest.mark.parametrize("path", ENDPOINTS)
+def test_other_users_etag_does_not_match(client, make_user, path):
+    owner, other = make_user(), make_user()
+    etag = _get(client, owner, path).headers["etag"]
+
+    response = _get(client, other, path, etag)
+    assert response.status_code == 200
+    assert response.headers["etag"] != etag
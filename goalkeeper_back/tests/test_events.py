@@ -0,0 +1,40 @@
+import asyncio
+
+from starlette.requests import Request
+
+from app.core.pubsub import pubsub
+from app.routers.auth import create_access_token
+from app.routers.events import stream_events
+
+
+def _request():
+    async def receive():
+        await asyncio.sleep(3600)
+
+    return Request({"type": "http", "method": "GET", "path": "/events/stream", "headers": []}, receive)
+
+
+def _open_stream():
+    return stream_events(request=_request(), token=create_access_token(1, "user1"), credentials=None)
+
+
+def test_unstarted_stream_does_not_subscribe():
+    # 응답을 보내기 전에 연결이 끊기면 제너레이터가 시작되지 않음 -> 허브에 구독이 남으면 안 됨
+    async def main():
+        await _open_stream()
+        assert len(pubsub.hub) == 0
+
+    asyncio.run(main())
+
+
+def test_stream_unsubscribes_when_closed():
+    async def main():
+        response = await _open_stream()
+        body = response.body_iterator
+        assert await body.__anext__() == "retry: 3000\n\n"
+        assert len(pubsub.hub) == 1
+
+        await body.aclose()
+        assert len(pubsub.hub) == 0
+
+    asyncio.run(main())
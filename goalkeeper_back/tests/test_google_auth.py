@@ -0,0 +1,94 @@
+import asyncio
+import json
+import time
+
+import httpx
+import pytest
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+from jose import jwk, jwt
+
+from app.core import google_auth
+from app.core.google_auth import GoogleTokenVerifier
+
+_private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+PRIVATE_PEM = _private_key.private_bytes(
+    serialization.Encoding.PEM, serialization.PrivateFormat.PKCS8, serialization.NoEncryption()
+).decode()
+PUBLIC_JWK = {
+    key: value.decode() if isinstance(value, bytes) else value
+    for key, value in jwk.construct(
+        _private_key.public_key().public_bytes(serialization.Encoding.PEM, serialization.PublicFormat.SubjectPublicKeyInfo),
+        "RS256",
+    ).to_dict().items()
+}
+PUBLIC_JWK.update(kid="k1", use="sig")
+
+
+def make_token(kid="k1", **claims):
+    now = int(time.time())
+    body = {"iss": "https://accounts.google.com", "aud": "app", "sub": "g1", "exp": now + 600, "iat": now, **claims}
+    return jwt.encode(body, PRIVATE_PEM, algorithm="RS256", headers={"kid": kid})
+
+
+class FakeCerts:
+    def __init__(self, body=None, error=None):
+        self.body = {"keys": [PUBLIC_JWK]} if body is None else body
+        self.error = error
+        self.calls = 0
+
+    async def __call__(self, method, url, **kwargs):
+        self.calls += 1
+        await asyncio.sleep(0.01)
+        if self.error:
+            raise self.error
+        return httpx.Response(
+            200,
+            content=json.dumps(self.body),
+            headers={"cache-control": "public, max-age=3600"},
+            request=httpx.Request(method, url),
+        )
+
+
+@pytest.fixture
+def certs(monkeypatch):
+    fake = FakeCerts()
+    monkeypatch.setattr(google_auth, "http_request", fake)
+    return fake
+
+
+def test_concurrent_cold_logins_fetch_keys_once(certs):
+    verifier = GoogleTokenVerifier("http://certs", ["app"])
+
+    async def run():
+        return await asyncio.gather(*(verifier.verify(make_token()) for _ in range(10)))
+
+    assert [claims["sub"] for claims in asyncio.run(run())] == ["g1"] * 10
+    assert certs.calls == 1
+
+
+def test_unknown_kids_do_not_force_a_fetch_per_request(certs):
+    verifier = GoogleTokenVerifier("http://certs", ["app"])
+
+    async def run():
+        await verifier.verify(make_token())
+        for i in range(20):
+            with pytest.raises(ValueError):
+                await verifier.verify(make_token(kid=f"bogus-{i}"))
+
+    asyncio.run(run())
+    assert certs.calls == 1
+
+
+@pytest.mark.parametrize(
+    "fake",
+    [FakeCerts(error=httpx.ConnectError("down")), FakeCerts(body={"nokeys": []}), FakeCerts(body=[1, 2])],
+    ids=["outage", "missing-keys", "not-an-object"],
+)
+def test_google_login_with_unusable_jwks_is_unauthorized(client, monkeypatch, fake):
+    monkeypatch.setattr(google_auth, "http_request", fake)
+    verifier = GoogleTokenVerifier("http://certs", ["app"])
+    monkeypatch.setattr("app.routers.auth.google_verifier", verifier)
+
+    response = client.post("/auth/google", json={"token": make_token()})
+    assert response.status_code == 401
@@ -0,0 +1,72 @@
+import threading
+import time
+from datetime import timedelta
+
+from app import models
+from app.core import idempotency
+from app.core.config import settings
+from app.core.timeutil import utcnow
+from app.routers import goals
+from tests.conftest import auth_header
+
+
+def test_concurrent_retries_with_same_key_get_the_first_response(client, db, make_user, monkeypatch):
+    user = make_user()
+    goal = models.Goal(user_id=user.id, title="물 마시기", category="건강", period="daily")
+    db.add(goal)
+    db.commit()
+
+    # 첫 요청이 보상을 쓰는 도중에 재시도가 도착하도록 잠깐 멈춤
+    apply_rewards = goals.apply_rewards
+
+    def slow_apply_rewards(*args, **kwargs):
+        apply_rewards(*args, **kwargs)
+        time.sleep(0.3)
+
+    monkeypatch.setattr(goals, "apply_rewards", slow_apply_rewards)
+
+    headers = {**auth_header(user), "Idempotency-Key": "check-1"}
+    responses = [None, None]
+
+    def send(i):
+        responses[i] = client.post(f"/goals/{goal.goal_id}/check", headers=headers)
+
+    first = threading.Thread(target=send, args=(0,))
+    retry = threading.Thread(target=send, args=(1,))
+    first.start()
+    time.sleep(0.1)
+    retry.start()
+    first.join()
+    retry.join()
+
+    assert [r.status_code for r in responses] == [200, 200]
+    assert responses[0].json() == responses[1].json()
+
+    db.expire_all()
+    assert db.query(models.GoalCheckin).filter(models.GoalCheckin.goal_id == goal.goal_id).count() == 1
+    assert db.query(models.RewardLedger).filter(models.RewardLedger.user_id == user.id).count() == len(
+        responses[0].json()["rewards_breakdown"]
+    )
+
+
+def test_expired_key_is_processed_again_and_purged(client, db, make_user):
+    user = make_user(cash=1000)
+    headers = {**auth_header(user), "Idempotency-Key": "buy-1"}
+    mascot_id = db.query(models.Mascot.mascot_id).order_by(models.Mascot.mascot_id).first()[0]
+
+    first = client.post(f"/mascots/{mascot_id}/buy", headers=headers)
+    assert first.status_code == 200
+    assert client.post(f"/mascots/{mascot_id}/buy", headers=headers).json() == first.json()
+
+    # 유효 기간이 지난 키는 없는 것으로 보고 새로 처리 (이미 가진 마스코트라 400)
+    expired_at = utcnow() - timedelta(seconds=settings.IDEMPOTENCY_KEY_TTL + 60)
+    db.query(models.IdempotencyKey).update({"created_at": expired_at})
+    db.commit()
+    idempotency._response_cache.clear()
+    assert client.post(f"/mascots/{mascot_id}/buy", headers=headers).status_code == 400
+
+    db.query(models.IdempotencyKey).update({"created_at": expired_at})
+    db.add(models.IdempotencyKey(user_id=user.id, key="fresh", scope="POST /x", response_body="{}", created_at=utcnow()))
+    db.commit()
+    assert idempotency.purge_expired_keys(db) == 1
+    assert [key for (key,) in db.query(models.IdempotencyKey.key)] == ["fresh"]
@@ -0,0 +1,67 @@
+import asyncio
+import threading
+import time
+
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from app.core.config import settings
+from app.database import SessionLocal
+from app.services.leaderboard import Leaderboard
+
+
+def _slow_board(monkeypatch):
+    board = Leaderboard()
+    loads = []
+    sort_boards = Leaderboard._sort_boards
+
+    def slow_sort(stats):
+        loads.append(1)
+        time.sleep(0.2)
+        return sort_boards(stats)
+
+    monkeypatch.setattr(board, "_sort_boards", slow_sort)
+    return board, loads
+
+
+def test_first_load_runs_once_under_concurrency(make_user, monkeypatch):
+    for streak in range(5):
+        make_user(total_streak=streak)
+    board, loads = _slow_board(monkeypatch)
+
+    def load():
+        db = SessionLocal()
+        try:
+            board.ensure_loaded(db)
+        finally:
+            db.close()
+
+    threads = [threading.Thread(target=load) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(loads) == 1
+    assert len(board) == 5
+
+
+def test_first_load_does_not_block_the_event_loop(make_user, monkeypatch):
+    # 비동기 스택: 로드 중인 요청이 루프로 돌아가 있는 동안 다른 요청이 잠금을 기다려도 멈추지 않아야 함
+    make_user()
+    board, loads = _slow_board(monkeypatch)
+    engine = create_async_engine(settings.DB_URL.replace("sqlite://", "sqlite+aiosqlite://", 1))
+    sessions = async_sessionmaker(engine)
+
+    async def load():
+        async with sessions() as db:
+            await db.run_sync(board.ensure_loaded)
+
+    async def main():
+        try:
+            await asyncio.wait_for(asyncio.gather(*[load() for _ in range(4)]), timeout=10)
+        finally:
+            await engine.dispose()
+
+    asyncio.run(main())
+    assert len(loads) == 1
+    assert len(board) == 1
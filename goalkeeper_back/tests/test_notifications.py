@@ -0,0 +1,120 @@
+from app import models
+from tests.conftest import auth_header
+
+
+def _wake_up(client, sender, receivers, goal_id=None):
+    body = {"receiver_ids": [receiver.id for receiver in receivers]}
+    if goal_id is not None:
+        body["goal_id"] = goal_id
+    return client.post("/notifications/wake-up", json=body, headers=auth_header(sender))
+
+
+def _inbox(client, user, **params):
+    response = client.get("/notifications/", params=params, headers=auth_header(user))
+    assert response.status_code == 200
+    return response.json()
+
+
+def _make_goal(db, user):
+    goal = models.Goal(user_id=user.id, title="목표", category="건강")
+    db.add(goal)
+    db.commit()
+    return goal
+
+
+def test_wake_up_fills_inbox_and_unread_counter(client, make_user):
+    sender, first, second = make_user(), make_user(), make_user()
+
+    response = _wake_up(client, sender, [first, second, first, sender])
+    assert response.status_code == 200
+    assert response.json()["delivered"] == [first.id, second.id]
+
+    inbox = _inbox(client, first)
+    assert inbox["unread_count"] == 1
+    assert [(item["sender_id"], item["type"], item["is_read"]) for item in inbox["items"]] == [(sender.id, "wake_up", False)]
+    assert _inbox(client, sender)["items"] == []
+
+
+def test_inbox_pages_with_cursor(client, make_user):
+    sender, receiver = make_user(), make_user()
+    for _ in range(5):
+        _wake_up(client, sender, [receiver])
+
+    seen = []
+    cursor = None
+    while True:
+        params = {"limit": 2}
+        if cursor:
+            params["cursor"] = cursor
+        page = _inbox(client, receiver, **params)
+        seen += [item["notification_id"] for item in page["items"]]
+        cursor = page["next_cursor"]
+        if cursor is None:
+            break
+
+    assert len(seen) == 5
+    assert seen == sorted(seen, reverse=True)
+
+
+def test_mark_read_updates_counter(client, make_user):
+    sender, receiver = make_user(), make_user()
+    for _ in range(3):
+        _wake_up(client, sender, [receiver])
+    first_id = _inbox(client, receiver)["items"][0]["notification_id"]
+
+    response = client.post("/notifications/read", json={"notification_ids": [first_id]}, headers=auth_header(receiver))
+    assert response.json() == {"updated": 1, "unread_count": 2}
+    # 이미 읽은 알림을 다시 읽어도 카운터는 그대로
+    response = client.post("/notifications/read", json={"notification_ids": [first_id]}, headers=auth_header(receiver))
+    assert response.json() == {"updated": 0, "unread_count": 2}
+
+    response = client.post("/notifications/read", json={}, headers=auth_header(receiver))
+    assert response.json() == {"updated": 2, "unread_count": 0}
+    assert len(_inbox(client, receiver, unread_only=True)["items"]) == 0
+
+
+def test_blocked_type_is_not_delivered(client, make_user):
+    sender, receiver = make_user(), make_user()
+    assert client.put("/notifications/blocks/wake_up", headers=auth_header(receiver)).status_code == 200
+    assert client.get("/notifications/blocks", headers=auth_header(receiver)).json() == ["wake_up"]
+
+    assert _wake_up(client, sender, [receiver]).json()["delivered"] == []
+    assert _inbox(client, receiver)["unread_count"] == 0
+
+    assert client.delete("/notifications/blocks/wake_up", headers=auth_header(receiver)).status_code == 200
+    assert _wake_up(client, sender, [receiver]).json()["delivered"] == [receiver.id]
+    assert client.put("/notifications/blocks/unknown", headers=auth_header(receiver)).status_code == 400
+
+
+def test_goal_delete_after_wake_up_keeps_notification(client, db, make_user):
+    sender, receiver = make_user(), make_user()
+    goal = _make_goal(db, receiver)
+    assert _wake_up(client, sender, [receiver], goal_id=goal.goal_id).status_code == 200
+
+    assert client.delete(f"/goals/{goal.goal_id}", headers=auth_header(receiver)).status_code == 200
+    items = _inbox(client, receiver)["items"]
+    assert len(items) == 1
+    assert items[0]["goal_id"] is None
+
+
+def test_withdraw_sender_after_wake_up(client, db, make_user):
+    sender, receiver = make_user(), make_user()
+    _wake_up(client, sender, [receiver])
+    _wake_up(client, sender, [receiver])
+
+    assert client.delete("/users/me", headers=auth_header(sender)).status_code == 200
+    inbox = _inbox(client, receiver)
+    assert inbox["items"] == []
+    assert inbox["unread_count"] == 0
+
+
+def test_withdraw_receiver_with_goal_and_block(client, db, make_user):
+    sender, receiver = make_user(), make_user()
+    goal = _make_goal(db, receiver)
+    _wake_up(client, sender, [receiver], goal_id=goal.goal_id)
+    client.put("/notifications/blocks/friend_request", headers=auth_header(receiver))
+
+    assert client.delete("/users/me", headers=auth_header(receiver)).status_code == 200
+    db.expire_all()
+    assert db.query(models.Notification).count() == 0
+    assert db.query(models.NotificationBlock).count() == 0
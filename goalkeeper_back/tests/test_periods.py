@@ -0,0 +1,125 @@
+# 주기(daily/weekly/yearly) 기간 계산과 연속 기록 경계 - 여러 날짜에 대해 성질(property)로 검사
+# (무작위 입력은 시드 고정 -> 실패하면 같은 입력으로 재현 가능)
+import random
+from datetime import date, datetime, time, timedelta, timezone
+
+import pytest
+
+from app import models
+from app.core.timeutil import get_zone, local_date, local_midnight_utc
+from app.routers import goals
+from app.services import periods
+from tests.conftest import auth_header
+
+TIMEZONES = ["Asia/Seoul", "America/New_York", "Europe/London", "Australia/Lord_Howe", "Pacific/Kiritimati", "UTC"]
+
+
+def _days(start: date, end: date):
+    day = start
+    while day <= end:
+        yield day
+        day += timedelta(days=1)
+
+
+# 주기별 "같은 기간" 판단을 periods 와 다른 방식으로 계산 (ISO 주, 연도)
+def _period_key(period: str, day: date):
+    if period == "weekly":
+        return day.isocalendar()[:2]
+    if period == "yearly":
+        return day.year
+    return day
+
+
+@pytest.mark.parametrize("period", periods.PERIODS)
+def test_period_windows_partition_the_calendar(period):
+    for day in _days(date(1999, 12, 1), date(2041, 1, 31)):
+        start, end = periods.period_window(period, day)
+        assert start <= day < end
+        assert periods.period_start(period, start) == start
+        assert periods.period_start(period, end) == end
+        # 이전 기간은 시작일 바로 전날이 속한 기간, 다음 기간은 끝일에서 시작
+        assert periods.previous_period_start(period, start) == periods.period_start(period, start - timedelta(days=1))
+        assert periods.next_period_start(period, periods.previous_period_start(period, start)) == start
+        # 같은 기간 <=> 같은 시작일
+        assert _period_key(period, day) == _period_key(period, start)
+        assert _period_key(period, end - timedelta(days=1)) == _period_key(period, start)
+        assert _period_key(period, end) != _period_key(period, start)
+
+
+def test_local_date_matches_local_midnights():
+    rng = random.Random(19)
+    base = datetime(2000, 1, 1)
+    for _ in range(5000):
+        tz = rng.choice(TIMEZONES)
+        now = base + timedelta(seconds=rng.randrange(40 * 365 * 24 * 3600))
+        today = local_date(now, tz)
+        assert local_midnight_utc(today, tz) <= now < local_midnight_utc(today + timedelta(days=1), tz)
+
+
+def _utc(day: date, local_time: time, tz: str) -> datetime:
+    local = datetime.combine(day, local_time, tzinfo=get_zone(tz))
+    return local.astimezone(timezone.utc).replace(tzinfo=None)
+
+
+@pytest.mark.parametrize("period", periods.PERIODS)
+def test_check_in_streaks_follow_period_boundaries(client, db, make_user, monkeypatch, period):
+    rng = random.Random(f"streak-{period}")
+    tz = rng.choice(TIMEZONES)
+    user = make_user(timezone=tz)
+    goal = models.Goal(user_id=user.id, title="목표", category="건강", period=period)
+    db.add(goal)
+    db.commit()
+
+    # 기간 하나 안에서 여러 번 / 바로 다음 기간 / 몇 기간 건너뛰기를 섞어서 인증
+    step_days = {"daily": [0, 1, 1, 1, 2, 3], "weekly": [0, 1, 3, 6, 7, 8, 13, 15], "yearly": [0, 30, 200, 365, 400, 800]}[period]
+    day = date(2023, 12, 20)
+    last_key = None
+    streak = 0
+    for _ in range(40):
+        day += timedelta(days=rng.choice(step_days))
+        # 현지 자정 직후 / 직전 같은 경계 시각을 자주 고름
+        local_time = rng.choice([time(0, 0, 1), time(23, 59, 59), time(12, 0)])
+        now = _utc(day, local_time, tz)
+        monkeypatch.setattr(goals, "utcnow", lambda now=now: now)
+
+        response = client.post(f"/goals/{goal.goal_id}/check", headers=auth_header(user))
+        key = _period_key(period, day)
+        if key == last_key:
+            assert response.status_code == 400
+            continue
+
+        assert response.status_code == 200, response.text
+        previous_key = {
+            "daily": lambda: day - timedelta(days=1),
+            "weekly": lambda: (day - timedelta(days=7)).isocalendar()[:2],
+            "yearly": lambda: day.year - 1,
+        }[period]()
+        streak = streak + 1 if last_key is not None and last_key == previous_key else 0
+        last_key = key
+        assert response.json()["current_streak"] == streak
+
+
+def test_check_in_after_timezone_change_reuses_the_day(client, db, make_user, monkeypatch):
+    # 서울에서 1/2 에 인증 -> 하와이로 바꿔 현지 1/1 에 인증 -> 다음 날(현지 1/2) 다시 인증하면 같은 (goal, day) 기록이 이미 있음
+    user = make_user(timezone="Asia/Seoul")
+    goal = models.Goal(user_id=user.id, title="목표", category="건강", period="daily")
+    db.add(goal)
+    db.commit()
+
+    def check(now):
+        monkeypatch.setattr(goals, "utcnow", lambda: now)
+        return client.post(f"/goals/{goal.goal_id}/check", headers=auth_header(user))
+
+    first = check(_utc(date(2024, 1, 2), time(9, 0), "Asia/Seoul"))
+    assert first.status_code == 200
+
+    user.timezone = "Pacific/Honolulu"
+    db.commit()
+    assert check(_utc(date(2024, 1, 1), time(20, 0), "Pacific/Honolulu")).status_code == 200
+    third = check(_utc(date(2024, 1, 2), time(20, 0), "Pacific/Honolulu"))
+    assert third.status_code == 200, third.text
+
+    db.expire_all()
+    checkins = {c.day: c.cash for c in db.query(models.GoalCheckin).filter_by(goal_id=goal.goal_id)}
+    assert set(checkins) == {date(2024, 1, 1), date(2024, 1, 2)}
+    assert checkins[date(2024, 1, 2)] == first.json()["gained_cash"] + third.json()["gained_cash"]
@@ -0,0 +1,53 @@
+import threading
+
+from sqlalchemy import func
+
+from app import models
+from app.services.rewards import LEVEL_UP_EXP
+from tests.conftest import auth_header
+
+NUM_GOALS = 20
+
+
+def test_parallel_check_ins_keep_balances_exact(client, db, make_user):
+    user = make_user(cash=0, exp=90, level=1)
+    goals = [models.Goal(user_id=user.id, title=f"목표 {i}", category="건강", period="daily") for i in range(NUM_GOALS)]
+    db.add_all(goals)
+    db.commit()
+
+    headers = auth_header(user)
+    barrier = threading.Barrier(NUM_GOALS)
+    responses = []
+    lock = threading.Lock()
+
+    def check(goal_id):
+        barrier.wait()
+        response = client.post(f"/goals/{goal_id}/check", headers=headers)
+        with lock:
+            responses.append(response)
+
+    threads = [threading.Thread(target=check, args=(goal.goal_id,)) for goal in goals]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert [r.status_code for r in responses] == [200] * NUM_GOALS
+    bodies = [r.json() for r in responses]
+
+    db.expire_all()
+    user = db.get(models.User, user.id)
+    ledger_cash, ledger_exp, ledger_rows = db.query(
+        func.sum(models.RewardLedger.cash), func.sum(models.RewardLedger.exp), func.count()
+    ).filter(models.RewardLedger.user_id == user.id).one()
+
+    # 잃어버린 갱신 없이 응답/장부/지갑이 정확히 일치
+    # (SQLite 는 FOR UPDATE 를 무시하므로 여기서는 원자적 UPDATE 로 보장되는 값만 확인)
+    assert user.cash == sum(body["gained_cash"] for body in bodies) == ledger_cash
+    assert ledger_rows == sum(len(body["rewards_breakdown"]) for body in bodies)
+    total_exp = 90 + sum(body["gained_exp"] for body in bodies)
+    assert ledger_exp == total_exp - 90
+    assert user.level == 1 + total_exp // LEVEL_UP_EXP
+    assert user.exp == total_exp % LEVEL_UP_EXP
+
+    assert db.query(models.GoalCheckin).filter(models.GoalCheckin.user_id == user.id).count() == NUM_GOALS
@@ -0,0 +1,77 @@
+from app import models
+from tests.conftest import auth_header
+
+
+def _post(db, user, title, content="내용"):
+    post = models.BoardPost(user_id=user.id, title=title, content=content)
+    db.add(post)
+    db.commit()
+    return post.post_id
+
+
+def _search(client, user, q, **params):
+    response = client.get("/community/search", params={"q": q, **params}, headers=auth_header(user))
+    assert response.status_code == 200, response.text
+    return response.json()
+
+
+def _ids(page):
+    return [item["post_id"] for item in page["items"]]
+
+
+def test_title_match_ranks_above_content_match(client, db, make_user):
+    user = make_user()
+    in_content = _post(db, user, "오늘의 기록", "아침 러닝머신 완료")
+    in_title = _post(db, user, "아침 러닝머신 인증", "오늘도 했다")
+    _post(db, user, "저녁 산책", "산책 완료")
+
+    assert _ids(_search(client, user, "러닝머신")) == [in_title, in_content]
+
+
+def test_cursor_walks_all_results_without_overlap(client, db, make_user):
+    user = make_user()
+    expected = {_post(db, user, f"물 마시기 {i}", "물 마시기 " * (i % 3 + 1)) for i in range(7)}
+    _post(db, user, "운동", "헬스장")
+
+    seen = []
+    cursor = None
+    while True:
+        params = {"limit": 3}
+        if cursor:
+            params["cursor"] = cursor
+        page = _search(client, user, "마시기", **params)
+        seen += _ids(page)
+        cursor = page["next_cursor"]
+        if cursor is None:
+            break
+
+    assert len(seen) == len(set(seen))
+    assert set(seen) == expected
+
+
+def test_two_character_query_uses_like(client, db, make_user):
+    user = make_user()
+    first = _post(db, user, "물 마시기", "하루 2리터")
+    second = _post(db, user, "아침", "1리터 마심")
+    _post(db, user, "운동", "헬스장")
+
+    assert _ids(_search(client, user, "마시")) == [first]
+    # LIKE 로 찾은 결과는 최신순, 특수문자는 그대로 검색
+    assert _ids(_search(client, user, "리터")) == [second, first]
+    assert _ids(_search(client, user, "%%")) == []
+
+
+def test_mixed_short_and_long_terms_keep_short_matches(client, db, make_user):
+    # "헬스 러닝머신": 3글자 이상은 FTS, 2글자 단어로만 찾히는 글은 그 뒤에
+    user = make_user()
+    gym = _post(db, user, "헬스 다녀옴", "하체")
+    treadmill = _post(db, user, "러닝머신 30분", "땀")
+    _post(db, user, "독서", "책 한 권")
+
+    page = _search(client, user, "헬스 러닝머신")
+    assert _ids(page) == [treadmill, gym]
+
+    # 점수 0 인 LIKE 결과까지 커서로 이어짐
+    first_page = _search(client, user, "헬스 러닝머신", limit=1)
+    assert _ids(first_page) == [treadmill]
+    assert _ids(_search(client, user, "헬스 러닝머신", limit=1, cursor=first_page["next_cursor"])) == [gym]
@@ -0,0 +1,59 @@
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.core.static import IMMUTABLE_CACHE, REVALIDATE_CACHE, CachedStaticFiles
+
+
+def _static_client(tmp_path):
+    root = tmp_path / "static"
+    root.mkdir()
+    (root / "고얌이.png").write_bytes(b"cat" * 100)
+    (root / ("a" * 64 + ".jpeg")).write_bytes(b"photo")
+    (tmp_path / "secret.txt").write_bytes(b"secret")
+
+    static_files = CachedStaticFiles(directory=str(root))
+    app = FastAPI()
+    app.mount("/static", static_files, name="static")
+    return TestClient(app), static_files
+
+
+def test_hashed_url_is_immutable(tmp_path):
+    client, static_files = _static_client(tmp_path)
+    url = static_files.hashed_url("/static/고얌이.png")
+    assert url != "/static/고얌이.png"
+
+    response = client.get(url)
+    assert response.status_code == 200
+    assert response.content == b"cat" * 100
+    assert response.headers["cache-control"] == IMMUTABLE_CACHE
+
+    # 예전 해시 주소는 최신 파일을 주되 재검증
+    stale = client.get("/static/고얌이.00000000.png")
+    assert stale.status_code == 200
+    assert stale.headers["cache-control"] == REVALIDATE_CACHE
+
+    assert client.get("/static/고얌이.png").headers["cache-control"] == REVALIDATE_CACHE
+    assert client.get("/static/" + "a" * 64 + ".jpeg").headers["cache-control"] == IMMUTABLE_CACHE
+
+
+def test_conditional_and_range_requests(tmp_path):
+    client, static_files = _static_client(tmp_path)
+    url = static_files.hashed_url("/static/고얌이.png")
+    etag = client.get(url).headers["etag"]
+
+    not_modified = client.get(url, headers={"If-None-Match": etag})
+    assert not_modified.status_code == 304
+    assert not_modified.headers["cache-control"] == IMMUTABLE_CACHE
+
+    partial = client.get(url, headers={"Range": "bytes=0-2"})
+    assert partial.status_code == 206
+    assert partial.content == b"cat"
+    assert partial.headers["cache-control"] == IMMUTABLE_CACHE
+
+
+def test_paths_outside_the_directory_are_not_read(tmp_path):
+    client, static_files = _static_client(tmp_path)
+
+    assert static_files.hashed_url("/static/../secret.txt") == "/static/../secret.txt"
+    assert client.get("/static/..%2Fsecret.00000000.txt").status_code == 404
+    assert static_files._hashes == {}
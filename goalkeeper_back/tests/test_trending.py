@@ -0,0 +1,41 @@
+from datetime import timedelta
+
+import pytest
+from sqlalchemy.dialects import mysql
+from sqlalchemy.schema import CreateTable
+
+from app import models
+from app.core.config import settings
+from app.core.timeutil import utcnow
+from app.services.trending import decay_trending_scores
+from tests.conftest import auth_header
+
+
+def _score(db, post_id):
+    db.expire_all()
+    return db.get(models.BoardPost, post_id).trending_score
+
+
+def test_cancel_removes_only_the_decayed_weight(client, db, make_user):
+    author = make_user()
+    readers = [make_user() for _ in range(4)]
+    post = models.BoardPost(user_id=author.id, title="글", content="내용")
+    db.add(post)
+    db.commit()
+
+    for reader in readers:
+        client.post(f"/community/{post.post_id}/react", json={"emoji": "🔥"}, headers=auth_header(reader))
+    assert _score(db, post.post_id) == pytest.approx(4)
+
+    # 반감기 한 번 지남 -> 반응 하나의 무게는 0.5
+    decay_trending_scores(db)
+    decay_trending_scores(db, utcnow() + timedelta(hours=settings.TRENDING_HALF_LIFE_HOURS))
+    assert _score(db, post.post_id) == pytest.approx(2, rel=1e-3)
+
+    client.post(f"/community/{post.post_id}/react", json={"emoji": "🔥"}, headers=auth_header(readers[0]))
+    assert _score(db, post.post_id) == pytest.approx(1.5, rel=1e-3)
+
+
+def test_trending_score_is_double_precision_on_mysql():
+    ddl = str(CreateTable(models.BoardPost.__table__).compile(dialect=mysql.dialect()))
+    assert "trending_score FLOAT(53)" in ddl
@@ -0,0 +1,164 @@
+import io
+import os
+import time
+
+from fastapi import UploadFile
+from PIL import Image
+
+from app.core.config import settings
+from app.services import images, uploads
+from tests.conftest import auth_header
+
+
+def _jpeg_with_gps() -> bytes:
+    image = Image.new("RGB", (64, 32), "red")
+    exif = Image.Exif()
+    exif[0x010F] = "TestCam"  # Make
+    exif.get_ifd(0x8825)[2] = (37.0, 33.0, 0.0)  # GPSLatitude
+    buffer = io.BytesIO()
+    image.save(buffer, format="JPEG", exif=exif)
+    return buffer.getvalue()
+
+
+def test_uploaded_original_has_no_exif(client, make_user):
+    user = make_user()
+    raw = _jpeg_with_gps()
+    with Image.open(io.BytesIO(raw)) as check:
+        assert check.getexif()
+
+    response = client.post(
+        "/community/",
+        data={"title": "사진", "content": "내용"},
+        files={"image": ("photo.jpg", raw, "image/jpeg")},
+        headers=auth_header(user),
+    )
+    assert response.status_code == 200
+
+    image_url = response.json()["image_url"]
+    path = os.path.join(settings.UPLOAD_DIR, image_url.replace("/static/", ""))
+    with Image.open(path) as stored:
+        assert stored.format == "JPEG"
+        assert stored.size == (64, 32)
+        assert not stored.getexif()
+
+
+def test_same_photo_is_stored_once(client, make_user):
+    user = make_user()
+    raw = _jpeg_with_gps()
+    urls = [
+        client.post(
+            "/community/",
+            data={"title": "사진", "content": "내용"},
+            files={"image": ("photo.jpg", raw, "image/jpeg")},
+            headers=auth_header(user),
+        ).json()["image_url"]
+        for _ in range(2)
+    ]
+    assert urls[0] == urls[1]
+
+
+def test_broken_image_is_rejected(client, make_user):
+    user = make_user()
+    response = client.post(
+        "/community/",
+        data={"title": "사진", "content": "내용"},
+        files={"image": ("photo.jpg", b"\xff\xd8\xff" + b"\x00" * 100, "image/jpeg")},
+        headers=auth_header(user),
+    )
+    assert response.status_code == 400
+
+
+def _post_photo(client, user, raw):
+    return client.post(
+        "/community/",
+        data={"title": "사진", "content": "내용"},
+        files={"image": ("photo.jpg", raw, "image/jpeg")},
+        headers=auth_header(user),
+    ).json()
+
+
+def _age(path, seconds):
+    past = time.time() - seconds
+    os.utime(path, (past, past))
+
+
+def test_reused_photo_is_not_released_before_commit(client, db, make_user):
+    # A 글이 지워지는 사이 B 가 같은 사진을 다시 올리면(재사용), B 의 글이 커밋되기 전이라도 파일은 남아야 함
+    user = make_user()
+    raw = _jpeg_with_gps()
+    post = _post_photo(client, user, raw)
+    path = os.path.join(settings.UPLOAD_DIR, post["image_url"].replace("/static/", ""))
+    _age(path, settings.UPLOAD_ORPHAN_GRACE * 2)
+
+    filename = uploads.save_image(UploadFile(io.BytesIO(raw), filename="photo.jpg"))
+    assert f"/static/{filename}" == post["image_url"]
+
+    assert client.delete(f"/community/{post['post_id']}", headers=auth_header(user)).status_code == 200
+    assert os.path.exists(path)
+
+
+def test_old_unused_photo_is_released(client, make_user):
+    user = make_user()
+    post = _post_photo(client, user, _jpeg_with_gps())
+    path = os.path.join(settings.UPLOAD_DIR, post["image_url"].replace("/static/", ""))
+    _age(path, settings.UPLOAD_ORPHAN_GRACE * 2)
+
+    assert client.delete(f"/community/{post['post_id']}", headers=auth_header(user)).status_code == 200
+    assert not os.path.exists(path)
+
+
+def test_sweep_removes_only_old_orphans(client, db, make_user):
+    user = make_user()
+    used = _post_photo(client, user, _jpeg_with_gps())
+    used_path = os.path.join(settings.UPLOAD_DIR, used["image_url"].replace("/static/", ""))
+
+    def upload_path(name):
+        return os.path.join(settings.UPLOAD_DIR, name)
+
+    old_orphan = upload_path("a" * 64 + ".jpeg")
+    new_orphan = upload_path("b" * 64 + ".png")
+    stale_part = upload_path(uploads.TMP_PREFIX + "x.part")
+    # 업로드 코드가 만든 파일이 아닌 것들 (도감 그림, 예전 방식으로 저장된 게시글 사진)은 오래돼도 남아야 함
+    catalog_image = upload_path("고얌이.png")
+    legacy_upload = upload_path("20260115_204929_019421ad-dc76-4239-a03a-74e50458008d.jpeg")
+    created = (old_orphan, new_orphan, stale_part, catalog_image, legacy_upload)
+    for path in created:
+        with open(path, "wb") as f:
+            f.write(b"x")
+    for path in (used_path, old_orphan, stale_part, catalog_image, legacy_upload):
+        _age(path, settings.UPLOAD_ORPHAN_GRACE * 2)
+
+    try:
+        assert uploads.sweep_orphan_images(db) == 2
+        assert os.path.exists(used_path)
+        assert os.path.exists(new_orphan)
+        assert os.path.exists(catalog_image)
+        assert os.path.exists(legacy_upload)
+        assert not os.path.exists(old_orphan)
+        assert not os.path.exists(stale_part)
+    finally:
+        for path in created:
+            if os.path.exists(path):
+                os.remove(path)
+
+
+def test_variant_readiness_is_not_checked_on_every_render(client, make_user, monkeypatch):
+    user = make_user()
+    post = _post_photo(client, user, _jpeg_with_gps())
+    filename = post["image_url"].replace("/static/", "")
+    images.process_image(filename)
+
+    checks = []
+    exists = os.path.exists
+    monkeypatch.setattr(images.os.path, "exists", lambda path: checks.append(path) or exists(path))
+
+    for _ in range(3):
+        feed = client.get("/community/feed", headers=auth_header(user)).json()
+        assert set(feed["items"][0]["image_variants"]) == {"thumb", "feed", "full"}
+    assert checks == []
+
+    # 변환 기록이 없는 사진은 한 번만 확인
+    images._variants_ready.clear()
+    for _ in range(3):
+        images.variant_urls(post["image_url"])
+    assert len(checks) == 1
@@ -0,0 +1,57 @@
+from app import models
+from tests.conftest import auth_header, count_statements
+
+
+def test_withdraw_deletes_posts_with_reactions(client, db, make_user):
+    author, reader, other = make_user(), make_user(), make_user()
+    post = models.BoardPost(user_id=author.id, title="글", content="내용")
+    db.add(post)
+    db.commit()
+    post_id = post.post_id
+
+    # 반응 후 취소해도 카운터 행(count=0)은 남아 있음
+    client.post(f"/community/{post_id}/react", json={"emoji": "🔥"}, headers=auth_header(reader))
+    client.post(f"/community/{post_id}/react", json={"emoji": "🔥"}, headers=auth_header(reader))
+    client.post(f"/community/{post_id}/react", json={"emoji": "👍"}, headers=auth_header(other))
+
+    response = client.delete("/users/me", headers=auth_header(author))
+    assert response.status_code == 200
+
+    db.expire_all()
+    assert db.query(models.BoardPost).filter(models.BoardPost.post_id == post_id).count() == 0
+    assert db.query(models.Reaction).filter(models.Reaction.post_id == post_id).count() == 0
+    assert db.query(models.PostReactionCount).filter(models.PostReactionCount.post_id == post_id).count() == 0
+
+
+def _own(db, user, count, active):
+    mascots = db.query(models.Mascot).order_by(models.Mascot.mascot_id).limit(count).all()
+    accessories = db.query(models.Accessory).order_by(models.Accessory.accessory_id).limit(count).all()
+    db.add_all(
+        models.UserMascot(user_id=user.id, mascot_id=m.mascot_id, is_active=i == 0) for i, m in enumerate(mascots)
+    )
+    db.add_all(
+        models.UserAccessory(user_id=user.id, accessory_id=a.accessory_id, is_active=i < active)
+        for i, a in enumerate(accessories)
+    )
+    db.commit()
+    return mascots, accessories
+
+
+def test_wardrobe_returns_owned_and_equipped_items_in_fixed_queries(client, db, make_user):
+    few_user, many_user = make_user(nickname="하나"), make_user(nickname="여럿")
+    _own(db, few_user, 1, active=1)
+    mascots, accessories = _own(db, many_user, 4, active=2)
+    client.get("/users/me/wardrobe", headers=auth_header(few_user))  # 도감 캐시 채우기
+
+    few, _ = count_statements(client, "/users/me/wardrobe", auth_header(few_user))
+    many, wardrobe = count_statements(client, "/users/me/wardrobe", auth_header(many_user))
+
+    # 유저 1번 + 보유 마스코트 1번 + 보유 액세서리 1번 (장착 목록은 보유 목록에서 계산)
+    assert few == many == 3
+    assert wardrobe["profile"]["nickname"] == "여럿"
+    assert [m["mascot_id"] for m in wardrobe["mascots"]] == [m.mascot_id for m in mascots]
+    assert wardrobe["mascots"][0]["mascot"]["name"] == mascots[0].name
+    assert wardrobe["equipped_mascot"]["mascot_id"] == mascots[0].mascot_id
+    assert [a["accessory_id"] for a in wardrobe["accessories"]] == [a.accessory_id for a in accessories]
+    assert [a["accessory_id"] for a in wardrobe["equipped_accessories"]] == [a.accessory_id for a in accessories[:2]]
+    assert wardrobe["equipped_accessories"][0]["accessory"]["type"] == accessories[0].type